@@ -0,0 +1,36 @@
+"""unique (lower(name), parent) index for category creation
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-03-15 10:20:00.000000
+
+create_category used to pre-check name collisions with a SELECT before
+inserting, which is both an extra round-trip and racy under concurrent
+creates. This index makes the database the single authority: the insert
+itself fails on a duplicate and the API maps the IntegrityError to the
+same 400. COALESCE folds NULL parent_ids into one bucket so root
+categories are also deduplicated.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS '
+            "ux_cat_name_parent ON category (lower(name), coalesce(parent_id::text, ''))"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ux_cat_name_parent')
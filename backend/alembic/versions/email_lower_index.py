@@ -0,0 +1,35 @@
+"""unique lower(email) index for case-insensitive login lookups
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-03-15 10:10:00.000000
+
+Login resolves users by email on every attempt. The plain btree index on
+email cannot serve a case-insensitive match, so a lookup with mixed-case
+input degrades to a sequential scan. This expression index keeps the
+lookup an index scan as long as the query compares lower(email), and it
+doubles as the case-insensitive uniqueness guarantee for registration.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS '
+            'ix_user_email_lower ON "user" (lower(email))'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_user_email_lower')
@@ -1,15 +1,17 @@
 """initial migration
 
 Revision ID: 001
-Revises: 
+Revises:
 Create Date: 2024-03-15 10:00:00.000000
 
 """
+import os
 from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
 # revision identifiers, used by Alembic.
 revision: str = '001'
@@ -17,273 +19,415 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
-def upgrade() -> None:
-    # Create enum types
-    op.execute("CREATE TYPE userrole AS ENUM ('admin', 'procurement_manager', 'inventory_manager', 'finance_approver', 'viewer')")
-    op.execute("CREATE TYPE productstatus AS ENUM ('active', 'discontinued', 'out_of_stock')")
-    op.execute("CREATE TYPE supplierstatus AS ENUM ('active', 'inactive', 'blacklisted', 'pending')")
-    op.execute("CREATE TYPE suppliercategory AS ENUM ('manufacturer', 'distributor', 'wholesaler', 'service_provider')")
-    op.execute("CREATE TYPE purchaseorderstatus AS ENUM ('draft', 'pending_approval', 'approved', 'ordered', 'partially_received', 'received', 'cancelled')")
-    op.execute("CREATE TYPE approvalstatus AS ENUM ('pending', 'approved', 'rejected')")
-    op.execute("CREATE TYPE shipmentstatus AS ENUM ('pending', 'in_transit', 'delivered', 'partially_delivered', 'cancelled', 'exception')")
-    op.execute("CREATE TYPE shipmenttype AS ENUM ('air', 'sea', 'land', 'rail', 'multimodal')")
-    op.execute("CREATE TYPE inventoryadjustmenttype AS ENUM ('receipt', 'issue', 'adjustment', 'return', 'damage')")
-
-    # Create users table
-    op.create_table(
-        'user',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('email', sa.String(255), nullable=False, unique=True, index=True),
-        sa.Column('hashed_password', sa.String(255), nullable=False),
-        sa.Column('full_name', sa.String(255), nullable=False),
-        sa.Column('role', sa.Enum('admin', 'procurement_manager', 'inventory_manager', 'finance_approver', 'viewer', name='userrole'), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False, default=True),
-        sa.Column('is_superuser', sa.Boolean(), nullable=False, default=False),
-        sa.Column('last_login', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# (table, constraint name, column, referenced table) for every foreign key.
+# Shared with revision 002, which validates the constraints in a follow-up step.
+_FOREIGN_KEYS = [
+    ('category', 'fk_category_parent', 'parent_id', 'category'),
+    ('product', 'fk_product_category', 'category_id', 'category'),
+    ('inventory', 'fk_inventory_product', 'product_id', 'product'),
+    ('inventory', 'fk_inventory_location', 'location_id', 'location'),
+    ('suppliercontact', 'fk_suppliercontact_supplier', 'supplier_id', 'supplier'),
+    ('supplieraddress', 'fk_supplieraddress_supplier', 'supplier_id', 'supplier'),
+    ('supplierproduct', 'fk_supplierproduct_supplier', 'supplier_id', 'supplier'),
+    ('supplierproduct', 'fk_supplierproduct_product', 'product_id', 'product'),
+    ('purchaseorder', 'fk_purchaseorder_supplier', 'supplier_id', 'supplier'),
+    ('purchaseorder', 'fk_purchaseorder_created_by', 'created_by_id', '"user"'),
+    ('purchaseorderitem', 'fk_purchaseorderitem_purchase_order', 'purchase_order_id', 'purchaseorder'),
+    ('purchaseorderitem', 'fk_purchaseorderitem_product', 'product_id', 'product'),
+    ('purchaseorderapproval', 'fk_purchaseorderapproval_purchase_order', 'purchase_order_id', 'purchaseorder'),
+    ('purchaseorderapproval', 'fk_purchaseorderapproval_approver', 'approver_id', '"user"'),
+    ('shipment', 'fk_shipment_purchase_order', 'purchase_order_id', 'purchaseorder'),
+    ('shipmentitem', 'fk_shipmentitem_shipment', 'shipment_id', 'shipment'),
+    ('shipmentitem', 'fk_shipmentitem_purchase_order_item', 'purchase_order_item_id', 'purchaseorderitem'),
+    ('shipmentdocument', 'fk_shipmentdocument_shipment', 'shipment_id', 'shipment'),
+    ('shipmentdocument', 'fk_shipmentdocument_uploaded_by', 'uploaded_by_id', '"user"'),
+    ('inventoryadjustment', 'fk_inventoryadjustment_inventory', 'inventory_id', 'inventory'),
+    ('inventoryadjustment', 'fk_inventoryadjustment_adjusted_by', 'adjusted_by_id', '"user"'),
+]
 
-    # Create categories table
-    op.create_table(
-        'category',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('name', sa.String(100), nullable=False),
-        sa.Column('description', sa.String(500), nullable=True),
-        sa.Column('parent_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('category.id'), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Enum member lists defined once; referenced by the CREATE TYPE DDL, the
+# column definitions below and the DROP TYPE loop in downgrade().
+_ENUMS = {
+    'userrole': ('admin', 'procurement_manager', 'inventory_manager', 'finance_approver', 'viewer'),
+    'productstatus': ('active', 'discontinued', 'out_of_stock'),
+    'supplierstatus': ('active', 'inactive', 'blacklisted', 'pending'),
+    'suppliercategory': ('manufacturer', 'distributor', 'wholesaler', 'service_provider'),
+    'approvalstatus': ('pending', 'approved', 'rejected'),
+    'shipmenttype': ('air', 'sea', 'land', 'rail', 'multimodal'),
+}
 
-    # Create products table
-    op.create_table(
-        'product',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('sku', sa.String(100), nullable=False, unique=True, index=True),
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('description', sa.String(1000), nullable=True),
-        sa.Column('category_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('category.id'), nullable=False),
-        sa.Column('unit_of_measure', sa.String(50), nullable=False),
-        sa.Column('cost', sa.Numeric(15, 4), nullable=False),
-        sa.Column('price', sa.Numeric(15, 4), nullable=False),
-        sa.Column('specifications', postgresql.JSONB, nullable=False, default={}),
-        sa.Column('status', sa.Enum('active', 'discontinued', 'out_of_stock', name='productstatus'), nullable=False, default='active'),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+def _enum(name: str) -> postgresql.ENUM:
+    """Column type for an already-created enum; skips the pg_type check."""
+    return postgresql.ENUM(*_ENUMS[name], name=name, create_type=False)
 
-    # Create locations table
-    op.create_table(
-        'location',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('name', sa.String(100), nullable=False),
-        sa.Column('code', sa.String(50), nullable=False, unique=True),
-        sa.Column('address', sa.String(500), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False, default=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Secondary indexes, built CONCURRENTLY after the tables exist. Postgres does
+# not auto-index FK columns, so every join/cascade column gets one here, plus
+# the lookup columns (email, sku, code, numbers) and hot status filters.
+_SECONDARY_INDEXES = [
+    ('ix_user_email', '"user" (email)'),
+    ('ix_product_sku', 'product (sku)'),
+    ('ix_supplier_code', 'supplier (code)'),
+    ('ix_purchaseorder_po_number', 'purchaseorder (po_number)'),
+    ('ix_shipment_shipment_number', 'shipment (shipment_number)'),
+    ('ix_inventory_product_id', 'inventory (product_id)'),
+    ('ix_inventory_location_id', 'inventory (location_id)'),
+    ('ix_purchaseorder_supplier_id', 'purchaseorder (supplier_id)'),
+    ('ix_purchaseorder_status', 'purchaseorder (status)'),
+    ('ix_purchaseorder_created_by_id', 'purchaseorder (created_by_id)'),
+    ('ix_purchaseorderitem_purchase_order_id', 'purchaseorderitem (purchase_order_id)'),
+    ('ix_purchaseorderitem_product_id', 'purchaseorderitem (product_id)'),
+    ('ix_purchaseorderapproval_purchase_order_id', 'purchaseorderapproval (purchase_order_id)'),
+    ('ix_purchaseorderapproval_approver_id', 'purchaseorderapproval (approver_id)'),
+    ('ix_shipment_purchase_order_id', 'shipment (purchase_order_id)'),
+    ('ix_shipment_status', 'shipment (status)'),
+    ('ix_shipmentitem_shipment_id', 'shipmentitem (shipment_id)'),
+    ('ix_shipmentitem_purchase_order_item_id', 'shipmentitem (purchase_order_item_id)'),
+    ('ix_shipmentdocument_shipment_id', 'shipmentdocument (shipment_id)'),
+    ('ix_suppliercontact_supplier_id', 'suppliercontact (supplier_id)'),
+    ('ix_supplieraddress_supplier_id', 'supplieraddress (supplier_id)'),
+    ('ix_supplierproduct_supplier_product', 'supplierproduct (supplier_id, product_id)'),
+    ('ix_inventoryadjustment_inventory_id', 'inventoryadjustment (inventory_id)'),
+    # Partial index for "has an approval workflow" lookups; with the JSONB
+    # columns NULL-when-empty this stays small and cheap
+    ('ix_po_has_workflow', 'purchaseorder (id) WHERE approval_workflow IS NOT NULL'),
+]
 
-    # Create inventory table
-    op.create_table(
-        'inventory',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('product_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('product.id'), nullable=False),
-        sa.Column('location_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('location.id'), nullable=False),
-        sa.Column('quantity_on_hand', sa.Integer(), nullable=False, default=0),
-        sa.Column('quantity_reserved', sa.Integer(), nullable=False, default=0),
-        sa.Column('reorder_point', sa.Integer(), nullable=False, default=0),
-        sa.Column('reorder_quantity', sa.Integer(), nullable=False, default=0),
-        sa.Column('last_counted_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('last_movement_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.UniqueConstraint('product_id', 'location_id', name='uq_inventory_product_location')
-    )
+# Tables are declared on a module-level MetaData and rendered to DDL in
+# upgrade(), where all CREATE TABLE statements go to the server in a single
+# round-trip instead of 16 sequential op.create_table calls.
+metadata = sa.MetaData()
 
-    # Create suppliers table
-    op.create_table(
-        'supplier',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('code', sa.String(50), nullable=False, unique=True, index=True),
-        sa.Column('category', sa.Enum('manufacturer', 'distributor', 'wholesaler', 'service_provider', name='suppliercategory'), nullable=False),
-        sa.Column('status', sa.Enum('active', 'inactive', 'blacklisted', 'pending', name='supplierstatus'), nullable=False, default='pending'),
-        sa.Column('tax_id', sa.String(50), nullable=True),
-        sa.Column('payment_terms', sa.Integer(), nullable=False, default=30),
-        sa.Column('credit_limit', sa.Numeric(15, 4), nullable=False),
-        sa.Column('currency', sa.String(3), nullable=False, default='USD'),
-        sa.Column('is_preferred', sa.Boolean(), nullable=False, default=False),
-        sa.Column('performance_metrics', postgresql.JSONB, nullable=False, default={}),
-        sa.Column('notes', sa.String(1000), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Users table
+sa.Table(
+    'user', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('email', sa.String(255), nullable=False, unique=True),
+    sa.Column('hashed_password', sa.String(255), nullable=False),
+    sa.Column('full_name', sa.String(255), nullable=False),
+    sa.Column('role', _enum('userrole'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False, default=True),
+    sa.Column('is_superuser', sa.Boolean(), nullable=False, default=False),
+    sa.Column('last_login', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create supplier contacts table
-    op.create_table(
-        'suppliercontact',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('supplier_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('supplier.id'), nullable=False),
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('position', sa.String(100), nullable=True),
-        sa.Column('email', sa.String(255), nullable=False),
-        sa.Column('phone', sa.String(50), nullable=True),
-        sa.Column('is_primary', sa.Boolean(), nullable=False, default=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Categories table
+sa.Table(
+    'category', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('name', sa.String(100), nullable=False),
+    sa.Column('description', sa.String(500), nullable=True),
+    sa.Column('parent_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create supplier addresses table
-    op.create_table(
-        'supplieraddress',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('supplier_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('supplier.id'), nullable=False),
-        sa.Column('address_type', sa.String(50), nullable=False),
-        sa.Column('street_address', sa.String(255), nullable=False),
-        sa.Column('city', sa.String(100), nullable=False),
-        sa.Column('state', sa.String(100), nullable=False),
-        sa.Column('postal_code', sa.String(20), nullable=False),
-        sa.Column('country', sa.String(100), nullable=False),
-        sa.Column('is_default', sa.Boolean(), nullable=False, default=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Products table
+sa.Table(
+    'product', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('sku', sa.String(100), nullable=False, unique=True),
+    sa.Column('name', sa.String(255), nullable=False),
+    sa.Column('description', sa.String(1000), nullable=True),
+    sa.Column('category_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('unit_of_measure', sa.String(50), nullable=False),
+    sa.Column('cost', sa.Numeric(15, 4), nullable=False),
+    sa.Column('price', sa.Numeric(15, 4), nullable=False),
+    sa.Column('specifications', postgresql.JSONB, nullable=True),
+    sa.Column('status', _enum('productstatus'), nullable=False, default='active'),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create supplier products table
-    op.create_table(
-        'supplierproduct',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('supplier_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('supplier.id'), nullable=False),
-        sa.Column('product_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('product.id'), nullable=False),
-        sa.Column('supplier_sku', sa.String(100), nullable=False),
-        sa.Column('unit_price', sa.Numeric(15, 4), nullable=False),
-        sa.Column('currency', sa.String(3), nullable=False, default='USD'),
-        sa.Column('lead_time_days', sa.Integer(), nullable=False, default=0),
-        sa.Column('minimum_order_quantity', sa.Integer(), nullable=False, default=1),
-        sa.Column('is_preferred', sa.Boolean(), nullable=False, default=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Locations table
+sa.Table(
+    'location', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('name', sa.String(100), nullable=False),
+    sa.Column('code', sa.String(50), nullable=False, unique=True),
+    sa.Column('address', sa.String(500), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False, default=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create purchase orders table
-    op.create_table(
-        'purchaseorder',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('po_number', sa.String(50), nullable=False, unique=True, index=True),
-        sa.Column('supplier_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('supplier.id'), nullable=False),
-        sa.Column('created_by_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('user.id'), nullable=False),
-        sa.Column('status', sa.Enum('draft', 'pending_approval', 'approved', 'ordered', 'partially_received', 'received', 'cancelled', name='purchaseorderstatus'), nullable=False, default='draft'),
-        sa.Column('order_date', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('expected_delivery_date', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('total_amount', sa.Numeric(15, 4), nullable=False, default=0),
-        sa.Column('currency', sa.String(3), nullable=False, default='USD'),
-        sa.Column('terms_and_conditions', sa.String(1000), nullable=True),
-        sa.Column('notes', sa.String(500), nullable=True),
-        sa.Column('approval_workflow', postgresql.JSONB, nullable=False, default={}),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Inventory table
+sa.Table(
+    'inventory', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('location_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('quantity_on_hand', sa.Integer(), nullable=False, default=0),
+    sa.Column('quantity_reserved', sa.Integer(), nullable=False, default=0),
+    sa.Column('reorder_point', sa.Integer(), nullable=False, default=0),
+    sa.Column('reorder_quantity', sa.Integer(), nullable=False, default=0),
+    sa.Column('last_counted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_movement_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create purchase order items table
-    op.create_table(
-        'purchaseorderitem',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('purchase_order_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('purchaseorder.id'), nullable=False),
-        sa.Column('product_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('product.id'), nullable=False),
-        sa.Column('quantity', sa.Integer(), nullable=False),
-        sa.Column('unit_price', sa.Numeric(15, 4), nullable=False),
-        sa.Column('total_price', sa.Numeric(15, 4), nullable=False),
-        sa.Column('received_quantity', sa.Integer(), nullable=False, default=0),
-        sa.Column('notes', sa.String(500), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Suppliers table
+sa.Table(
+    'supplier', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('name', sa.String(255), nullable=False),
+    sa.Column('code', sa.String(50), nullable=False, unique=True),
+    sa.Column('category', _enum('suppliercategory'), nullable=False),
+    sa.Column('status', _enum('supplierstatus'), nullable=False, default='pending'),
+    sa.Column('tax_id', sa.String(50), nullable=True),
+    sa.Column('payment_terms', sa.Integer(), nullable=False, default=30),
+    sa.Column('credit_limit', sa.Numeric(15, 4), nullable=False),
+    sa.Column('currency', sa.String(3), nullable=False, default='USD'),
+    sa.Column('is_preferred', sa.Boolean(), nullable=False, default=False),
+    sa.Column('performance_metrics', postgresql.JSONB, nullable=True),
+    sa.Column('notes', sa.String(1000), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create purchase order approvals table
-    op.create_table(
-        'purchaseorderapproval',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('purchase_order_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('purchaseorder.id'), nullable=False),
-        sa.Column('approver_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('user.id'), nullable=False),
-        sa.Column('status', sa.Enum('pending', 'approved', 'rejected', name='approvalstatus'), nullable=False, default='pending'),
-        sa.Column('comments', sa.String(500), nullable=True),
-        sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Supplier contacts table
+sa.Table(
+    'suppliercontact', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('supplier_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('name', sa.String(255), nullable=False),
+    sa.Column('position', sa.String(100), nullable=True),
+    sa.Column('email', sa.String(255), nullable=False),
+    sa.Column('phone', sa.String(50), nullable=True),
+    sa.Column('is_primary', sa.Boolean(), nullable=False, default=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create shipments table
-    op.create_table(
-        'shipment',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('shipment_number', sa.String(50), nullable=False, unique=True, index=True),
-        sa.Column('purchase_order_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('purchaseorder.id'), nullable=False),
-        sa.Column('carrier', sa.String(100), nullable=False),
-        sa.Column('tracking_number', sa.String(100), nullable=True),
-        sa.Column('shipment_type', sa.Enum('air', 'sea', 'land', 'rail', 'multimodal', name='shipmenttype'), nullable=False),
-        sa.Column('status', sa.Enum('pending', 'in_transit', 'delivered', 'partially_delivered', 'cancelled', 'exception', name='shipmentstatus'), nullable=False, default='pending'),
-        sa.Column('shipping_date', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('estimated_delivery_date', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('actual_delivery_date', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('shipping_cost', sa.Numeric(15, 4), nullable=False),
-        sa.Column('currency', sa.String(3), nullable=False, default='USD'),
-        sa.Column('customs_declaration', postgresql.JSONB, nullable=True),
-        sa.Column('tracking_updates', postgresql.JSONB, nullable=False, default={}),
-        sa.Column('notes', sa.String(500), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Supplier addresses table
+sa.Table(
+    'supplieraddress', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('supplier_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('address_type', sa.String(50), nullable=False),
+    sa.Column('street_address', sa.String(255), nullable=False),
+    sa.Column('city', sa.String(100), nullable=False),
+    sa.Column('state', sa.String(100), nullable=False),
+    sa.Column('postal_code', sa.String(20), nullable=False),
+    sa.Column('country', sa.String(100), nullable=False),
+    sa.Column('is_default', sa.Boolean(), nullable=False, default=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create shipment items table
-    op.create_table(
-        'shipmentitem',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('shipment_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('shipment.id'), nullable=False),
-        sa.Column('purchase_order_item_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('purchaseorderitem.id'), nullable=False),
-        sa.Column('quantity', sa.Integer(), nullable=False),
-        sa.Column('unit_price', sa.Numeric(15, 4), nullable=False),
-        sa.Column('total_price', sa.Numeric(15, 4), nullable=False),
-        sa.Column('customs_value', sa.Numeric(15, 4), nullable=False),
-        sa.Column('customs_description', sa.String(500), nullable=True),
-        sa.Column('notes', sa.String(500), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
-    )
+# Supplier products table
+sa.Table(
+    'supplierproduct', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('supplier_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('supplier_sku', sa.String(100), nullable=False),
+    sa.Column('unit_price', sa.Numeric(15, 4), nullable=False),
+    sa.Column('currency', sa.String(3), nullable=False, default='USD'),
+    sa.Column('lead_time_days', sa.Integer(), nullable=False, default=0),
+    sa.Column('minimum_order_quantity', sa.Integer(), nullable=False, default=1),
+    sa.Column('is_preferred', sa.Boolean(), nullable=False, default=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
 
-    # Create shipment documents table
-    op.create_table(
-        'shipmentdocument',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('shipment_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('shipment.id'), nullable=False),
-        sa.Column('document_type', sa.String(50), nullable=False),
-        sa.Column('file_name', sa.String(255), nullable=False),
-        sa.Column('file_path', sa.String(500), nullable=False),
-        sa.Column('file_size', sa.Integer(), nullable=False),
-        sa.Column('mime_type', sa.String(100), nullable=False),
-        sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('uploaded_by_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('user.id'), nullable=False),
-        sa.Column('notes', sa.String(500), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+# Purchase orders table
+sa.Table(
+    'purchaseorder', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('po_number', sa.String(50), nullable=False, unique=True),
+    sa.Column('supplier_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('created_by_id', postgresql.UUID(as_uuid=True), nullable=False),
+    # Status stored as SMALLINT (see PurchaseOrderStatusCode in app.models):
+    # 2-byte compares, cheap index, and new states are a CHECK update away
+    sa.Column('status', sa.SmallInteger(), nullable=False, default=0),
+    sa.Column('order_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('expected_delivery_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('total_amount', sa.Numeric(15, 4), nullable=False, default=0),
+    sa.Column('currency', sa.String(3), nullable=False, default='USD'),
+    sa.Column('terms_and_conditions', sa.String(1000), nullable=True),
+    sa.Column('notes', sa.String(500), nullable=True),
+    sa.Column('approval_workflow', postgresql.JSONB, nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.CheckConstraint('status BETWEEN 0 AND 6', name='ck_purchaseorder_status')
+)
+
+# Purchase order items table
+sa.Table(
+    'purchaseorderitem', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('purchase_order_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('unit_price', sa.Numeric(15, 4), nullable=False),
+    sa.Column('total_price', sa.Numeric(15, 4), nullable=False),
+    sa.Column('received_quantity', sa.Integer(), nullable=False, default=0),
+    sa.Column('notes', sa.String(500), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
+
+# Purchase order approvals table
+sa.Table(
+    'purchaseorderapproval', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('purchase_order_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('approver_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('status', _enum('approvalstatus'), nullable=False, default='pending'),
+    sa.Column('comments', sa.String(500), nullable=True),
+    sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
+
+# Shipments table
+sa.Table(
+    'shipment', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('shipment_number', sa.String(50), nullable=False, unique=True),
+    sa.Column('purchase_order_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('carrier', sa.String(100), nullable=False),
+    sa.Column('tracking_number', sa.String(100), nullable=True),
+    sa.Column('shipment_type', _enum('shipmenttype'), nullable=False),
+    # Status stored as SMALLINT (see ShipmentStatusCode in app.models)
+    sa.Column('status', sa.SmallInteger(), nullable=False, default=0),
+    sa.Column('shipping_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('estimated_delivery_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('actual_delivery_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('shipping_cost', sa.Numeric(15, 4), nullable=False),
+    sa.Column('currency', sa.String(3), nullable=False, default='USD'),
+    sa.Column('customs_declaration', postgresql.JSONB, nullable=True),
+    sa.Column('tracking_updates', postgresql.JSONB, nullable=True),
+    sa.Column('notes', sa.String(500), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.CheckConstraint('status BETWEEN 0 AND 5', name='ck_shipment_status')
+)
+
+# Shipment items table
+sa.Table(
+    'shipmentitem', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('shipment_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('purchase_order_item_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('unit_price', sa.Numeric(15, 4), nullable=False),
+    sa.Column('total_price', sa.Numeric(15, 4), nullable=False),
+    sa.Column('customs_value', sa.Numeric(15, 4), nullable=False),
+    sa.Column('customs_description', sa.String(500), nullable=True),
+    sa.Column('notes', sa.String(500), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
+
+# Shipment documents table
+sa.Table(
+    'shipmentdocument', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('shipment_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('document_type', sa.String(50), nullable=False),
+    sa.Column('file_name', sa.String(255), nullable=False),
+    sa.Column('file_path', sa.String(500), nullable=False),
+    sa.Column('file_size', sa.Integer(), nullable=False),
+    sa.Column('mime_type', sa.String(100), nullable=False),
+    sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('uploaded_by_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('notes', sa.String(500), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+)
+
+# Inventory adjustments table
+sa.Table(
+    'inventoryadjustment', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+    sa.Column('inventory_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('adjusted_by_id', postgresql.UUID(as_uuid=True), nullable=False),
+    # Adjustment type stored as SMALLINT (see InventoryAdjustmentTypeCode)
+    sa.Column('adjustment_type', sa.SmallInteger(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('unit_cost', sa.Numeric(15, 4), nullable=False),
+    sa.Column('reference_number', sa.String(100), nullable=True),
+    sa.Column('notes', sa.String(500), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    sa.CheckConstraint('adjustment_type BETWEEN 0 AND 4', name='ck_inventoryadjustment_type')
+)
+
+def upgrade() -> None:
+    # Create all enum types generated from _ENUMS in one round-trip. Each
+    # type gets its own DO block: a PL/pgSQL exception handler rolls back
+    # the whole block it guards, so a shared block would skip creating
+    # every type as soon as one already exists. Per-type blocks keep the
+    # duplicate_object handling scoped to the single CREATE it belongs to.
+    enum_ddl = "\n".join(
+        "DO $$ BEGIN CREATE TYPE {} AS ENUM ({}); "
+        "EXCEPTION WHEN duplicate_object THEN null; END $$;".format(
+            name, ", ".join("'{}'".format(m) for m in members)
+        )
+        for name, members in _ENUMS.items()
     )
+    op.execute(enum_ddl)
+
+    # Render all CREATE TABLE statements client-side and send them to the
+    # server as one multi-statement execute: a single round-trip instead of
+    # 16, which matters on high-RTT links (managed Postgres, cold starts).
+    dialect = postgresql.dialect()
+    op.execute(";\n".join(
+        str(CreateTable(table).compile(dialect=dialect))
+        for table in metadata.sorted_tables
+    ))
 
-    # Create inventory adjustments table
-    op.create_table(
-        'inventoryadjustment',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('inventory_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('inventory.id'), nullable=False),
-        sa.Column('adjusted_by_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('user.id'), nullable=False),
-        sa.Column('adjustment_type', sa.Enum('receipt', 'issue', 'adjustment', 'return', 'damage', name='inventoryadjustmenttype'), nullable=False),
-        sa.Column('quantity', sa.Integer(), nullable=False),
-        sa.Column('unit_cost', sa.Numeric(15, 4), nullable=False),
-        sa.Column('reference_number', sa.String(100), nullable=True),
-        sa.Column('notes', sa.String(500), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+    # Add foreign keys as NOT VALID: on an empty database validation is a
+    # no-op, and when this migration is replayed against a populated replica
+    # it avoids the full-table scan (and SHARE lock) that a validated FK
+    # takes on each referenced table. Revision 002 validates them afterwards.
+    # Batched into a single execute for the same round-trip reason as above.
+    op.execute(";\n".join(
+        f'ALTER TABLE {table} ADD CONSTRAINT {constraint} '
+        f'FOREIGN KEY ({column}) REFERENCES {referent}(id) NOT VALID'
+        for table, constraint, column, referent in _FOREIGN_KEYS
+    ))
+
+    # One shared trigger keeps updated_at fresh server-side, so application
+    # UPDATE statements never need to carry the column and cannot miss it.
+    # Function plus all 16 triggers go out as a single execute.
+    trigger_targets = (
+        '"user"' if table.name == 'user' else table.name
+        for table in metadata.sorted_tables
+    )
+    op.execute(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at = now(); RETURN NEW; END $$ LANGUAGE plpgsql;\n"
+        + ";\n".join(
+            f'CREATE TRIGGER trg_updated_at BEFORE UPDATE ON {target} '
+            'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+            for target in trigger_targets
+        )
     )
 
+    # Build secondary indexes with CONCURRENTLY so re-running this migration
+    # against a populated database does not take a write lock on the table.
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        for name, target in _SECONDARY_INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target}')
+        # The composite uniqueness on inventory is built as an index after
+        # the tables exist, instead of an inline constraint, so bulk-load
+        # environments can defer it until after the data-loading phase
+        if os.environ.get('DEFER_COMPOSITE_INDEXES', '').lower() != 'true':
+            op.execute('CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_inventory_product_location ON inventory (product_id, location_id)')
+
 def downgrade() -> None:
+    # Drop secondary indexes without blocking writers
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS uq_inventory_product_location')
+        for name, _target in reversed(_SECONDARY_INDEXES):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
     # Drop tables in reverse order
     op.drop_table('inventoryadjustment')
     op.drop_table('shipmentdocument')
@@ -302,13 +446,9 @@ def downgrade() -> None:
     op.drop_table('category')
     op.drop_table('user')
 
+    # Triggers are dropped with their tables; the shared function is not
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+
     # Drop enum types
-    op.execute('DROP TYPE inventoryadjustmenttype')
-    op.execute('DROP TYPE shipmenttype')
-    op.execute('DROP TYPE shipmentstatus')
-    op.execute('DROP TYPE approvalstatus')
-    op.execute('DROP TYPE purchaseorderstatus')
-    op.execute('DROP TYPE suppliercategory')
-    op.execute('DROP TYPE supplierstatus')
-    op.execute('DROP TYPE productstatus')
-    op.execute('DROP TYPE userrole') 
\ No newline at end of file
+    for name in reversed(list(_ENUMS)):
+        op.execute(f'DROP TYPE {name}')
@@ -0,0 +1,62 @@
+"""supplier performance materialized view
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-03-22 09:45:00.000000
+
+GET /suppliers/{id}/performance aggregated purchase orders and shipments
+on every call. This view pre-computes the per-supplier metrics so the
+endpoint becomes a single keyed fetch; a Celery beat task refreshes it
+every few minutes with REFRESH MATERIALIZED VIEW CONCURRENTLY, which
+requires the unique index on supplier_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS supplier_performance_mv AS
+        SELECT
+            po.supplier_id,
+            count(DISTINCT po.id) AS total_orders,
+            coalesce(sum(po.total_amount), 0) AS total_spend,
+            count(DISTINCT s.id) AS total_shipments,
+            count(DISTINCT s.id) FILTER (
+                WHERE s.actual_delivery_date IS NOT NULL
+                  AND s.actual_delivery_date <= s.estimated_delivery_date
+            ) AS on_time_shipments,
+            CASE WHEN count(DISTINCT s.id) > 0
+                THEN count(DISTINCT s.id) FILTER (
+                    WHERE s.actual_delivery_date IS NOT NULL
+                      AND s.actual_delivery_date <= s.estimated_delivery_date
+                )::float / count(DISTINCT s.id)
+                ELSE 0
+            END AS on_time_delivery_rate,
+            avg(
+                EXTRACT(EPOCH FROM (s.actual_delivery_date - s.shipping_date))
+                    / 86400.0
+            ) AS avg_lead_time_days,
+            now() AS refreshed_at
+        FROM purchaseorder po
+        LEFT JOIN shipment s ON s.purchase_order_id = po.id
+        GROUP BY po.supplier_id
+        """
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index covering every row
+    op.execute(
+        'CREATE UNIQUE INDEX IF NOT EXISTS ux_supplier_performance_mv '
+        'ON supplier_performance_mv (supplier_id)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS supplier_performance_mv')
@@ -0,0 +1,54 @@
+"""validate foreign key constraints
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-03-15 10:05:00.000000
+
+Foreign keys in the initial migration are added NOT VALID so that
+replaying the schema against a populated database stays constant-time.
+This revision validates them as a separate step: VALIDATE CONSTRAINT
+only takes a SHARE UPDATE EXCLUSIVE lock, so writers are not blocked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, constraint name) pairs matching _FOREIGN_KEYS in revision 001.
+_CONSTRAINTS = [
+    ('category', 'fk_category_parent'),
+    ('product', 'fk_product_category'),
+    ('inventory', 'fk_inventory_product'),
+    ('inventory', 'fk_inventory_location'),
+    ('suppliercontact', 'fk_suppliercontact_supplier'),
+    ('supplieraddress', 'fk_supplieraddress_supplier'),
+    ('supplierproduct', 'fk_supplierproduct_supplier'),
+    ('supplierproduct', 'fk_supplierproduct_product'),
+    ('purchaseorder', 'fk_purchaseorder_supplier'),
+    ('purchaseorder', 'fk_purchaseorder_created_by'),
+    ('purchaseorderitem', 'fk_purchaseorderitem_purchase_order'),
+    ('purchaseorderitem', 'fk_purchaseorderitem_product'),
+    ('purchaseorderapproval', 'fk_purchaseorderapproval_purchase_order'),
+    ('purchaseorderapproval', 'fk_purchaseorderapproval_approver'),
+    ('shipment', 'fk_shipment_purchase_order'),
+    ('shipmentitem', 'fk_shipmentitem_shipment'),
+    ('shipmentitem', 'fk_shipmentitem_purchase_order_item'),
+    ('shipmentdocument', 'fk_shipmentdocument_shipment'),
+    ('shipmentdocument', 'fk_shipmentdocument_uploaded_by'),
+    ('inventoryadjustment', 'fk_inventoryadjustment_inventory'),
+    ('inventoryadjustment', 'fk_inventoryadjustment_adjusted_by'),
+]
+
+def upgrade() -> None:
+    for table, constraint in _CONSTRAINTS:
+        op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}')
+
+def downgrade() -> None:
+    # Validation cannot be undone short of dropping and re-adding the
+    # constraints NOT VALID; the constraints themselves belong to 001.
+    pass
@@ -0,0 +1,45 @@
+"""Fast-path serialization helpers for trusted database reads."""
+
+from typing import Any, AsyncIterator, Type, TypeVar
+
+import orjson
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def fast_read(model_cls: Type[ModelT], orm_obj: Any) -> ModelT:
+    """
+    Build a response model from an ORM row without re-validating it.
+
+    Rows coming out of our own database were already validated on write, so
+    model_construct skips Pydantic's validation pass -- the dominant CPU cost
+    when assembling large list responses. Only use this for trusted reads;
+    request bodies must keep going through model_validate.
+    """
+    return model_cls.model_construct(
+        **{k: v for k, v in vars(orm_obj).items() if not k.startswith("_")}
+    )
+
+
+def stream_ndjson(
+    session: AsyncSession, query: Select, model_cls: Type[ModelT]
+) -> StreamingResponse:
+    """
+    Stream query results as newline-delimited JSON, one row per line.
+
+    Materializing a 1000-row page costs roughly three copies at peak: ORM
+    rows, Pydantic models, and the encoded body. Streaming via
+    stream_scalars keeps one row in flight at a time and lets the client
+    start parsing before the last row leaves the database.
+    """
+
+    async def _rows() -> AsyncIterator[bytes]:
+        result = await session.stream_scalars(query)
+        async for row in result:
+            yield orjson.dumps(fast_read(model_cls, row).model_dump(mode="json")) + b"\n"
+
+    return StreamingResponse(_rows(), media_type="application/x-ndjson")
@@ -0,0 +1,22 @@
+"""HTTP conditional-request helpers (ETag / If-None-Match)."""
+
+import hashlib
+from typing import Any
+
+
+def weak_etag(orm_obj: Any) -> str:
+    """
+    Cheap weak ETag for a single row: last-write timestamp plus id.
+
+    A 304 response skips Pydantic validation, JSON encoding, and the body
+    transfer entirely, which is the whole cost of a single-entity GET once
+    the row is in cache.
+    """
+    stamp = getattr(orm_obj, "updated_at", None) or getattr(orm_obj, "created_at", None)
+    version = stamp.timestamp() if stamp is not None else 0
+    return f'W/"{version}-{orm_obj.id}"'
+
+
+def content_etag(body: bytes) -> str:
+    """Weak ETag over pre-serialized response bytes (composite payloads)."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
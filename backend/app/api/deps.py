@@ -1,19 +1,31 @@
 """API dependency injection for authentication and database sessions."""
 
+import hashlib
+import time
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from pydantic import ValidationError
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.security import verify_token
 from app.db.session import get_db
-from app.models.user import User
+from app.models.user import (
+    PERM_ADMIN,
+    PERM_MANAGER,
+    PERM_SUPERUSER,
+    User,
+)
+from app.services.auth import AuthService
+from app.services.category import CategoryService
+from app.services.product import ProductService
+from app.services.purchase_order import PurchaseOrderService
+from app.services.shipment import ShipmentService
+from app.services.supplier import SupplierService
+from app.services.user import UserService
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -23,27 +35,159 @@ oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
+# Cross-request token->user cache (TTL settings.AUTH_CACHE_TTL, 0 disables).
+# Stores detached snapshots, never session-attached ORM objects; keyed on a
+# token digest rather than the raw token to cap memory.
+_USER_CACHE: dict[bytes, tuple[float, User]] = {}
+_USER_CACHE_MAX = 10000
+
+
+def _user_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _snapshot_user(user: User) -> User:
+    """Detached copy of a user, safe to hand out after its session closes."""
+    snapshot = User(
+        id=user.id,
+        email=user.email,
+        hashed_password=user.hashed_password,
+        full_name=user.full_name,
+        role=user.role,
+        is_active=user.is_active,
+        is_admin=user.is_admin,
+        last_login=user.last_login,
+    )
+    return snapshot
+
+
+def _cache_user(token: str, user: User) -> None:
+    if settings.AUTH_CACHE_TTL <= 0:
+        return
+    if len(_USER_CACHE) >= _USER_CACHE_MAX:
+        now = time.time()
+        expired = [k for k, (until, _) in _USER_CACHE.items() if until <= now]
+        for k in expired:
+            del _USER_CACHE[k]
+        if len(_USER_CACHE) >= _USER_CACHE_MAX:
+            _USER_CACHE.clear()
+    _USER_CACHE[_user_cache_key(token)] = (
+        time.time() + settings.AUTH_CACHE_TTL,
+        _snapshot_user(user),
+    )
+
+
+def _cached_user(token: str) -> User | None:
+    if settings.AUTH_CACHE_TTL <= 0:
+        return None
+    entry = _USER_CACHE.get(_user_cache_key(token))
+    if entry is None:
+        return None
+    expires, user = entry
+    if time.time() >= expires:
+        _USER_CACHE.pop(_user_cache_key(token), None)
+        return None
+    return user
+
+
+def invalidate_user_cache(token: str) -> None:
+    """Drop a token's cached user (logout, password change)."""
+    _USER_CACHE.pop(_user_cache_key(token), None)
+
+
+def get_auth_service(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> AuthService:
+    """
+    Provide an AuthService bound to the request's database session.
+
+    FastAPI caches this dependency per request, so nested dependencies and
+    the handler share a single service instance instead of each constructing
+    their own.
+    """
+    return AuthService(db)
+
+
+def get_product_service(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> ProductService:
+    """Provide a ProductService bound to the request's database session."""
+    return ProductService(db)
+
+
+def get_category_service(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> CategoryService:
+    """Provide a CategoryService bound to the request's database session."""
+    return CategoryService(db)
+
+
+def get_purchase_order_service(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> PurchaseOrderService:
+    """Provide a PurchaseOrderService bound to the request's database session."""
+    return PurchaseOrderService(db)
+
+
+def get_shipment_service(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> ShipmentService:
+    """Provide a ShipmentService bound to the request's database session."""
+    return ShipmentService(db)
+
+
+def get_supplier_service(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> SupplierService:
+    """Provide a SupplierService bound to the request's database session."""
+    return SupplierService(db)
+
+
+def get_user_service(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> UserService:
+    """Provide a UserService bound to the request's database session."""
+    return UserService(db)
+
 
 async def get_current_user(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     token: Annotated[str, Depends(oauth2_scheme)]
 ) -> User:
     """
     Get the current authenticated user from JWT token.
-    
+
     This dependency extracts the JWT token from the Authorization header,
     verifies it, and returns the corresponding user from the database.
-    
+    The resolved user is memoized on ``request.state`` keyed by the token,
+    so code paths that resolve this dependency outside FastAPI's own
+    dependency cache still pay for JWT verification and the user SELECT
+    at most once per request.
+
     Args:
+        request: The current request, used for per-request memoization
         db: Database session dependency
         token: JWT token from Authorization header
-        
+
     Returns:
         User: The authenticated user object
-        
+
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    # Per-request memo: same token within one request means same user
+    if getattr(request.state, "current_user_token", None) == token:
+        return request.state.current_user
+
+    # Cross-request cache: skip JWT decode and the user SELECT entirely
+    # within the (short) cache window
+    cached = _cached_user(token)
+    if cached is not None:
+        request.state.current_user = cached
+        request.state.current_user_token = token
+        return cached
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -58,16 +202,15 @@ async def get_current_user(
             logger.warning("Token missing user ID (sub claim)")
             raise credentials_exception
             
-    except (JWTError, ValidationError) as e:
+    except (ValueError, ValidationError) as e:
         logger.warning(f"Token validation failed: {e}")
         raise credentials_exception
     
-    # Fetch user from database
+    # Fetch user by primary key: session.get consults the identity map
+    # first (zero SQL if the user is already loaded in this session) and
+    # otherwise issues the session's pre-baked PK lookup statement
     try:
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        user = await db.get(User, user_id)
         
         if user is None:
             logger.warning(f"User {user_id} not found in database")
@@ -81,8 +224,11 @@ async def get_current_user(
             )
         
         logger.debug(f"Successfully authenticated user {user_id}")
+        request.state.current_user = user
+        request.state.current_user_token = token
+        _cache_user(token, user)
         return user
-        
+
     except Exception as e:
         logger.error(f"Database error during user authentication: {e}")
         raise HTTPException(
@@ -96,26 +242,17 @@ async def get_current_active_user(
 ) -> User:
     """
     Get current active user.
-    
-    This is a convenience dependency that ensures the user is active.
-    It's redundant since get_current_user already checks this, but
-    provided for explicit dependency injection where needed.
-    
+
+    Kept as a distinct dependency for endpoints that want to express the
+    "active user" requirement explicitly, but get_current_user already
+    rejects inactive users, so no re-check is performed here.
+
     Args:
         current_user: The current authenticated user
-        
+
     Returns:
         User: The active user object
-        
-    Raises:
-        HTTPException: If user is inactive
     """
-    if not current_user.is_active:
-        logger.warning(f"Inactive user {current_user.id} attempted access")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
     return current_user
 
 
@@ -136,7 +273,7 @@ async def get_current_admin_user(
     Raises:
         HTTPException: If user is not an admin
     """
-    if not current_user.is_admin:
+    if not current_user.perm_bits & PERM_ADMIN:
         logger.warning(f"Non-admin user {current_user.id} attempted admin access")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -163,7 +300,7 @@ async def get_current_superuser(
     Raises:
         HTTPException: If user is not a superuser
     """
-    if not getattr(current_user, 'is_superuser', False):
+    if not current_user.perm_bits & PERM_SUPERUSER:
         logger.warning(f"Non-superuser {current_user.id} attempted superuser access")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -189,7 +326,7 @@ async def get_current_manager_user(
     Raises:
         HTTPException: If user is not a manager or admin
     """
-    if not (current_user.is_admin or getattr(current_user, 'role', '') in ['manager', 'procurement_manager']):
+    if not current_user.perm_bits & (PERM_ADMIN | PERM_MANAGER):
         logger.warning(f"Non-manager user {current_user.id} attempted manager access")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -218,23 +355,26 @@ async def get_optional_current_user(
     """
     if not token:
         return None
-        
+
+    # A JWT is always three dot-separated segments; skip verification and
+    # the DB round-trip entirely for obviously malformed tokens.
+    if token.count(".") != 2:
+        return None
+
     try:
         payload = verify_token(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
-            
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-        
-        if user and user.is_active:
-            return user
-            
-    except (JWTError, ValidationError, Exception):
-        # Silently fail for optional authentication
-        pass
-        
+    except (ValueError, ValidationError):
+        # Invalid token just means anonymous access
+        return None
+
+    # Database errors are real failures and must propagate, not be
+    # silently swallowed as "anonymous"
+    user = await db.get(User, user_id)
+
+    if user and user.is_active:
+        return user
+
     return None
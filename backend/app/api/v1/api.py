@@ -11,14 +11,20 @@ from app.api.v1.endpoints import (
     shipments
 )
 
-api_router = APIRouter()
+# The merged route table is built exactly once, at import time, from this
+# static tuple; nothing mutates api_router afterwards, so worker processes
+# forked after import (gunicorn --preload) share the prepared table.
+_ROUTERS = (
+    (auth.router, "/auth", "authentication"),
+    (users.router, "/users", "users"),
+    (products.router, "/products", "products"),
+    (categories.router, "/categories", "categories"),
+    (inventory.router, "/inventory", "inventory"),
+    (suppliers.router, "/suppliers", "suppliers"),
+    (purchase_orders.router, "/purchase-orders", "purchase orders"),
+    (shipments.router, "/shipments", "shipments"),
+)
 
-# Include all endpoint routers
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
-api_router.include_router(products.router, prefix="/products", tags=["products"])
-api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
-api_router.include_router(inventory.router, prefix="/inventory", tags=["inventory"])
-api_router.include_router(suppliers.router, prefix="/suppliers", tags=["suppliers"])
-api_router.include_router(purchase_orders.router, prefix="/purchase-orders", tags=["purchase orders"])
-api_router.include_router(shipments.router, prefix="/shipments", tags=["shipments"]) 
\ No newline at end of file
+api_router = APIRouter()
+for _router, _prefix, _tag in _ROUTERS:
+    api_router.include_router(_router, prefix=_prefix, tags=[_tag])
@@ -1,18 +1,25 @@
 """Authentication endpoints with comprehensive logging."""
 
-from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import (
+    get_auth_service,
+    get_current_user,
+    invalidate_user_cache,
+    oauth2_scheme,
+)
 from app.core.config import settings
+from app.core.rate_limit import check_rate_limit
 from app.core.security import (
-    create_access_token,
-    create_refresh_token,
+    create_token_pair,
+    invalidate_token,
     verify_password
 )
 from app.core.logging import get_logger, log_authentication_event, log_error_with_context
@@ -22,36 +29,48 @@ from app.schemas.auth import Token, UserLogin
 from app.schemas.user import UserCreate, UserResponse, UserUpdate, PasswordUpdate
 from app.services.auth import AuthService
 
-router = APIRouter()
+# orjson serializes the small auth payloads (tokens, user profiles, message
+# dicts) several times faster than stdlib json and handles datetime/UUID
+# without jsonable_encoder post-processing
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
-@router.post("/register", response_model=UserResponse)
+# Validation machinery compiled once at import; handlers that hand-construct
+# schema instances go through these instead of re-entering model __init__
+_USER_LOGIN_ADAPTER = TypeAdapter(UserLogin)
+_TOKEN_ADAPTER = TypeAdapter(Token)
+_USER_RESPONSE_ADAPTER = TypeAdapter(UserResponse)
+
+@router.post("/register", response_model=None)
 async def register(
     user_data: UserCreate,
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    auth_service: AuthService = Depends(get_auth_service)
 ) -> Any:
     """
     Register a new user with detailed logging.
     """
-    logger.info(f"Registration attempt for email: {user_data.email}")
-    auth_service = AuthService(db)
-    
+    client = request.scope.get("client")
+    check_rate_limit(
+        f"register:{client[0] if client else '-'}",
+        settings.AUTH_RATE_LIMIT_PER_MINUTE,
+    )
+    logger.info("Registration attempt for email: %s", user_data.email)
+
     try:
-        # Check if user already exists
-        existing_user = await auth_service.get_user_by_email(user_data.email)
-        if existing_user:
-            logger.warning(f"Registration failed - email already exists: {user_data.email}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
+        # The service's INSERT ... ON CONFLICT is authoritative for the
+        # duplicate-email case; no separate existence check round-trip
         user = await auth_service.register_user(user_data)
         log_authentication_event(logger, "registration", user.id, success=True)
-        logger.info(f"User registered successfully: {user.email} (ID: {user.id})")
-        return user
-        
+        logger.info("User registered successfully: %s (ID: %s)", user.email, user.id)
+        return _USER_RESPONSE_ADAPTER.validate_python(user, from_attributes=True)
+
+    except ValueError:
+        logger.warning("Registration failed - email already exists: %s", user_data.email)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -61,30 +80,46 @@ async def register(
             detail="Registration failed due to server error"
         )
 
-@router.post("/login", response_model=Token)
+# response_model=None: the token payload is validated through the
+# module-level adapter, skipping FastAPI's per-call response-model pass
+@router.post("/login", response_model=None)
 async def login(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: AsyncSession = Depends(get_db)
+    auth_service: AuthService = Depends(get_auth_service)
 ) -> Any:
     """
     OAuth2 compatible token login with comprehensive logging.
     """
-    client_ip = request.client.host
-    logger.info(f"Login attempt from IP {client_ip} for username: {form_data.username}")
-    
-    auth_service = AuthService(db)
-    
+    # Read the peer straight from the ASGI scope: request.client lazily
+    # builds a namedtuple per access. Behind a proxy the first hop in
+    # X-Forwarded-For is the real client.
+    client = request.scope.get("client")
+    client_ip = (
+        request.headers.get("x-forwarded-for", "").partition(",")[0].strip()
+        or (client[0] if client else "-")
+    )
+    # Throttle before the DB lookup and hash verification: a rejected
+    # attempt costs only an in-memory deque check
+    check_rate_limit(
+        f"login:{client_ip}:{form_data.username}",
+        settings.AUTH_RATE_LIMIT_PER_MINUTE,
+    )
+    logger.info("Login attempt from IP %s for username: %s", client_ip, form_data.username)
+
     try:
         # Convert OAuth2 form to our schema
-        login_data = UserLogin(email=form_data.username, password=form_data.password)
+        login_data = _USER_LOGIN_ADAPTER.validate_python({
+            "email": form_data.username,
+            "password": form_data.password,
+        })
         
         # Authenticate user
         user = await auth_service.authenticate_user(login_data)
         
         if not user:
             log_authentication_event(logger, "login", user_id=form_data.username, success=False)
-            logger.warning(f"Login failed - invalid credentials for: {form_data.username} from IP: {client_ip}")
+            logger.warning("Login failed - invalid credentials for: %s from IP: %s", form_data.username, client_ip)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
@@ -93,27 +128,24 @@ async def login(
         
         if not user.is_active:
             log_authentication_event(logger, "login", user_id=str(user.id), success=False)
-            logger.warning(f"Login failed - inactive user: {user.email}")
+            logger.warning("Login failed - inactive user: %s", user.email)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Inactive user"
             )
         
         # Create tokens
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            str(user.id), expires_delta=access_token_expires
-        )
-        refresh_token = create_refresh_token(str(user.id))
-        
+        access_token, refresh_token = create_token_pair(user.id)
+
+
         log_authentication_event(logger, "login", user_id=str(user.id), success=True)
-        logger.info(f"User logged in successfully: {user.email} (ID: {user.id}) from IP: {client_ip}")
-        
-        return {
+        logger.info("User logged in successfully: %s (ID: %s) from IP: %s", user.email, user.id, client_ip)
+
+        return _TOKEN_ADAPTER.validate_python({
             "access_token": access_token,
             "refresh_token": refresh_token,
             "token_type": "bearer"
-        }
+        })
         
     except HTTPException:
         raise
@@ -123,13 +155,13 @@ async def login(
             "username": form_data.username,
             "client_ip": client_ip
         })
-        logger.error(f"Login error for {form_data.username}: {str(e)}", exc_info=True)
+        logger.error("Login error for %s: %s", form_data.username, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Login failed due to server error"
         )
 
-@router.post("/refresh", response_model=Token)
+@router.post("/refresh", response_model=None)
 async def refresh_token(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -138,19 +170,19 @@ async def refresh_token(
     """
     Refresh access token with logging.
     """
-    logger.info(f"Token refresh requested for user: {current_user.email} (ID: {current_user.id})")
+    logger.info("Token refresh requested for user: %s (ID: %s)", current_user.email, current_user.id)
     
     try:
-        access_token = create_access_token(str(current_user.id))
-        refresh_token = create_refresh_token(str(current_user.id))
-        
+        access_token, refresh_token = create_token_pair(current_user.id)
+
+
         log_authentication_event(logger, "token_refresh", user_id=str(current_user.id), success=True)
-        
-        return {
+
+        return _TOKEN_ADAPTER.validate_python({
             "access_token": access_token,
             "refresh_token": refresh_token,
             "token_type": "bearer"
-        }
+        })
     except Exception as e:
         log_error_with_context(logger, e, {
             "endpoint": "refresh",
@@ -164,29 +196,37 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     request: Request,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    token: str = Depends(oauth2_scheme)
 ) -> Any:
     """
     Logout user with logging.
     """
-    logger.info(f"Logout requested for user: {current_user.email} (ID: {current_user.id})")
+    logger.info("Logout requested for user: %s (ID: %s)", current_user.email, current_user.id)
     log_authentication_event(logger, "logout", user_id=str(current_user.id), success=True)
-    
+
+    # Drop the cached token payload and resolved user so neither cache can
+    # serve this token after logout
+    invalidate_token(token)
+    invalidate_user_cache(token)
+
     # In a real application, you might want to blacklist the token
     # or implement token revocation logic here
     return {"message": "Successfully logged out"}
 
-@router.get("/me", response_model=UserResponse)
+# The user-returning endpoints validate through the module-level adapter
+# instead of FastAPI's per-call response-model pass (hence response_model=None)
+@router.get("/me", response_model=None)
 async def read_users_me(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """
     Get current user with logging.
     """
-    logger.debug(f"User profile accessed: {current_user.email} (ID: {current_user.id})")
-    return current_user
+    logger.debug("User profile accessed: %s (ID: %s)", current_user.email, current_user.id)
+    return _USER_RESPONSE_ADAPTER.validate_python(current_user, from_attributes=True)
 
-@router.put("/me", response_model=UserResponse)
+@router.put("/me", response_model=None)
 async def update_user_me(
     user_data: UserUpdate,
     request: Request,
@@ -196,30 +236,33 @@ async def update_user_me(
     """
     Update current user with logging.
     """
-    logger.info(f"User update requested for: {current_user.email} (ID: {current_user.id})")
+    logger.info("User update requested for: %s (ID: %s)", current_user.email, current_user.id)
     
     try:
-        auth_service = AuthService(db)
-        user = await auth_service.get_user_by_id(current_user.id)
+        patch = user_data.model_dump(exclude_unset=True, exclude_none=True)
+        if not patch:
+            logger.debug("Empty update for user %s, skipping write", current_user.id)
+            return _USER_RESPONSE_ADAPTER.validate_python(current_user, from_attributes=True)
+
+        # Single UPDATE ... RETURNING round-trip instead of a SELECT,
+        # attribute mutation, COMMIT and refresh SELECT
+        result = await db.execute(
+            update(User)
+            .where(User.id == current_user.id)
+            .values(**patch)
+            .returning(User)
+        )
+        user = result.scalars().first()
         if not user:
-            logger.error(f"User not found during update: {current_user.id}")
+            logger.error("User not found during update: %s", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        
-        # Track what fields are being updated
-        updated_fields = []
-        for field, value in user_data.dict(exclude_unset=True).items():
-            if value is not None:
-                setattr(user, field, value)
-                updated_fields.append(field)
-        
         await db.commit()
-        await db.refresh(user)
-        
-        logger.info(f"User updated successfully: {user.email} (ID: {user.id}). Updated fields: {updated_fields}")
-        return user
+
+        logger.info("User updated successfully: %s (ID: %s). Updated fields: %s", user.email, user.id, list(patch))
+        return _USER_RESPONSE_ADAPTER.validate_python(user, from_attributes=True)
         
     except HTTPException:
         raise
@@ -238,15 +281,19 @@ async def update_password(
     password_data: PasswordUpdate,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    auth_service: AuthService = Depends(get_auth_service),
+    token: str = Depends(oauth2_scheme)
 ) -> Any:
     """
     Update current user's password with logging.
     """
-    logger.info(f"Password change requested for user: {current_user.email} (ID: {current_user.id})")
-    
+    check_rate_limit(
+        f"pwchange:{current_user.id}",
+        settings.AUTH_RATE_LIMIT_PER_MINUTE,
+    )
+    logger.info("Password change requested for user: %s (ID: %s)", current_user.email, current_user.id)
+
     try:
-        auth_service = AuthService(db)
         success = await auth_service.update_user_password(
             current_user.id,
             password_data.current_password,
@@ -255,15 +302,18 @@ async def update_password(
         
         if not success:
             log_authentication_event(logger, "password_change", user_id=str(current_user.id), success=False)
-            logger.warning(f"Password change failed - incorrect current password for user: {current_user.email}")
+            logger.warning("Password change failed - incorrect current password for user: %s", current_user.email)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect password"
             )
         
         log_authentication_event(logger, "password_change", user_id=str(current_user.id), success=True)
-        logger.info(f"Password changed successfully for user: {current_user.email}")
-        
+        logger.info("Password changed successfully for user: %s", current_user.email)
+
+        # The cached user snapshot now holds a stale hash
+        invalidate_user_cache(token)
+
         return {"message": "Password updated successfully"}
         
     except HTTPException:
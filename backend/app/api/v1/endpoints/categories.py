@@ -2,10 +2,14 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
 
-from app.api.deps import get_current_user, get_db
+from app.api._http_cache import content_etag, weak_etag
+from app.api.deps import get_category_service, get_current_user
+from app.core.cache import cache_clear_prefix, cache_get, cache_set
 from app.core.logging import get_logger
 from app.models.user import User
 from app.schemas.category import CategoryCreate, CategoryRead, CategoryUpdate
@@ -14,7 +18,12 @@ from app.services.category import CategoryService
 # Initialize logger
 logger = get_logger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Category trees are read-heavy and rarely mutated: cache the serialized
+# tree bytes in Redis and drop the whole prefix on any category mutation.
+_TREE_CACHE_PREFIX = "cat:tree:"
+_TREE_CACHE_TTL = 600
 
 
 @router.get("/", response_model=List[CategoryRead])
@@ -23,7 +32,7 @@ async def list_categories(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     parent_id: Optional[str] = Query(None, description="Filter by parent category ID"),
     active_only: bool = Query(True, description="Show only active categories"),
-    db: AsyncSession = Depends(get_db),
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User = Depends(get_current_user),
 ) -> List[CategoryRead]:
     """
@@ -37,15 +46,14 @@ async def list_categories(
         limit: Maximum number of records to return
         parent_id: Filter categories by parent category ID
         active_only: Whether to show only active categories
-        db: Database session dependency
+        category_service: Category service dependency
         current_user: Currently authenticated user
         
     Returns:
         List of category records
     """
-    logger.info(f"User {current_user.id} requesting category list")
+    logger.info("User %s requesting category list", current_user.id)
     
-    category_service = CategoryService(db)
     categories = await category_service.get_categories(
         skip=skip,
         limit=limit,
@@ -53,14 +61,44 @@ async def list_categories(
         active_only=active_only
     )
     
-    logger.info(f"Retrieved {len(categories)} categories")
+    logger.info("Retrieved %s categories", len(categories))
     return categories
 
 
+# Registered at /roots, and before the /{category_id} routes below:
+# Starlette matches in declaration order, so a later /roots would be
+# swallowed by the path parameter (it previously shadowed "/" instead)
+@router.get("/roots", response_model=List[CategoryRead])
+async def get_root_categories(
+    active_only: bool = Query(True, description="Show only active categories"),
+    category_service: CategoryService = Depends(get_category_service),
+    current_user: User = Depends(get_current_user),
+) -> List[CategoryRead]:
+    """
+    Get all root categories (categories without parent).
+    
+    Args:
+        active_only: Whether to show only active categories
+        category_service: Category service dependency
+        current_user: Currently authenticated user
+        
+    Returns:
+        List of root categories
+    """
+    logger.info("User %s requesting root categories", current_user.id)
+    
+    root_categories = await category_service.get_root_categories(active_only=active_only)
+    
+    logger.info("Retrieved %s root categories", len(root_categories))
+    return root_categories
+
+
 @router.get("/{category_id}", response_model=CategoryRead)
 async def get_category(
     category_id: str,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User = Depends(get_current_user),
 ) -> CategoryRead:
     """
@@ -68,7 +106,7 @@ async def get_category(
     
     Args:
         category_id: The ID of the category to retrieve
-        db: Database session dependency
+        category_service: Category service dependency
         current_user: Currently authenticated user
         
     Returns:
@@ -77,26 +115,32 @@ async def get_category(
     Raises:
         HTTPException: If category not found
     """
-    logger.info(f"User {current_user.id} requesting category {category_id}")
+    logger.info("User %s requesting category %s", current_user.id, category_id)
     
-    category_service = CategoryService(db)
     category = await category_service.get_category_by_id(category_id)
     
     if not category:
-        logger.warning(f"Category {category_id} not found")
+        logger.warning("Category %s not found", category_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
-    
-    logger.info(f"Retrieved category {category_id}")
+
+    # Conditional GET: identical revisits cost neither serialization nor
+    # body transfer
+    etag = weak_etag(category)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+
+    logger.info("Retrieved category %s", category_id)
     return category
 
 
 @router.post("/", response_model=CategoryRead, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreate,
-    db: AsyncSession = Depends(get_db),
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User = Depends(get_current_user),
 ) -> CategoryRead:
     """
@@ -106,7 +150,7 @@ async def create_category(
     
     Args:
         category_data: Category creation data
-        db: Database session dependency
+        category_service: Category service dependency
         current_user: Currently authenticated user
         
     Returns:
@@ -115,41 +159,36 @@ async def create_category(
     Raises:
         HTTPException: If user lacks permission or category name exists
     """
-    logger.info(f"User {current_user.id} creating new category: {category_data.name}")
+    logger.info("User %s creating new category: %s", current_user.id, category_data.name)
     
     # Check if user has permission to create categories
-    if not (current_user.is_admin or current_user.role in ["manager", "procurement_manager"]):
+    if not current_user.can_manage_categories:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to create categories"
         )
     
-    category_service = CategoryService(db)
-    
-    # Check if category name already exists in the same parent
-    existing_category = await category_service.get_category_by_name(
-        category_data.name, 
-        parent_id=category_data.parent_id
-    )
-    if existing_category:
-        logger.warning(f"Attempt to create category with existing name: {category_data.name}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Category name already exists in this parent category"
-        )
-    
-    # Validate parent category if provided
-    if category_data.parent_id:
-        parent_category = await category_service.get_category_by_id(category_data.parent_id)
-        if not parent_category:
+    # No pre-checks: the ux_cat_name_parent unique index and the parent_id
+    # foreign key are the authority for both invariants, so the INSERT is a
+    # single round-trip and duplicates cannot race past a SELECT
+    try:
+        category = await category_service.create_category(category_data)
+    except IntegrityError as e:
+        if "ux_cat_name_parent" in str(e.orig):
+            logger.warning("Attempt to create category with existing name: %s", category_data.name)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Category name already exists in this parent category"
+            )
+        if "fk_category_parent" in str(e.orig):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Parent category not found"
             )
-    
-    category = await category_service.create_category(category_data)
-    logger.info(f"Created new category: {category.id}")
-    
+        raise
+    logger.info("Created new category: %s", category.id)
+
+    await cache_clear_prefix(_TREE_CACHE_PREFIX)
     return category
 
 
@@ -157,7 +196,7 @@ async def create_category(
 async def update_category(
     category_id: str,
     category_data: CategoryUpdate,
-    db: AsyncSession = Depends(get_db),
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User = Depends(get_current_user),
 ) -> CategoryRead:
     """
@@ -168,7 +207,7 @@ async def update_category(
     Args:
         category_id: The ID of the category to update
         category_data: Updated category data
-        db: Database session dependency
+        category_service: Category service dependency
         current_user: Currently authenticated user
         
     Returns:
@@ -177,56 +216,63 @@ async def update_category(
     Raises:
         HTTPException: If category not found or access denied
     """
-    logger.info(f"User {current_user.id} updating category {category_id}")
+    logger.info("User %s updating category %s", current_user.id, category_id)
     
     # Check if user has permission to update categories
-    if not (current_user.is_admin or current_user.role in ["manager", "procurement_manager"]):
+    if not current_user.can_manage_categories:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to update categories"
         )
     
-    category_service = CategoryService(db)
     category = await category_service.get_category_by_id(category_id)
     
     if not category:
-        logger.warning(f"Attempt to update non-existent category: {category_id}")
+        logger.warning("Attempt to update non-existent category: %s", category_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
     
-    # Check if new name conflicts with existing categories
-    if category_data.name and category_data.name != category.name:
-        existing_category = await category_service.get_category_by_name(
-            category_data.name,
-            parent_id=category_data.parent_id or category.parent_id
+    # Name-collision, parent-existence, and cycle checks are independent
+    # reads, so the service runs whichever apply concurrently
+    check_name = category_data.name and category_data.name != category.name
+    check_parent = (
+        category_data.parent_id and category_data.parent_id != category.parent_id
+    )
+    existing_category, parent_category, circular = (
+        await category_service.get_update_prechecks(
+            category_id,
+            category_data.name if check_name else None,
+            category_data.parent_id or category.parent_id,
+            category_data.parent_id if check_parent else None,
         )
-        if existing_category and existing_category.id != category_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Category name already exists in this parent category"
-            )
-    
-    # Validate parent category if being changed
-    if category_data.parent_id and category_data.parent_id != category.parent_id:
-        parent_category = await category_service.get_category_by_id(category_data.parent_id)
+    )
+
+    if check_name and existing_category and existing_category.id != category_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category name already exists in this parent category"
+        )
+
+    if check_parent:
         if not parent_category:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Parent category not found"
             )
-        
         # Prevent circular references
-        if await category_service.would_create_circular_reference(category_id, category_data.parent_id):
+        if circular:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot set parent category: would create circular reference"
             )
-    
+
+
     updated_category = await category_service.update_category(category_id, category_data)
-    logger.info(f"Updated category: {category_id}")
-    
+    logger.info("Updated category: %s", category_id)
+
+    await cache_clear_prefix(_TREE_CACHE_PREFIX)
     return updated_category
 
 
@@ -234,7 +280,7 @@ async def update_category(
 async def delete_category(
     category_id: str,
     force: bool = Query(False, description="Force delete even if category has children or products"),
-    db: AsyncSession = Depends(get_db),
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User = Depends(get_current_user),
 ) -> None:
     """
@@ -246,13 +292,13 @@ async def delete_category(
     Args:
         category_id: The ID of the category to delete
         force: Whether to force delete despite dependencies
-        db: Database session dependency
+        category_service: Category service dependency
         current_user: Currently authenticated user
         
     Raises:
         HTTPException: If category not found, access denied, or has dependencies
     """
-    logger.info(f"User {current_user.id} attempting to delete category {category_id}")
+    logger.info("User %s attempting to delete category %s", current_user.id, category_id)
     
     # Check if user has permission to delete categories
     if not current_user.is_admin:
@@ -261,21 +307,14 @@ async def delete_category(
             detail="Not enough permissions to delete categories"
         )
     
-    category_service = CategoryService(db)
-    category = await category_service.get_category_by_id(category_id)
-    
-    if not category:
-        logger.warning(f"Attempt to delete non-existent category: {category_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found"
-        )
-    
-    # Check for dependencies if not forcing
+    # Check for dependencies if not forcing; both flags come back from a
+    # single combined EXISTS query
     if not force:
-        has_children = await category_service.has_child_categories(category_id)
-        has_products = await category_service.has_associated_products(category_id)
-        
+        has_children, has_products = await category_service.get_dependency_flags(
+            category_id
+        )
+
+
         if has_children:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -288,15 +327,24 @@ async def delete_category(
                 detail="Cannot delete category with associated products. Use force=true to override."
             )
     
-    await category_service.delete_category(category_id, force=force)
-    logger.info(f"Deleted category: {category_id}")
+    # The soft-delete UPDATE doubles as the existence check
+    deleted = await category_service.delete_category(category_id, force=force)
+    if not deleted:
+        logger.warning("Attempt to delete non-existent category: %s", category_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Category not found"
+        )
+    logger.info("Deleted category: %s", category_id)
+
+    await cache_clear_prefix(_TREE_CACHE_PREFIX)
 
 
 @router.get("/{category_id}/children", response_model=List[CategoryRead])
 async def get_category_children(
     category_id: str,
     active_only: bool = Query(True, description="Show only active categories"),
-    db: AsyncSession = Depends(get_db),
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User = Depends(get_current_user),
 ) -> List[CategoryRead]:
     """
@@ -305,7 +353,7 @@ async def get_category_children(
     Args:
         category_id: The ID of the parent category
         active_only: Whether to show only active categories
-        db: Database session dependency
+        category_service: Category service dependency
         current_user: Currently authenticated user
         
     Returns:
@@ -314,30 +362,30 @@ async def get_category_children(
     Raises:
         HTTPException: If parent category not found
     """
-    logger.info(f"User {current_user.id} requesting children of category {category_id}")
-    
-    category_service = CategoryService(db)
+    logger.info("User %s requesting children of category %s", current_user.id, category_id)
     
-    # Verify parent category exists
-    category = await category_service.get_category_by_id(category_id)
-    if not category:
+    # One round-trip: the LEFT JOIN probe answers "does the parent exist"
+    # and returns the children together
+    parent_exists, children = await category_service.get_children_with_parent_probe(
+        category_id, active_only=active_only
+    )
+    if not parent_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Parent category not found"
         )
-    
-    children = await category_service.get_child_categories(category_id, active_only=active_only)
-    logger.info(f"Retrieved {len(children)} child categories for {category_id}")
-    
+    logger.info("Retrieved %s child categories for %s", len(children), category_id)
+
     return children
 
 
-@router.get("/{category_id}/tree", response_model=CategoryRead)
+@router.get("/{category_id}/tree", response_model=None)
 async def get_category_tree(
     category_id: str,
+    request: Request,
     max_depth: int = Query(5, ge=1, le=10, description="Maximum depth to retrieve"),
     active_only: bool = Query(True, description="Show only active categories"),
-    db: AsyncSession = Depends(get_db),
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User = Depends(get_current_user),
 ) -> CategoryRead:
     """
@@ -349,7 +397,7 @@ async def get_category_tree(
         category_id: The ID of the root category
         max_depth: Maximum depth of the tree to retrieve
         active_only: Whether to include only active categories
-        db: Database session dependency
+        category_service: Category service dependency
         current_user: Currently authenticated user
         
     Returns:
@@ -358,46 +406,40 @@ async def get_category_tree(
     Raises:
         HTTPException: If category not found
     """
-    logger.info(f"User {current_user.id} requesting tree for category {category_id}")
-    
-    category_service = CategoryService(db)
+    logger.info("User %s requesting tree for category %s", current_user.id, category_id)
+
+    cache_key = f"{_TREE_CACHE_PREFIX}{category_id}:{max_depth}:{int(active_only)}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        # Serve the pre-serialized bytes directly; no DB walk, no Pydantic
+        etag = content_etag(cached)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        return Response(
+            content=cached, media_type="application/json", headers={"ETag": etag}
+        )
+
     category_tree = await category_service.get_category_tree(
         category_id,
         max_depth=max_depth,
         active_only=active_only
     )
-    
+
     if not category_tree:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
-    
-    logger.info(f"Retrieved category tree for {category_id}")
-    return category_tree
 
+    logger.info("Retrieved category tree for %s", category_id)
+    payload = orjson.dumps(
+        CategoryRead.model_validate(category_tree).model_dump(mode="json")
+    )
+    await cache_set(cache_key, payload, _TREE_CACHE_TTL)
+    etag = content_etag(payload)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    return Response(
+        content=payload, media_type="application/json", headers={"ETag": etag}
+    )
 
-@router.get("/", response_model=List[CategoryRead])
-async def get_root_categories(
-    active_only: bool = Query(True, description="Show only active categories"),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> List[CategoryRead]:
-    """
-    Get all root categories (categories without parent).
-    
-    Args:
-        active_only: Whether to show only active categories
-        db: Database session dependency
-        current_user: Currently authenticated user
-        
-    Returns:
-        List of root categories
-    """
-    logger.info(f"User {current_user.id} requesting root categories")
-    
-    category_service = CategoryService(db)
-    root_categories = await category_service.get_root_categories(active_only=active_only)
-    
-    logger.info(f"Retrieved {len(root_categories)} root categories")
-    return root_categories
@@ -4,10 +4,13 @@ from typing import Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api._fast_serialize import fast_read, stream_ndjson
 from app.core.database import get_session
+from app.models.user import User
 from app.schemas.inventory import (
     InventoryResponse,
     InventoryListResponse,
@@ -15,12 +18,16 @@ from app.schemas.inventory import (
     InventoryMovementResponse,
     StockAnalytics,
 )
-from app.services.inventory import inventory_service
+from app.services.inventory import InventoryService, inventory_service
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/", response_model=InventoryListResponse)
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": InventoryListResponse}},
+)
 async def list_inventory(
     *,
     session: AsyncSession = Depends(get_session),
@@ -28,9 +35,23 @@ async def list_inventory(
     limit: int = Query(100, ge=1, le=1000),
     location_id: UUID = Query(None),
     low_stock: bool = Query(False),
-    current_user: dict = Depends(deps.get_current_user),
+    stream: bool = Query(False, description="Stream rows as NDJSON"),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """List inventory items with filtering and pagination."""
+    if stream:
+        # NDJSON streaming keeps one row in memory at a time instead of
+        # materializing the whole page; worthwhile for limit > 100
+        return stream_ndjson(
+            session,
+            InventoryService.list_query(
+                skip=skip,
+                limit=limit,
+                location_id=location_id,
+                low_stock=low_stock,
+            ),
+            InventoryResponse,
+        )
     inventory_items, total = await inventory_service.get_inventory_items(
         session=session,
         skip=skip,
@@ -38,11 +59,14 @@ async def list_inventory(
         location_id=location_id,
         low_stock=low_stock,
     )
-    return InventoryListResponse(
-        items=inventory_items,
-        total=total,
-        skip=skip,
-        limit=limit,
+    # Pre-serialized: skips FastAPI's second validation pass over the page
+    return ORJSONResponse(
+        InventoryListResponse(
+            items=inventory_items,
+            total=total,
+            skip=skip,
+            limit=limit,
+        ).model_dump(mode="json")
     )
 
 
@@ -51,18 +75,18 @@ async def adjust_inventory(
     *,
     session: AsyncSession = Depends(get_session),
     adjustment: InventoryAdjustment,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Adjust inventory levels."""
     inventory_item = await inventory_service.adjust_inventory(
         session=session,
         adjustment=adjustment,
-        adjusted_by=current_user["id"],
+        adjusted_by=current_user.id,
     )
-    return InventoryResponse.from_orm(inventory_item)
+    return fast_read(InventoryResponse, inventory_item)
 
 
-@router.get("/movements", response_model=List[InventoryMovementResponse])
+@router.get("/movements", response_model=None)
 async def get_inventory_movements(
     *,
     session: AsyncSession = Depends(get_session),
@@ -70,7 +94,7 @@ async def get_inventory_movements(
     location_id: UUID = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get inventory movement history."""
     movements = await inventory_service.get_inventory_movements(
@@ -80,7 +104,10 @@ async def get_inventory_movements(
         skip=skip,
         limit=limit,
     )
-    return [InventoryMovementResponse.from_orm(movement) for movement in movements]
+    # Pre-serialized: movement history can run to 1000 rows per page
+    return ORJSONResponse(
+        [fast_read(InventoryMovementResponse, movement).model_dump(mode="json") for movement in movements]
+    )
 
 
 @router.post("/count", response_model=InventoryResponse)
@@ -89,25 +116,29 @@ async def physical_count(
     session: AsyncSession = Depends(get_session),
     inventory_id: UUID,
     counted_quantity: int,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Record physical inventory count."""
     inventory_item = await inventory_service.physical_count(
         session=session,
         inventory_id=inventory_id,
         counted_quantity=counted_quantity,
-        counted_by=current_user["id"],
+        counted_by=current_user.id,
     )
-    return InventoryResponse.from_orm(inventory_item)
+    return fast_read(InventoryResponse, inventory_item)
 
 
-@router.get("/low-stock", response_model=InventoryListResponse)
+@router.get(
+    "/low-stock",
+    response_model=None,
+    responses={200: {"model": InventoryListResponse}},
+)
 async def get_low_stock_items(
     *,
     session: AsyncSession = Depends(get_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get items with low stock levels."""
     inventory_items, total = await inventory_service.get_low_stock_items(
@@ -115,11 +146,13 @@ async def get_low_stock_items(
         skip=skip,
         limit=limit,
     )
-    return InventoryListResponse(
-        items=inventory_items,
-        total=total,
-        skip=skip,
-        limit=limit,
+    return ORJSONResponse(
+        InventoryListResponse(
+            items=inventory_items,
+            total=total,
+            skip=skip,
+            limit=limit,
+        ).model_dump(mode="json")
     )
 
 
@@ -128,7 +161,7 @@ async def get_inventory_analytics(
     *,
     session: AsyncSession = Depends(get_session),
     location_id: UUID = Query(None),
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get inventory analytics and insights."""
     analytics = await inventory_service.get_inventory_analytics(
@@ -3,14 +3,17 @@
 from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api._fast_serialize import fast_read, stream_ndjson
+from app.api._http_cache import weak_etag
 from app.core.database import get_session
 from app.core.security import get_current_user
-from app.db.session import get_db
 from app.models.product import Product
+from app.models.user import User
 from app.schemas.auth import UserResponse
 from app.schemas.product import (
     ProductCreate,
@@ -20,10 +23,16 @@ from app.schemas.product import (
 )
 from app.services.product import product_service, ProductService
 
-router = APIRouter()
+# orjson serializes the list-heavy product payloads several times faster
+# than stdlib json and encodes datetime/UUID/Decimal-free rows natively
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/", response_model=ProductListResponse)
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": ProductListResponse}},
+)
 async def list_products(
     *,
     session: AsyncSession = Depends(get_session),
@@ -32,8 +41,23 @@ async def list_products(
     search: str = Query(None),
     category_id: UUID = Query(None),
     status: str = Query(None),
+    stream: bool = Query(False, description="Stream rows as NDJSON"),
 ) -> Any:
     """List products with filtering and pagination."""
+    if stream:
+        # NDJSON streaming keeps one row in memory at a time instead of
+        # materializing the whole page; worthwhile for limit > 100
+        return stream_ndjson(
+            session,
+            ProductService.list_query(
+                skip=skip,
+                limit=limit,
+                search=search,
+                category_id=category_id,
+                status=status,
+            ),
+            ProductResponse,
+        )
     products, total = await product_service.get_products(
         session=session,
         skip=skip,
@@ -42,11 +66,14 @@ async def list_products(
         category_id=category_id,
         status=status,
     )
-    return ProductListResponse(
-        items=products,
-        total=total,
-        skip=skip,
-        limit=limit,
+    # Pre-serialized: skips FastAPI's second validation pass over the page
+    return ORJSONResponse(
+        ProductListResponse(
+            items=products,
+            total=total,
+            skip=skip,
+            limit=limit,
+        ).model_dump(mode="json")
     )
 
 
@@ -54,12 +81,11 @@ async def list_products(
 async def create_product(
     product_data: ProductCreate,
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    product_service: ProductService = Depends(deps.get_product_service)
 ) -> Any:
     """
     Create new product.
     """
-    product_service = ProductService(db)
     product = await product_service.create_product(product_data)
     return product
 
@@ -67,19 +93,25 @@ async def create_product(
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product(
     product_id: int,
+    request: Request,
+    response: Response,
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    product_service: ProductService = Depends(deps.get_product_service)
 ) -> Any:
     """
     Get product by ID.
     """
-    product_service = ProductService(db)
     product = await product_service.get_product(product_id)
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found"
         )
+    # Conditional GET: a matching ETag skips serialization and the body
+    etag = weak_etag(product)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
     return product
 
 
@@ -88,12 +120,11 @@ async def update_product(
     product_id: int,
     product_data: ProductUpdate,
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    product_service: ProductService = Depends(deps.get_product_service)
 ) -> Any:
     """
     Update product.
     """
-    product_service = ProductService(db)
     product = await product_service.update_product(product_id, product_data)
     if not product:
         raise HTTPException(
@@ -107,12 +138,11 @@ async def update_product(
 async def delete_product(
     product_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    product_service: ProductService = Depends(deps.get_product_service)
 ) -> None:
     """
     Delete product.
     """
-    product_service = ProductService(db)
     product = await product_service.delete_product(product_id)
     if not product:
         raise HTTPException(
@@ -121,7 +151,11 @@ async def delete_product(
         )
 
 
-@router.get("/search/", response_model=ProductListResponse)
+@router.get(
+    "/search/",
+    response_model=None,
+    responses={200: {"model": ProductListResponse}},
+)
 async def search_products(
     *,
     session: AsyncSession = Depends(get_session),
@@ -136,42 +170,51 @@ async def search_products(
         skip=skip,
         limit=limit,
     )
-    return ProductListResponse(
-        items=products,
-        total=total,
-        skip=skip,
-        limit=limit,
+    return ORJSONResponse(
+        ProductListResponse(
+            items=products,
+            total=total,
+            skip=skip,
+            limit=limit,
+        ).model_dump(mode="json")
     )
 
 
-@router.post("/bulk/", response_model=List[ProductResponse])
+@router.post("/bulk/", response_model=None)
 async def bulk_create_products(
     *,
-    session: AsyncSession = Depends(get_session),
     products_in: List[ProductCreate],
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
+    product_service: ProductService = Depends(deps.get_product_service),
 ) -> Any:
     """Bulk create products."""
-    products = await product_service.bulk_create_products(
-        session=session, products_in=products_in
+    products = await product_service.bulk_create_products(products_in)
+    # Pre-serialized response: skips FastAPI's response-model re-validation
+    # and jsonable_encoder pass over what can be hundreds of rows
+    return ORJSONResponse(
+        [fast_read(ProductResponse, product).model_dump(mode="json") for product in products]
     )
-    return [ProductResponse.from_orm(product) for product in products]
 
 
 @router.get("/sku/{sku}", response_model=ProductResponse)
 async def get_product_by_sku(
     sku: str,
+    request: Request,
+    response: Response,
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    product_service: ProductService = Depends(deps.get_product_service)
 ) -> Any:
     """
     Get product by SKU.
     """
-    product_service = ProductService(db)
     product = await product_service.get_product_by_sku(sku)
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found"
         )
+    etag = weak_etag(product)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
     return product
\ No newline at end of file
@@ -3,24 +3,38 @@
 from typing import Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api._fast_serialize import stream_ndjson
+from app.core.cache import cache_clear_prefix, cache_get, cache_set
 from app.core.database import get_session
 from app.schemas.purchase_order import (
     PurchaseOrderCreate,
     PurchaseOrderUpdate,
     PurchaseOrderResponse,
+    PurchaseOrderRow,
     PurchaseOrderListResponse,
     PurchaseOrderApproval,
 )
-from app.services.purchase_order import purchase_order_service
+from app.models.user import User
+from app.services.purchase_order import purchase_order_service, PurchaseOrderService
 
 router = APIRouter()
 
+# Read-through response cache for purchase order reads. Short TTL keeps
+# staleness bounded; any PO mutation clears the whole namespace.
+_PO_CACHE_PREFIX = "po:"
+_PO_CACHE_TTL = 30
 
-@router.get("/", response_model=PurchaseOrderListResponse)
+
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": PurchaseOrderListResponse}},
+)
 async def list_purchase_orders(
     *,
     session: AsyncSession = Depends(get_session),
@@ -28,22 +42,52 @@ async def list_purchase_orders(
     limit: int = Query(100, ge=1, le=1000),
     status: str = Query(None),
     supplier_id: UUID = Query(None),
-    current_user: dict = Depends(deps.get_current_user),
+    after_id: UUID = Query(None, description="Keyset cursor: rows with id greater than this"),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """List purchase orders with filtering and pagination."""
+    if limit > 500:
+        # Pages this large are never materialized server-side: one row in
+        # flight at a time as NDJSON. The query eager-loads nothing, so
+        # rows are the scalar-only PurchaseOrderRow schema.
+        return stream_ndjson(
+            session,
+            PurchaseOrderService.list_query(
+                limit=limit,
+                status=status,
+                supplier_id=supplier_id,
+                after_id=after_id,
+            ),
+            PurchaseOrderRow,
+        )
+    cache_key = f"{_PO_CACHE_PREFIX}list:{skip}:{limit}:{status}:{supplier_id}:{after_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        # Serve the pre-serialized bytes directly; no SELECT, no Pydantic
+        return Response(content=cached, media_type="application/json")
+
     purchase_orders, total = await purchase_order_service.get_purchase_orders(
         session=session,
         skip=skip,
         limit=limit,
         status=status,
         supplier_id=supplier_id,
+        after_id=after_id,
     )
-    return PurchaseOrderListResponse(
+    body = PurchaseOrderListResponse(
         items=purchase_orders,
         total=total,
         skip=skip,
         limit=limit,
+    ).model_dump(mode="json")
+    # Keyset cursor for the next page; null when this page is the last.
+    # Fetching via after_id is O(limit) at any depth, unlike skip/OFFSET.
+    body["next_cursor"] = (
+        str(purchase_orders[-1].id) if len(purchase_orders) == limit else None
     )
+    payload = orjson.dumps(body)
+    await cache_set(cache_key, payload, _PO_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/", response_model=PurchaseOrderResponse, status_code=status.HTTP_201_CREATED)
@@ -51,23 +95,33 @@ async def create_purchase_order(
     *,
     session: AsyncSession = Depends(get_session),
     po_in: PurchaseOrderCreate,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Create new purchase order."""
     purchase_order = await purchase_order_service.create_purchase_order(
-        session=session, po_in=po_in, created_by=current_user["id"]
+        session=session, po_in=po_in, created_by=current_user.id
     )
-    return PurchaseOrderResponse.from_orm(purchase_order)
+    await cache_clear_prefix(_PO_CACHE_PREFIX)
+    return PurchaseOrderResponse.model_validate(purchase_order)
 
 
-@router.get("/{po_id}", response_model=PurchaseOrderResponse)
+@router.get(
+    "/{po_id}",
+    response_model=None,
+    responses={200: {"model": PurchaseOrderResponse}},
+)
 async def get_purchase_order(
     *,
     session: AsyncSession = Depends(get_session),
     po_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get purchase order by ID."""
+    cache_key = f"{_PO_CACHE_PREFIX}detail:{po_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     purchase_order = await purchase_order_service.get_purchase_order(
         session=session, po_id=po_id
     )
@@ -76,88 +130,82 @@ async def get_purchase_order(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Purchase order not found",
         )
-    return PurchaseOrderResponse.from_orm(purchase_order)
+    payload = orjson.dumps(
+        PurchaseOrderResponse.model_validate(purchase_order).model_dump(mode="json")
+    )
+    await cache_set(cache_key, payload, _PO_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.put("/{po_id}", response_model=PurchaseOrderResponse)
 async def update_purchase_order(
     *,
-    session: AsyncSession = Depends(get_session),
+    po_service: PurchaseOrderService = Depends(deps.get_purchase_order_service),
     po_id: UUID,
     po_in: PurchaseOrderUpdate,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Update purchase order."""
-    purchase_order = await purchase_order_service.get_purchase_order(
-        session=session, po_id=po_id
+    # The editable-status check rides in the UPDATE's WHERE clause, so the
+    # guard and the write are one round-trip instead of SELECT-then-UPDATE
+    purchase_order, exists = await po_service.update_if_status(
+        po_id, po_in, allowed_statuses=("draft", "pending")
     )
-    if not purchase_order:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Purchase order not found",
-        )
-    
-    # Check if user can update this PO
-    if purchase_order.status not in ["draft", "pending"]:
+    if purchase_order is None:
+        if not exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Purchase order not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot update purchase order in current status",
         )
-    
-    purchase_order = await purchase_order_service.update_purchase_order(
-        session=session, purchase_order=purchase_order, po_in=po_in
-    )
-    return PurchaseOrderResponse.from_orm(purchase_order)
+    await cache_clear_prefix(_PO_CACHE_PREFIX)
+    return PurchaseOrderResponse.model_validate(purchase_order)
 
 
 @router.post("/{po_id}/approve", response_model=PurchaseOrderResponse)
 async def approve_purchase_order(
     *,
-    session: AsyncSession = Depends(get_session),
+    po_service: PurchaseOrderService = Depends(deps.get_purchase_order_service),
     po_id: UUID,
     approval: PurchaseOrderApproval,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Approve or reject purchase order."""
-    purchase_order = await purchase_order_service.get_purchase_order(
-        session=session, po_id=po_id
+    # The service's status UPDATE doubles as the existence check, so no
+    # pre-flight SELECT is needed here
+    approval_record = await po_service.approve_purchase_order(
+        po_id, approval, approved_by=current_user.id
     )
-    if not purchase_order:
+    if approval_record is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Purchase order not found",
         )
-    
-    purchase_order = await purchase_order_service.approve_purchase_order(
-        session=session,
-        purchase_order=purchase_order,
-        approval=approval,
-        approved_by=current_user["id"],
-    )
-    return PurchaseOrderResponse.from_orm(purchase_order)
+    await cache_clear_prefix(_PO_CACHE_PREFIX)
+    purchase_order = await po_service.get_purchase_order(po_id)
+    return PurchaseOrderResponse.model_validate(purchase_order)
 
 
 @router.post("/{po_id}/cancel", response_model=PurchaseOrderResponse)
 async def cancel_purchase_order(
     *,
-    session: AsyncSession = Depends(get_session),
+    po_service: PurchaseOrderService = Depends(deps.get_purchase_order_service),
     po_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Cancel purchase order."""
-    purchase_order = await purchase_order_service.get_purchase_order(
-        session=session, po_id=po_id
-    )
-    if not purchase_order:
+    # Guarded UPDATE ... RETURNING; a miss means the row does not exist
+    purchase_order = await po_service.cancel_purchase_order(po_id)
+    if purchase_order is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Purchase order not found",
         )
-    
-    purchase_order = await purchase_order_service.cancel_purchase_order(
-        session=session, purchase_order=purchase_order
-    )
-    return PurchaseOrderResponse.from_orm(purchase_order)
+    await cache_clear_prefix(_PO_CACHE_PREFIX)
+    return PurchaseOrderResponse.model_validate(purchase_order)
 
 
 @router.get("/{po_id}/history", response_model=List[dict])
@@ -165,7 +213,7 @@ async def get_purchase_order_history(
     *,
     session: AsyncSession = Depends(get_session),
     po_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get purchase order history."""
     history = await purchase_order_service.get_purchase_order_history(
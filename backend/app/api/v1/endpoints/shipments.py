@@ -3,24 +3,38 @@
 from typing import Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api._fast_serialize import stream_ndjson
+from app.core.cache import cache_clear_prefix, cache_get, cache_set
 from app.core.database import get_session
+from app.models.user import User
 from app.schemas.shipment import (
     ShipmentCreate,
     ShipmentUpdate,
     ShipmentResponse,
+    ShipmentRow,
     ShipmentListResponse,
     ShipmentTracking,
 )
-from app.services.shipment import shipment_service
+from app.services.shipment import shipment_service, ShipmentService
 
 router = APIRouter()
 
+# Read-through response cache for shipment reads. Short TTL keeps
+# staleness bounded; any shipment mutation clears the whole namespace.
+_SHIPMENT_CACHE_PREFIX = "shp:"
+_SHIPMENT_CACHE_TTL = 30
 
-@router.get("/", response_model=ShipmentListResponse)
+
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": ShipmentListResponse}},
+)
 async def list_shipments(
     *,
     session: AsyncSession = Depends(get_session),
@@ -28,22 +42,52 @@ async def list_shipments(
     limit: int = Query(100, ge=1, le=1000),
     status: str = Query(None),
     purchase_order_id: UUID = Query(None),
-    current_user: dict = Depends(deps.get_current_user),
+    after_id: UUID = Query(None, description="Keyset cursor: rows with id greater than this"),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """List shipments with filtering and pagination."""
+    if limit > 500:
+        # Pages this large are never materialized server-side: one row in
+        # flight at a time as NDJSON. The query eager-loads nothing, so
+        # rows are the scalar-only ShipmentRow schema.
+        return stream_ndjson(
+            session,
+            ShipmentService.list_query(
+                limit=limit,
+                status=status,
+                purchase_order_id=purchase_order_id,
+                after_id=after_id,
+            ),
+            ShipmentRow,
+        )
+    cache_key = (
+        f"{_SHIPMENT_CACHE_PREFIX}list:{skip}:{limit}:{status}:{purchase_order_id}:{after_id}"
+    )
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        # Serve the pre-serialized bytes directly; no SELECT, no Pydantic
+        return Response(content=cached, media_type="application/json")
+
     shipments, total = await shipment_service.get_shipments(
         session=session,
         skip=skip,
         limit=limit,
         status=status,
         purchase_order_id=purchase_order_id,
+        after_id=after_id,
     )
-    return ShipmentListResponse(
+    body = ShipmentListResponse(
         items=shipments,
         total=total,
         skip=skip,
         limit=limit,
-    )
+    ).model_dump(mode="json")
+    # Keyset cursor for the next page; null when this page is the last.
+    # Fetching via after_id is O(limit) at any depth, unlike skip/OFFSET.
+    body["next_cursor"] = str(shipments[-1].id) if len(shipments) == limit else None
+    payload = orjson.dumps(body)
+    await cache_set(cache_key, payload, _SHIPMENT_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/", response_model=ShipmentResponse, status_code=status.HTTP_201_CREATED)
@@ -51,13 +95,14 @@ async def create_shipment(
     *,
     session: AsyncSession = Depends(get_session),
     shipment_in: ShipmentCreate,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Create new shipment."""
     shipment = await shipment_service.create_shipment(
         session=session, shipment_in=shipment_in
     )
-    return ShipmentResponse.from_orm(shipment)
+    await cache_clear_prefix(_SHIPMENT_CACHE_PREFIX)
+    return ShipmentResponse.model_validate(shipment)
 
 
 @router.get("/{shipment_id}", response_model=ShipmentResponse)
@@ -65,7 +110,7 @@ async def get_shipment(
     *,
     session: AsyncSession = Depends(get_session),
     shipment_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get shipment by ID."""
     shipment = await shipment_service.get_shipment(
@@ -76,31 +121,28 @@ async def get_shipment(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Shipment not found",
         )
-    return ShipmentResponse.from_orm(shipment)
+    return ShipmentResponse.model_validate(shipment)
 
 
 @router.put("/{shipment_id}", response_model=ShipmentResponse)
 async def update_shipment(
     *,
-    session: AsyncSession = Depends(get_session),
+    shipment_service: ShipmentService = Depends(deps.get_shipment_service),
     shipment_id: UUID,
     shipment_in: ShipmentUpdate,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Update shipment."""
-    shipment = await shipment_service.get_shipment(
-        session=session, shipment_id=shipment_id
-    )
+    # The service's UPDATE ... RETURNING doubles as the existence check,
+    # so no pre-flight SELECT is needed here
+    shipment = await shipment_service.update_shipment(shipment_id, shipment_in)
     if not shipment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Shipment not found",
         )
-    
-    shipment = await shipment_service.update_shipment(
-        session=session, shipment=shipment, shipment_in=shipment_in
-    )
-    return ShipmentResponse.from_orm(shipment)
+    await cache_clear_prefix(_SHIPMENT_CACHE_PREFIX)
+    return ShipmentResponse.model_validate(shipment)
 
 
 @router.get("/{shipment_id}/tracking", response_model=List[ShipmentTracking])
@@ -108,7 +150,7 @@ async def get_shipment_tracking(
     *,
     session: AsyncSession = Depends(get_session),
     shipment_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get shipment tracking history."""
     tracking = await shipment_service.get_shipment_tracking(
@@ -123,10 +165,11 @@ async def update_tracking(
     session: AsyncSession = Depends(get_session),
     shipment_id: UUID,
     tracking: ShipmentTracking,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Update shipment tracking information."""
     shipment = await shipment_service.update_tracking(
         session=session, shipment_id=shipment_id, tracking=tracking
     )
-    return ShipmentResponse.from_orm(shipment)
\ No newline at end of file
+    await cache_clear_prefix(_SHIPMENT_CACHE_PREFIX)
+    return ShipmentResponse.model_validate(shipment)
\ No newline at end of file
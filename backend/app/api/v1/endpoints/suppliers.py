@@ -3,24 +3,43 @@
 from typing import Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api._fast_serialize import stream_ndjson
+from app.core.cache import cache_clear_prefix, cache_get, cache_set
 from app.core.database import get_session
+from app.models.user import User
 from app.schemas.supplier import (
     SupplierCreate,
     SupplierUpdate,
     SupplierResponse,
+    SupplierRow,
     SupplierListResponse,
     SupplierPerformance,
 )
-from app.services.supplier import supplier_service
+from app.services.supplier import (
+    SUPPLIER_PERF_CACHE_PREFIX,
+    SUPPLIER_PERF_CACHE_TTL,
+    supplier_service,
+    SupplierService,
+)
 
 router = APIRouter()
 
+# Read-through response cache for supplier reads. Short TTL keeps
+# staleness bounded; any supplier mutation clears the whole namespace.
+_SUPPLIER_CACHE_PREFIX = "sup:"
+_SUPPLIER_CACHE_TTL = 30
+
 
-@router.get("/", response_model=SupplierListResponse)
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": SupplierListResponse}},
+)
 async def list_suppliers(
     *,
     session: AsyncSession = Depends(get_session),
@@ -28,22 +47,50 @@ async def list_suppliers(
     limit: int = Query(100, ge=1, le=1000),
     search: str = Query(None),
     status: str = Query(None),
-    current_user: dict = Depends(deps.get_current_user),
+    after_id: UUID = Query(None, description="Keyset cursor: rows with id greater than this"),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """List suppliers with filtering and pagination."""
+    if limit > 500:
+        # Pages this large are never materialized server-side: one row in
+        # flight at a time as NDJSON. The query eager-loads nothing, so
+        # rows are the scalar-only SupplierRow schema.
+        return stream_ndjson(
+            session,
+            SupplierService.list_query(
+                limit=limit,
+                status=status,
+                search=search,
+                after_id=after_id,
+            ),
+            SupplierRow,
+        )
+    cache_key = f"{_SUPPLIER_CACHE_PREFIX}list:{skip}:{limit}:{search}:{status}:{after_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        # Serve the pre-serialized bytes directly; no SELECT, no Pydantic
+        return Response(content=cached, media_type="application/json")
+
     suppliers, total = await supplier_service.get_suppliers(
         session=session,
         skip=skip,
         limit=limit,
         search=search,
         status=status,
+        after_id=after_id,
     )
-    return SupplierListResponse(
+    body = SupplierListResponse(
         items=suppliers,
         total=total,
         skip=skip,
         limit=limit,
-    )
+    ).model_dump(mode="json")
+    # Keyset cursor for the next page; null when this page is the last.
+    # Fetching via after_id is O(limit) at any depth, unlike skip/OFFSET.
+    body["next_cursor"] = str(suppliers[-1].id) if len(suppliers) == limit else None
+    payload = orjson.dumps(body)
+    await cache_set(cache_key, payload, _SUPPLIER_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/", response_model=SupplierResponse, status_code=status.HTTP_201_CREATED)
@@ -51,23 +98,33 @@ async def create_supplier(
     *,
     session: AsyncSession = Depends(get_session),
     supplier_in: SupplierCreate,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Create new supplier."""
     supplier = await supplier_service.create_supplier(
         session=session, supplier_in=supplier_in
     )
-    return SupplierResponse.from_orm(supplier)
+    await cache_clear_prefix(_SUPPLIER_CACHE_PREFIX)
+    return SupplierResponse.model_validate(supplier)
 
 
-@router.get("/{supplier_id}", response_model=SupplierResponse)
+@router.get(
+    "/{supplier_id}",
+    response_model=None,
+    responses={200: {"model": SupplierResponse}},
+)
 async def get_supplier(
     *,
     session: AsyncSession = Depends(get_session),
     supplier_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get supplier by ID."""
+    cache_key = f"{_SUPPLIER_CACHE_PREFIX}detail:{supplier_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     supplier = await supplier_service.get_supplier(
         session=session, supplier_id=supplier_id
     )
@@ -76,62 +133,78 @@ async def get_supplier(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Supplier not found",
         )
-    return SupplierResponse.from_orm(supplier)
+    payload = orjson.dumps(
+        SupplierResponse.model_validate(supplier).model_dump(mode="json")
+    )
+    await cache_set(cache_key, payload, _SUPPLIER_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.put("/{supplier_id}", response_model=SupplierResponse)
 async def update_supplier(
     *,
-    session: AsyncSession = Depends(get_session),
+    supplier_service: SupplierService = Depends(deps.get_supplier_service),
     supplier_id: UUID,
     supplier_in: SupplierUpdate,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Update supplier."""
-    supplier = await supplier_service.get_supplier(
-        session=session, supplier_id=supplier_id
-    )
+    # The service's UPDATE ... RETURNING doubles as the existence check,
+    # so no pre-flight SELECT is needed here
+    supplier = await supplier_service.update_supplier(supplier_id, supplier_in)
     if not supplier:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Supplier not found",
         )
-    
-    supplier = await supplier_service.update_supplier(
-        session=session, supplier=supplier, supplier_in=supplier_in
-    )
-    return SupplierResponse.from_orm(supplier)
+    await cache_clear_prefix(_SUPPLIER_CACHE_PREFIX)
+    return SupplierResponse.model_validate(supplier)
 
 
 @router.delete("/{supplier_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_supplier(
     *,
-    session: AsyncSession = Depends(get_session),
+    supplier_service: SupplierService = Depends(deps.get_supplier_service),
     supplier_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> None:
     """Delete supplier (soft delete)."""
-    supplier = await supplier_service.get_supplier(
-        session=session, supplier_id=supplier_id
-    )
-    if not supplier:
+    # The DELETE's rowcount doubles as the existence check, so no
+    # pre-flight SELECT is needed here
+    deleted = await supplier_service.delete_supplier(supplier_id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Supplier not found",
         )
-    
-    await supplier_service.delete_supplier(session=session, supplier=supplier)
+    await cache_clear_prefix(_SUPPLIER_CACHE_PREFIX)
 
 
-@router.get("/{supplier_id}/performance", response_model=SupplierPerformance)
+@router.get(
+    "/{supplier_id}/performance",
+    response_model=None,
+    responses={200: {"model": SupplierPerformance}},
+)
 async def get_supplier_performance(
     *,
-    session: AsyncSession = Depends(get_session),
+    supplier_service: SupplierService = Depends(deps.get_supplier_service),
     supplier_id: UUID,
-    current_user: dict = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """Get supplier performance metrics."""
-    performance = await supplier_service.get_supplier_performance(
-        session=session, supplier_id=supplier_id
-    )
-    return performance
\ No newline at end of file
+    # Redis holds the rows the refresh task pushed after the last
+    # materialized view refresh; the view itself is the fallback
+    cache_key = f"{SUPPLIER_PERF_CACHE_PREFIX}{supplier_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    performance = await supplier_service.get_supplier_performance(supplier_id)
+    if performance is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Supplier not found",
+        )
+    payload = orjson.dumps(performance, default=str)
+    await cache_set(cache_key, payload, SUPPLIER_PERF_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
\ No newline at end of file
@@ -2,10 +2,11 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_user_service
+from app.core.cache import cache_clear_prefix, cache_get, cache_set
 from app.core.logging import get_logger
 from app.models.user import User
 from app.schemas.user import UserCreate, UserRead, UserUpdate
@@ -16,62 +17,103 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Read-through response cache for user reads. Short TTL keeps staleness
+# bounded; any user mutation clears the whole namespace.
+_USER_CACHE_PREFIX = "usr:"
+_USER_CACHE_TTL = 30
 
-@router.get("/", response_model=List[UserRead])
+
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": List[UserRead]}},
+)
 async def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    after_id: str = None,
+    user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_user),
-) -> List[UserRead]:
+) -> Response:
     """
     Retrieve a list of all users.
-    
+
     This endpoint allows administrators to view all users in the system.
     Regular users can only see their own profile.
-    
+
     Args:
         skip: Number of records to skip for pagination
         limit: Maximum number of records to return
-        db: Database session dependency
+        after_id: Keyset cursor; return users with id greater than this
+        user_service: User service bound to the request's session
         current_user: Currently authenticated user
-        
+
     Returns:
         List of user records
-        
+
     Raises:
         HTTPException: If user lacks permission to view users
     """
     logger.info(f"User {current_user.id} requesting user list")
-    
+
     # Check if user has permission to view all users
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to view users"
         )
-    
-    user_service = UserService(db)
-    users = await user_service.get_users(skip=skip, limit=limit)
-    
+
+    # Cached value is "<cursor>\n<body>": the keyset cursor travels in the
+    # X-Next-Cursor header (the body is a bare array), so it must be stored
+    # with the payload or cache hits would lose pagination. orjson emits no
+    # raw newlines, so splitting on the first one is safe.
+    cache_key = f"{_USER_CACHE_PREFIX}list:{skip}:{limit}:{after_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        # Serve the pre-serialized bytes directly; no SELECT, no Pydantic
+        cursor, _, body = cached.partition(b"\n")
+        headers = {"X-Next-Cursor": cursor.decode()} if cursor else {}
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    users = await user_service.get_users(skip=skip, limit=limit, after_id=after_id)
+
     logger.info(f"Retrieved {len(users)} users")
-    return users
+    payload = orjson.dumps(
+        [UserRead.model_validate(user).model_dump(mode="json") for user in users]
+    )
+    next_cursor = str(users[-1].id) if len(users) == limit else ""
+    await cache_set(cache_key, next_cursor.encode() + b"\n" + payload, _USER_CACHE_TTL)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
-@router.get("/{user_id}", response_model=UserRead)
+@router.get(
+    "/{user_id}",
+    response_model=None,
+    responses={200: {"model": UserRead}},
+)
+@router.get(
+    "/{user_id}/profile",
+    response_model=None,
+    responses={200: {"model": UserRead}},
+)
 async def get_user(
     user_id: str,
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_user),
-) -> UserRead:
+) -> Response:
     """
     Get a specific user by ID.
-    
+
+    Also served at /{user_id}/profile: both routes share this handler, so
+    the alias resolves its dependencies exactly once instead of calling
+    another endpoint function and rebuilding its service.
+
     Users can only view their own profile unless they are administrators.
-    
+
     Args:
         user_id: The ID of the user to retrieve
-        db: Database session dependency
+        user_service: User service bound to the request's session
         current_user: Currently authenticated user
         
     Returns:
@@ -89,24 +131,30 @@ async def get_user(
             detail="Not enough permissions to view this user"
         )
     
-    user_service = UserService(db)
+    cache_key = f"{_USER_CACHE_PREFIX}detail:{user_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     user = await user_service.get_user_by_id(user_id)
-    
+
     if not user:
         logger.warning(f"User {user_id} not found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
+
     logger.info(f"Retrieved user {user_id}")
-    return user
+    payload = orjson.dumps(UserRead.model_validate(user).model_dump(mode="json"))
+    await cache_set(cache_key, payload, _USER_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_user),
 ) -> UserRead:
     """
@@ -116,7 +164,7 @@ async def create_user(
     
     Args:
         user_data: User creation data
-        db: Database session dependency
+        user_service: User service bound to the request's session
         current_user: Currently authenticated user
         
     Returns:
@@ -134,8 +182,6 @@ async def create_user(
             detail="Not enough permissions to create users"
         )
     
-    user_service = UserService(db)
-    
     # Check if user with email already exists
     existing_user = await user_service.get_user_by_email(user_data.email)
     if existing_user:
@@ -147,7 +193,8 @@ async def create_user(
     
     user = await user_service.create_user(user_data)
     logger.info(f"Created new user: {user.id}")
-    
+
+    await cache_clear_prefix(_USER_CACHE_PREFIX)
     return user
 
 
@@ -155,7 +202,7 @@ async def create_user(
 async def update_user(
     user_id: str,
     user_data: UserUpdate,
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_user),
 ) -> UserRead:
     """
@@ -166,7 +213,7 @@ async def update_user(
     Args:
         user_id: The ID of the user to update
         user_data: Updated user data
-        db: Database session dependency
+        user_service: User service bound to the request's session
         current_user: Currently authenticated user
         
     Returns:
@@ -184,26 +231,27 @@ async def update_user(
             detail="Not enough permissions to update this user"
         )
     
-    user_service = UserService(db)
-    user = await user_service.get_user_by_id(user_id)
-    
-    if not user:
+    # The service's UPDATE ... RETURNING doubles as the existence check,
+    # so no pre-flight SELECT is needed here
+    updated_user = await user_service.update_user(user_id, user_data)
+
+    if not updated_user:
         logger.warning(f"Attempt to update non-existent user: {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
-    updated_user = await user_service.update_user(user_id, user_data)
+
     logger.info(f"Updated user: {user_id}")
-    
+
+    await cache_clear_prefix(_USER_CACHE_PREFIX)
     return updated_user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: str,
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_user),
 ) -> None:
     """
@@ -213,7 +261,7 @@ async def delete_user(
     
     Args:
         user_id: The ID of the user to delete
-        db: Database session dependency
+        user_service: User service bound to the request's session
         current_user: Currently authenticated user
         
     Raises:
@@ -235,9 +283,8 @@ async def delete_user(
             detail="Cannot delete your own account"
         )
     
-    user_service = UserService(db)
     user = await user_service.get_user_by_id(user_id)
-    
+
     if not user:
         logger.warning(f"Attempt to delete non-existent user: {user_id}")
         raise HTTPException(
@@ -247,36 +294,14 @@ async def delete_user(
     
     await user_service.delete_user(user_id)
     logger.info(f"Deleted user: {user_id}")
-
-
-@router.get("/{user_id}/profile", response_model=UserRead)
-async def get_user_profile(
-    user_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> UserRead:
-    """
-    Get user profile information.
-    
-    This is an alias for the get_user endpoint with additional
-    profile-specific information.
-    
-    Args:
-        user_id: The ID of the user whose profile to retrieve
-        db: Database session dependency
-        current_user: Currently authenticated user
-        
-    Returns:
-        User profile data
-    """
-    return await get_user(user_id, db, current_user)
+    await cache_clear_prefix(_USER_CACHE_PREFIX)
 
 
 @router.put("/{user_id}/status", response_model=UserRead)
 async def update_user_status(
     user_id: str,
     is_active: bool,
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_user),
 ) -> UserRead:
     """
@@ -287,7 +312,7 @@ async def update_user_status(
     Args:
         user_id: The ID of the user to update
         is_active: New active status
-        db: Database session dependency
+        user_service: User service bound to the request's session
         current_user: Currently authenticated user
         
     Returns:
@@ -305,18 +330,17 @@ async def update_user_status(
             detail="Not enough permissions to update user status"
         )
     
-    user_service = UserService(db)
-    user = await user_service.get_user_by_id(user_id)
-    
-    if not user:
+    # Single guarded UPDATE; a miss means the user does not exist
+    user_data = UserUpdate(is_active=is_active)
+    updated_user = await user_service.update_user(user_id, user_data)
+
+    if not updated_user:
         logger.warning(f"Attempt to update status of non-existent user: {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
-    user_data = UserUpdate(is_active=is_active)
-    updated_user = await user_service.update_user(user_id, user_data)
-    
+
     logger.info(f"Updated user {user_id} status to {is_active}")
+    await cache_clear_prefix(_USER_CACHE_PREFIX)
     return updated_user
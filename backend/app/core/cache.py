@@ -0,0 +1,50 @@
+"""Redis-backed caching helpers."""
+
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Shared client, created on first use; redis-py maintains its own
+# connection pool behind it.
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the shared Redis client, creating it on first call."""
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL)
+    return _redis
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Fetch raw bytes for a key. A cache failure reads as a miss."""
+    try:
+        return await get_redis().get(key)
+    except RedisError as e:
+        logger.warning("Cache get failed for %s: %s", key, e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int) -> None:
+    """Store raw bytes under a key with a TTL. Failures are logged, not raised."""
+    try:
+        await get_redis().set(key, value, ex=ttl)
+    except RedisError as e:
+        logger.warning("Cache set failed for %s: %s", key, e)
+
+
+async def cache_clear_prefix(prefix: str) -> None:
+    """Delete every key under a prefix using SCAN (never the blocking KEYS)."""
+    try:
+        client = get_redis()
+        async for key in client.scan_iter(match=prefix + "*"):
+            await client.delete(key)
+    except RedisError as e:
+        logger.warning("Cache clear failed for prefix %s: %s", prefix, e)
@@ -1,45 +1,128 @@
 """Database connection and session management."""
 
+import asyncio
+from functools import lru_cache
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.config import settings
+from app.core.logging import get_logger
 
+logger = get_logger(__name__)
 
-# Create async engine
-engine = create_async_engine(
-    settings.get_database_url(),
-    echo=settings.DEBUG,
-    future=True,
-    **settings.database_config
-)
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+# Write tracking for the session dependencies: services that write without
+# committing (the unit-of-work pattern used by purchase orders, shipments,
+# suppliers and users) rely on the dependency committing at request end,
+# but read-only requests should not pay a COMMIT round-trip for it.
+# Writes reach the database two ways, and each gets its own listener: a
+# flush of pending ORM state, and ORM-enabled INSERT/UPDATE/DELETE
+# statements run through session.execute() (the RETURNING-style mutations),
+# which never flush and leave new/dirty/deleted empty.
+@event.listens_for(Session, "after_flush")
+def _mark_session_written(session: Session, _flush_context) -> None:
+    session.info["needs_commit"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml_execute(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["needs_commit"] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_session_written(session: Session) -> None:
+    session.info.pop("needs_commit", None)
+
+
+def session_needs_commit(session: AsyncSession) -> bool:
+    """True if the session holds uncommitted writes.
+
+    Covers flushed ORM state and ORM-enabled DML (via the listeners
+    above) plus pending new/dirty/deleted objects that have not flushed
+    yet. Textual DML through text() is not detected - the codebase has
+    none; anything that adds some must commit explicitly.
+    """
+    sync = session.sync_session
+    return bool(
+        sync.info.get("needs_commit") or sync.new or sync.dirty or sync.deleted
+    )
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Process-wide async engine, created on first use.
+
+    Lazy so that importing this module (Celery workers, scripts, alembic
+    helpers) costs nothing; DNS resolution, driver setup and pool
+    construction happen when the first session is actually requested.
+
+    Pool sizing and health checks come from settings.database_config. The
+    pool class is pinned explicitly so a QueuePool misconfiguration can
+    never sneak in through engine defaults. Behind PgBouncer, pooling is
+    server-side and a client-side pool on top would only hold sockets
+    hostage, so NullPool is used instead.
+    """
+    return create_async_engine(
+        settings.get_database_url(),
+        future=True,
+        poolclass=NullPool if settings.PGBOUNCER_URL else AsyncAdaptedQueuePool,
+        **settings.database_config
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Process-wide session factory, created on first use.
+
+    expire_on_commit=False keeps ORM attributes readable after commit, so
+    handlers never need a refresh SELECT just to return the object they
+    already hold.
+    """
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+def __getattr__(name: str):
+    # Lazy module attributes so existing `from app.core.database import
+    # engine` / `AsyncSessionLocal` call sites keep working without forcing
+    # engine creation at import time.
+    if name == "engine":
+        return get_engine()
+    if name == "AsyncSessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions.
-    
+
     Yields:
         AsyncSession: Database session for dependency injection
     """
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         try:
             yield session
-            await session.commit()
+            # Commit only when the request actually wrote something;
+            # read-only requests skip the COMMIT round-trip entirely
+            if session_needs_commit(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -47,12 +130,50 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Dependency name used by the products/inventory endpoints. Both names
+# resolve to the same sessionmaker and therefore the same pool -- a second
+# engine here would silently halve effective pool capacity.
+get_session = get_db_session
+
+
+async def warm_pool(count: int = None) -> None:
+    """
+    Pre-open pooled connections so early requests skip the handshake.
+
+    SQLAlchemy's pool has no min_size: connections are created lazily, so
+    after a deploy the first burst of requests each pays the full TCP/auth
+    handshake. Checking out `count` connections concurrently and releasing
+    them leaves that many warm in the pool. Failures only log -- a slow or
+    briefly unavailable database must not break startup.
+    """
+    if settings.PGBOUNCER_URL:
+        # NullPool: there is nothing client-side to warm, and PgBouncer
+        # keeps its own server connections hot
+        return
+    if count is None:
+        count = settings.MIN_POOL_SIZE
+    try:
+        engine = get_engine()
+        connections = await asyncio.gather(
+            *[engine.connect() for _ in range(count)]
+        )
+        for conn in connections:
+            await conn.close()
+        logger.info("Pre-warmed %s database connections", count)
+    except Exception as e:
+        logger.warning("Connection pool pre-warm failed: %s", e)
+
+
 async def create_tables():
     """Create all database tables."""
     # Import Base from models to ensure all models are registered
     from app.models import Base
-    
-    async with engine.begin() as conn:
+    from sqlalchemy import text
+
+    async with get_engine().begin() as conn:
+        # Bound DDL lock waits so background schema setup cannot block
+        # indefinitely behind a long-running transaction
+        await conn.execute(text("SET lock_timeout = '5s'"))
         await conn.run_sync(Base.metadata.create_all)
 
 
@@ -60,6 +181,6 @@ async def drop_tables():
     """Drop all database tables."""
     # Import Base from models to ensure all models are registered
     from app.models import Base
-    
-    async with engine.begin() as conn:
+
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
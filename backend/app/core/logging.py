@@ -2,11 +2,53 @@
 
 import logging
 import logging.config
+import queue
 import sys
-from typing import Dict, Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional
 
 from app.core.config import settings
 
+# Per-record introspection switches from the logging module's documented
+# optimization list. Collecting caller info walks the stack with
+# sys._getframe on every record - even ones a handler later drops - and
+# thread/process lookups add syscalls per record. None of the formatters
+# below use those fields, and errors still carry full tracebacks via
+# exc_info, so all of it is switched off.
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+def _build_json_formatter(format: Optional[str] = None, **kwargs: Any) -> logging.Formatter:
+    """Factory for the production JSON formatter.
+
+    pythonjsonlogger is imported here rather than at module top so that
+    development setups - where the json formatter is never configured -
+    do not pay its import cost; dictConfig only calls this factory when
+    the formatter entry actually exists.
+    """
+    from pythonjsonlogger import jsonlogger
+
+    try:
+        import orjson
+
+        class OrjsonFormatter(jsonlogger.JsonFormatter):
+            """JsonFormatter that serializes records with orjson instead of stdlib json."""
+
+            def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+                return orjson.dumps(log_record, default=str).decode()
+
+        return OrjsonFormatter(format, **kwargs)
+    except ImportError:  # pragma: no cover - orjson is in requirements
+        return jsonlogger.JsonFormatter(format, **kwargs)
+
+
+# Background listener draining the logging queue; started by setup_logging,
+# stopped by shutdown_logging on application exit.
+_QUEUE_LISTENER: Optional[QueueListener] = None
+
 
 def setup_logging() -> None:
     """
@@ -16,10 +58,11 @@ def setup_logging() -> None:
     and handlers based on the environment (development vs production).
     """
     
-    # Define log format
+    # Define log format. Frame fields (%(filename)s/%(funcName)s) are
+    # deliberately absent: populating them requires per-record stack
+    # walking, which is disabled module-wide above.
     log_format = (
-        "%(asctime)s - %(name)s - %(levelname)s - "
-        "%(filename)s:%(lineno)d - %(funcName)s - %(message)s"
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
     # Simple format for development
@@ -37,10 +80,6 @@ def setup_logging() -> None:
                 "format": formatter,
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
-            "json": {
-                "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-                "format": "%(asctime)s %(name)s %(levelname)s %(filename)s %(lineno)d %(funcName)s %(message)s",
-            },
         },
         "handlers": {
             "console": {
@@ -49,14 +88,6 @@ def setup_logging() -> None:
                 "formatter": "standard",
                 "stream": sys.stdout,
             },
-            "file": {
-                "level": settings.LOG_LEVEL,
-                "class": "logging.handlers.RotatingFileHandler",
-                "formatter": "json" if settings.ENVIRONMENT == "production" else "standard",
-                "filename": "logs/app.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
-            },
         },
         "loggers": {
             "": {  # Root logger
@@ -92,17 +123,56 @@ def setup_logging() -> None:
         },
     }
     
-    # Create logs directory if it doesn't exist (only in production)
+    # The json formatter and rotating file handler only exist in
+    # production: dictConfig instantiates every configured formatter and
+    # handler up front, so declaring them unconditionally would import
+    # pythonjsonlogger and open the log file in development too.
     if settings.ENVIRONMENT == "production":
         import os
         os.makedirs("logs", exist_ok=True)
-    
+        logging_config["formatters"]["json"] = {
+            "()": "app.core.logging._build_json_formatter",
+            "format": "%(asctime)s %(name)s %(levelname)s %(message)s",
+        }
+        logging_config["handlers"]["file"] = {
+            "level": settings.LOG_LEVEL,
+            "class": "logging.handlers.RotatingFileHandler",
+            "formatter": "json",
+            "filename": "logs/app.log",
+            "maxBytes": 10485760,  # 10MB
+            "backupCount": 5,
+        }
+
     # Apply logging configuration
     logging.config.dictConfig(logging_config)
-    
+
+    # Move handler I/O off the request path: the app loggers enqueue records
+    # (a lock-free put from the event loop's perspective) and a background
+    # listener thread pays for formatting and stream/file writes.
+    global _QUEUE_LISTENER
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    app_logger = logging.getLogger("app")
+    real_handlers = list(app_logger.handlers)
+    app_logger.handlers = [QueueHandler(log_queue)]
+    _QUEUE_LISTENER = QueueListener(
+        log_queue, *real_handlers, respect_handler_level=True
+    )
+    _QUEUE_LISTENER.start()
+
     # Get logger for this module
     logger = logging.getLogger("app.core.logging")
-    logger.info(f"Logging configured for {settings.ENVIRONMENT} environment with level {settings.LOG_LEVEL}")
+    logger.info("Logging configured for %s environment with level %s", settings.ENVIRONMENT, settings.LOG_LEVEL)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background logging listener."""
+    global _QUEUE_LISTENER
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+        _QUEUE_LISTENER = None
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -118,9 +188,13 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(f"app.{name}")
 
 
-# Structured logging helpers
+# Structured logging helpers. Each one checks isEnabledFor before building
+# its payload so a raised log level skips the dict and string work entirely.
 def log_api_request(logger: logging.Logger, method: str, path: str, user_id: str = None) -> None:
     """Log API request with structured data."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     extra_data = {
         "event_type": "api_request",
         "method": method,
@@ -128,12 +202,15 @@ def log_api_request(logger: logging.Logger, method: str, path: str, user_id: str
     }
     if user_id:
         extra_data["user_id"] = user_id
-    
-    logger.info(f"API Request: {method} {path}", extra=extra_data)
+
+    logger.info("API Request: %s %s", method, path, extra=extra_data)
 
 
 def log_database_operation(logger: logging.Logger, operation: str, table: str, record_id: str = None) -> None:
     """Log database operation with structured data."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     extra_data = {
         "event_type": "database_operation",
         "operation": operation,
@@ -141,12 +218,16 @@ def log_database_operation(logger: logging.Logger, operation: str, table: str, r
     }
     if record_id:
         extra_data["record_id"] = record_id
-    
-    logger.info(f"Database {operation} on {table}", extra=extra_data)
+
+    logger.info("Database %s on %s", operation, table, extra=extra_data)
 
 
 def log_authentication_event(logger: logging.Logger, event: str, user_id: str = None, success: bool = True) -> None:
     """Log authentication events with structured data."""
+    level = logging.INFO if success else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
+
     extra_data = {
         "event_type": "authentication",
         "auth_event": event,
@@ -154,13 +235,15 @@ def log_authentication_event(logger: logging.Logger, event: str, user_id: str =
     }
     if user_id:
         extra_data["user_id"] = user_id
-    
-    level = logger.info if success else logger.warning
-    level(f"Authentication {event}: {'Success' if success else 'Failed'}", extra=extra_data)
+
+    logger.log(level, "Authentication %s: %s", event, "Success" if success else "Failed", extra=extra_data)
 
 
 def log_error_with_context(logger: logging.Logger, error: Exception, context: Dict[str, Any] = None) -> None:
     """Log error with additional context."""
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+
     extra_data = {
         "event_type": "error",
         "error_type": type(error).__name__,
@@ -168,5 +251,5 @@ def log_error_with_context(logger: logging.Logger, error: Exception, context: Di
     }
     if context:
         extra_data.update(context)
-    
-    logger.error(f"Error occurred: {error}", extra=extra_data, exc_info=True)
+
+    logger.error("Error occurred: %s", error, extra=extra_data, exc_info=True)
@@ -1,7 +1,22 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: argon2id is the primary scheme; bcrypt stays registered
+# so existing hashes keep verifying and are upgraded on the next successful
+# login (see AuthService.authenticate_user).
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated=["bcrypt"])
+
+# Hashing is CPU-bound (~100 ms per bcrypt verify); run it on this pool so
+# the event loop keeps serving other requests during authentication.
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Verified against when the user does not exist, so the unknown-email path
+# burns the same hashing cost as a real verification and login timing does
+# not reveal which emails are registered.
+DUMMY_HASH = pwd_context.hash("dummy-password-for-timing")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -9,4 +24,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
-    return pwd_context.hash(password) 
\ No newline at end of file
+    return pwd_context.hash(password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether the stored hash uses a deprecated scheme (e.g. bcrypt)."""
+    return pwd_context.needs_update(hashed_password)
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
+
+async def aget_password_hash(password: str) -> str:
+    """Hash a password off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _HASH_POOL, get_password_hash, password
+    )
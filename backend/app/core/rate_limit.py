@@ -0,0 +1,49 @@
+"""In-process sliding-window rate limiting for expensive endpoints."""
+
+import time
+from collections import deque
+from typing import Deque, Dict
+
+from fastapi import HTTPException, status
+
+# One deque of event timestamps per key. Uvicorn handlers run on a single
+# event loop and the deque operations never await, so no lock is needed.
+# Bounded the same way as the token/user caches: evict stale buckets when
+# full, clear as a last resort.
+_BUCKETS: Dict[str, Deque[float]] = {}
+_BUCKETS_MAX = 10000
+
+
+def check_rate_limit(key: str, limit: int, window: float = 60.0) -> None:
+    """
+    Record an event for ``key`` and raise 429 once ``limit`` events have
+    occurred within the last ``window`` seconds.
+
+    Called before any database or hashing work so throttled callers hit the
+    cheapest possible path.
+    """
+    now = time.time()
+    bucket = _BUCKETS.get(key)
+    if bucket is None:
+        if len(_BUCKETS) >= _BUCKETS_MAX:
+            cutoff = now - window
+            stale = [k for k, q in _BUCKETS.items() if not q or q[-1] <= cutoff]
+            for k in stale:
+                del _BUCKETS[k]
+            if len(_BUCKETS) >= _BUCKETS_MAX:
+                _BUCKETS.clear()
+        bucket = _BUCKETS[key] = deque()
+
+    cutoff = now - window
+    while bucket and bucket[0] <= cutoff:
+        bucket.popleft()
+
+    if len(bucket) >= limit:
+        retry_after = int(bucket[0] - cutoff) + 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    bucket.append(now)
@@ -1,10 +1,11 @@
 import logging
 from typing import Any
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.password import aget_password_hash
 from app.models.user import User, UserRole
 from app.models.category import Category
 from app.models.supplier import Supplier, SupplierCategory, SupplierStatus
@@ -28,10 +29,11 @@ async def init_db(db: AsyncSession) -> None:
         logger.info("Created initial suppliers")
 
 async def create_admin_user(db: AsyncSession) -> User | None:
-    # Check if admin user already exists
+    # Check if admin user already exists. Selecting only the id keeps the
+    # probe to an index-only lookup, and the compiled statement lands in
+    # the engine's query cache like every other ORM select.
     result = await db.execute(
-        "SELECT id FROM users WHERE email = :email",
-        {"email": "admin@example.com"}
+        select(User.id).where(User.email == "admin@example.com")
     )
     if result.scalar_one_or_none():
         return None
@@ -39,7 +41,7 @@ async def create_admin_user(db: AsyncSession) -> User | None:
     # Create admin user
     admin = User(
         email="admin@example.com",
-        hashed_password=get_password_hash("admin123"),  # Change in production
+        hashed_password=await aget_password_hash("admin123"),  # Change in production
         full_name="System Administrator",
         role=UserRole.ADMIN,
         is_active=True,
@@ -47,12 +49,11 @@ async def create_admin_user(db: AsyncSession) -> User | None:
     )
     db.add(admin)
     await db.commit()
-    await db.refresh(admin)
     return admin
 
 async def create_initial_categories(db: AsyncSession) -> list[Category]:
     # Check if categories already exist
-    result = await db.execute("SELECT COUNT(*) FROM category")
+    result = await db.execute(select(func.count()).select_from(Category))
     if result.scalar_one() > 0:
         return []
 
@@ -68,17 +69,16 @@ async def create_initial_categories(db: AsyncSession) -> list[Category]:
         Category(name="Services", description="Professional and technical services")
     ]
 
-    for category in categories:
-        db.add(category)
+    # Single add_all + commit: the ORM batches the INSERTs into one
+    # executemany flush, and the session's expire_on_commit=False means
+    # no per-row re-SELECT is needed afterwards
+    db.add_all(categories)
     await db.commit()
-
-    for category in categories:
-        await db.refresh(category)
     return categories
 
 async def create_initial_suppliers(db: AsyncSession) -> list[Supplier]:
     # Check if suppliers already exist
-    result = await db.execute("SELECT COUNT(*) FROM supplier")
+    result = await db.execute(select(func.count()).select_from(Supplier))
     if result.scalar_one() > 0:
         return []
 
@@ -119,10 +119,6 @@ async def create_initial_suppliers(db: AsyncSession) -> list[Supplier]:
         )
     ]
 
-    for supplier in suppliers:
-        db.add(supplier)
+    db.add_all(suppliers)
     await db.commit()
-
-    for supplier in suppliers:
-        await db.refresh(supplier)
     return suppliers 
\ No newline at end of file
@@ -4,23 +4,27 @@ from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import AsyncSessionLocal
+from app.core.database import get_sessionmaker, session_needs_commit
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions.
-    
+
     This function provides database sessions for FastAPI dependency injection.
-    It ensures proper session lifecycle management with automatic commit/rollback.
-    
+    It ensures proper session lifecycle management with automatic rollback on
+    error. The closing commit is conditional: flush-only services get their
+    unit of work committed here, while read-only requests release the
+    connection without a COMMIT round-trip.
+
     Yields:
         AsyncSession: Database session for use in API endpoints
     """
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         try:
             yield session
-            await session.commit()
+            if session_needs_commit(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
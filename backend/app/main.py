@@ -1,5 +1,6 @@
 """FastAPI application main module with enhanced logging."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 import time
@@ -8,7 +9,7 @@ import uuid
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.gzip import GZipMiddleware
@@ -17,33 +18,55 @@ from pydantic import ValidationError
 # Import our modules
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.core.database import engine, create_tables
-from app.core.logging import setup_logging, get_logger
+from app.core.database import create_tables, get_engine, warm_pool
+from app.core.logging import setup_logging, shutdown_logging, get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
 
+async def _run_schema_setup(app: FastAPI) -> None:
+    """
+    Create/verify database tables in the background.
+
+    Runs as an asyncio task during startup so the app can begin accepting
+    traffic immediately; /health reports 503 until the schema is ready.
+    """
+    try:
+        await create_tables()
+        app.state.schema_ready = True
+        logger.info("Database tables created/verified")
+    except Exception as e:
+        app.state.schema_error = str(e)
+        logger.error(f"Failed to create database tables: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Application lifespan manager.
-    
+
     This function handles startup and shutdown events for the FastAPI application.
     It sets up logging, initializes the database, and handles cleanup.
     """
     # Startup
     logger.info("Starting up Procurement Management System")
     setup_logging()
-    
-    # Create database tables if needed (only in development)
+    settings.log_summary()
+
+    # Create database tables if needed (only in development). This runs as
+    # a background task instead of blocking startup, so rolling deploys do
+    # not serialize behind multi-second DDL before serving the first request.
+    app.state.schema_ready = settings.ENVIRONMENT != "development"
+    app.state.schema_error = None
+    schema_task = None
     if settings.ENVIRONMENT == "development":
-        try:
-            await create_tables()
-            logger.info("Database tables created/verified")
-        except Exception as e:
-            logger.error(f"Failed to create database tables: {e}")
-    
+        schema_task = asyncio.create_task(_run_schema_setup(app))
+
+    # Pre-open pooled connections in the background so the first burst of
+    # requests does not each pay a connection handshake
+    warm_task = asyncio.create_task(warm_pool())
+
     # Setup monitoring for production
     if settings.ENVIRONMENT == "production":
         try:
@@ -59,13 +82,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info("Shutting down Procurement Management System")
+    if schema_task is not None and not schema_task.done():
+        schema_task.cancel()
+    if not warm_task.done():
+        warm_task.cancel()
     try:
-        await engine.dispose()
+        await get_engine().dispose()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
     
     logger.info("Application shutdown complete")
+    shutdown_logging()
 
 
 def create_application() -> FastAPI:
@@ -91,6 +119,9 @@ def create_application() -> FastAPI:
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
         lifespan=lifespan,
+        # orjson for every response that is not already pre-serialized;
+        # routers that set their own default keep it
+        default_response_class=ORJSONResponse,
     )
 
     # Add request/response logging middleware
@@ -171,17 +202,17 @@ def create_application() -> FastAPI:
     application.add_middleware(GZipMiddleware, minimum_size=1000)
     logger.debug("GZip compression middleware enabled")
     
-    # Add CORS middleware with detailed logging
+    # Add CORS middleware with detailed logging. Origins are already
+    # validated and normalized to plain strings at settings load time.
     if settings.BACKEND_CORS_ORIGINS:
-        cors_origins = [str(origin) for origin in settings.BACKEND_CORS_ORIGINS]
         application.add_middleware(
             CORSMiddleware,
-            allow_origins=cors_origins,
+            allow_origins=settings.BACKEND_CORS_ORIGINS,
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
         )
-        logger.info(f"CORS middleware enabled for origins: {cors_origins}")
+        logger.info(f"CORS middleware enabled for origins: {settings.BACKEND_CORS_ORIGINS}")
 
     # Include API routers
     application.include_router(api_router, prefix=settings.API_V1_STR)
@@ -196,6 +227,20 @@ def create_application() -> FastAPI:
         Returns:
             dict: Health status information
         """
+        # Report 503 while the background schema setup is still running so
+        # load balancers hold traffic until the database is usable
+        if not getattr(application.state, "schema_ready", True):
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "status": "starting",
+                    "service": "procurement-backend",
+                    "version": "1.0.0",
+                    "environment": settings.ENVIRONMENT,
+                    "database": application.state.schema_error or "schema setup in progress",
+                },
+            )
+
         try:
             # Test database connection
             from app.db.session import get_db
@@ -354,5 +399,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower()
+        log_level=settings.LOG_LEVEL.lower(),
+        # uvloop's event loop cuts per-request scheduling overhead versus
+        # asyncio's default; uvicorn picks it up automatically when
+        # installed, pinning it here keeps dev runs on the same loop as
+        # production
+        loop="uvloop",
     )
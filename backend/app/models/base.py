@@ -2,13 +2,49 @@
 
 import uuid
 from datetime import datetime
-from typing import Any
+from enum import IntEnum
+from typing import Any, Optional
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, SmallInteger, TypeDecorator, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+class CodedStatus(TypeDecorator):
+    """String status labels stored as SMALLINT codes.
+
+    The schema keeps 2-byte integer codes (see the *Code IntEnums defined
+    next to each model) while the application continues to read and write
+    the readable string labels. Code members are named after the
+    upper-cased label, so the mapping is derived from the IntEnum alone;
+    metadata-created schemas emit the same SMALLINT columns as the
+    initial migration.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, code_enum: type[IntEnum]):
+        super().__init__()
+        self.code_enum = code_enum
+        self._to_code = {member.name.lower(): int(member) for member in code_enum}
+        self._to_label = {int(member): member.name.lower() for member in code_enum}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return int(value)
+        # Unknown labels bind to -1: filters match no row and writes trip
+        # the status CHECK constraint instead of storing garbage
+        return self._to_code.get(str(value), -1)
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return self._to_label.get(value)
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     
@@ -31,6 +67,12 @@ class Base(DeclarativeBase):
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
+        # The set_updated_at BEFORE UPDATE trigger (initial migration)
+        # maintains this server-side, but only migrated databases have it;
+        # create_tables installs no triggers, so the ORM onupdate stays as
+        # the fallback for app-bootstrapped schemas (weak_etag keys on
+        # this column and must see every change). The trigger fires last
+        # and simply overwrites the ORM value where both exist.
         onupdate=func.now(),
         comment="Timestamp when record was last updated"
     )
@@ -4,7 +4,17 @@ from datetime import datetime
 from typing import List, Optional
 import uuid
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    cast,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import false
@@ -47,6 +57,9 @@ class Category(Base):
     # Hierarchy fields
     parent_id: Mapped[Optional[str]] = mapped_column(
         UUID(as_uuid=False),
+        # Named to match the migration's constraint: create_category maps
+        # IntegrityError messages on fk_category_parent to a 400
+        ForeignKey("categories.id", name="fk_category_parent"),
         nullable=True,
         index=True,
         comment="Parent category ID for hierarchy"
@@ -155,3 +168,16 @@ class Category(Base):
         if parent_level is not None:
             return parent_level + 1
         return 0 if self.is_root_category() else 1
+
+
+# Same definition as the ux_cat_name_parent migration, so app-bootstrapped
+# (create_all) schemas enforce case-insensitive (name, parent) uniqueness
+# too; COALESCE folds NULL parent_ids into one bucket so root categories
+# are also deduplicated. create_category relies on this index rejecting
+# the duplicate instead of a racy pre-check SELECT.
+Index(
+    "ux_cat_name_parent",
+    func.lower(Category.name),
+    func.coalesce(cast(Category.parent_id, Text), ""),
+    unique=True,
+)
@@ -1,12 +1,21 @@
 from datetime import datetime
 from decimal import Decimal
+from enum import IntEnum
 from typing import List
 from uuid import UUID
 
 from sqlalchemy import String, Integer, Numeric, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, CodedStatus
+
+class InventoryAdjustmentTypeCode(IntEnum):
+    """Numeric codes as stored in inventoryadjustment.adjustment_type (SMALLINT)."""
+    RECEIPT = 0
+    ISSUE = 1
+    ADJUSTMENT = 2
+    RETURN = 3
+    DAMAGE = 4
 
 class InventoryAdjustmentType(str, SQLEnum):
     RECEIPT = "receipt"
@@ -42,7 +51,9 @@ class Inventory(Base):
 class InventoryAdjustment(Base):
     inventory_id: Mapped[UUID] = mapped_column(ForeignKey("inventory.id"), nullable=False)
     adjusted_by_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
-    adjustment_type: Mapped[InventoryAdjustmentType] = mapped_column(SQLEnum(InventoryAdjustmentType), nullable=False)
+    adjustment_type: Mapped[str] = mapped_column(
+        CodedStatus(InventoryAdjustmentTypeCode), nullable=False
+    )
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     unit_cost: Mapped[Decimal] = mapped_column(Numeric(15, 4), nullable=False)
     reference_number: Mapped[str | None] = mapped_column(String(100), nullable=True)
@@ -1,12 +1,23 @@
 from datetime import datetime
 from decimal import Decimal
+from enum import IntEnum
 from typing import List
 from uuid import UUID
 
 from sqlalchemy import String, Numeric, JSON, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, CodedStatus
+
+class PurchaseOrderStatusCode(IntEnum):
+    """Numeric status codes as stored in purchaseorder.status (SMALLINT)."""
+    DRAFT = 0
+    PENDING_APPROVAL = 1
+    APPROVED = 2
+    ORDERED = 3
+    PARTIALLY_RECEIVED = 4
+    RECEIVED = 5
+    CANCELLED = 6
 
 class PurchaseOrderStatus(str, SQLEnum):
     DRAFT = "draft"
@@ -26,8 +37,8 @@ class PurchaseOrder(Base):
     po_number: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False)
     supplier_id: Mapped[UUID] = mapped_column(ForeignKey("supplier.id"), nullable=False)
     created_by_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
-    status: Mapped[PurchaseOrderStatus] = mapped_column(
-        SQLEnum(PurchaseOrderStatus),
+    status: Mapped[str] = mapped_column(
+        CodedStatus(PurchaseOrderStatusCode),
         default=PurchaseOrderStatus.DRAFT,
         nullable=False
     )
@@ -1,12 +1,22 @@
 from datetime import datetime
 from decimal import Decimal
+from enum import IntEnum
 from typing import List
 from uuid import UUID
 
 from sqlalchemy import String, Numeric, JSON, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, CodedStatus
+
+class ShipmentStatusCode(IntEnum):
+    """Numeric status codes as stored in shipment.status (SMALLINT)."""
+    PENDING = 0
+    IN_TRANSIT = 1
+    DELIVERED = 2
+    PARTIALLY_DELIVERED = 3
+    CANCELLED = 4
+    EXCEPTION = 5
 
 class ShipmentStatus(str, SQLEnum):
     PENDING = "pending"
@@ -29,8 +39,8 @@ class Shipment(Base):
     carrier: Mapped[str] = mapped_column(String(100), nullable=False)
     tracking_number: Mapped[str | None] = mapped_column(String(100), nullable=True)
     shipment_type: Mapped[ShipmentType] = mapped_column(SQLEnum(ShipmentType), nullable=False)
-    status: Mapped[ShipmentStatus] = mapped_column(
-        SQLEnum(ShipmentStatus),
+    status: Mapped[str] = mapped_column(
+        CodedStatus(ShipmentStatusCode),
         default=ShipmentStatus.PENDING,
         nullable=False
     )
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import false
 
@@ -20,6 +21,17 @@ class UserRole(str, Enum):
     VIEWER = "viewer"
 
 
+# Permission bits combined into User.perm_bits so authorization checks
+# reduce to a single integer AND instead of repeated attribute lookups
+PERM_ACTIVE = 1
+PERM_MANAGER = 2
+PERM_ADMIN = 4
+PERM_SUPERUSER = 8
+
+# Roles that carry the manager permission bit
+_MANAGER_ROLES: frozenset[str] = frozenset({"manager", UserRole.PROCUREMENT_MANAGER.value})
+
+
 class User(Base):
     """
     User model for authentication and authorization.
@@ -85,6 +97,36 @@ class User(Base):
     )
     
     # Helper properties
+    @cached_property
+    def perm_bits(self) -> int:
+        """
+        Permission bitmask computed once per loaded instance.
+
+        Collapses the is_active/is_admin/role checks used by the API
+        dependencies into a single integer, so authorization becomes one
+        AND operation instead of several instrumented-attribute reads.
+        Cached for the lifetime of the instance (i.e., the request).
+        """
+        bits = 0
+        if self.is_active:
+            bits |= PERM_ACTIVE
+        if self.is_admin:
+            bits |= PERM_ADMIN | PERM_SUPERUSER
+        if self.role in _MANAGER_ROLES:
+            bits |= PERM_MANAGER
+        return bits
+
+    @cached_property
+    def can_manage_categories(self) -> bool:
+        """
+        Whether the user may create/update categories.
+
+        Computed once per loaded instance from perm_bits, replacing the
+        per-request list allocation and linear role scan in the category
+        endpoints.
+        """
+        return bool(self.perm_bits & (PERM_ADMIN | PERM_MANAGER))
+
     @property
     def is_superuser(self) -> bool:
         """Check if user is a superuser (alias for is_admin)."""
@@ -196,3 +238,9 @@ class User(Base):
     def __str__(self) -> str:
         """Human-readable string representation."""
         return f"{self.full_name or self.email} ({self.role})"
+
+
+# Same definition as the ix_user_email_lower migration, so databases
+# bootstrapped via create_all also serve the lower(email) login lookup
+# from an index scan and enforce case-insensitive email uniqueness.
+Index("ix_user_email_lower", func.lower(User.email), unique=True)
@@ -1,4 +1,10 @@
-"""Schemas package with all Pydantic models for API serialization."""
+"""Schemas package with all Pydantic models for API serialization.
+
+Modules in this package call model_rebuild() on their response schemas at
+import time: Pydantic defers core-schema construction until first
+validation, and paying that cost during startup instead keeps it off the
+first request.
+"""
 
 from app.schemas.user import (
     UserBase,
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 class LoginRequest(BaseModel):
@@ -10,6 +10,12 @@ class LoginRequest(BaseModel):
     email: EmailStr = Field(..., description="User's email address")
     password: str = Field(..., min_length=1, description="User's password")
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Lowercase email so lookups hit the lower(email) index."""
+        return v.lower()
+
 
 class LoginResponse(BaseModel):
     """Schema for successful login response."""
@@ -20,6 +26,13 @@ class LoginResponse(BaseModel):
     user: dict = Field(..., description="User information")
 
 
+class Token(BaseModel):
+    """Schema for an issued access/refresh token pair."""
+    access_token: str = Field(..., description="JWT access token")
+    refresh_token: str = Field(..., description="JWT refresh token")
+    token_type: str = Field(default="bearer", description="Token type")
+
+
 class TokenRefreshRequest(BaseModel):
     """Schema for token refresh request."""
     refresh_token: str = Field(..., description="Valid refresh token")
@@ -86,8 +99,7 @@ class AuthUser(BaseModel):
     is_active: bool = Field(..., description="Whether the user is active")
     is_admin: bool = Field(..., description="Whether the user has admin privileges")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChangePasswordRequest(BaseModel):
@@ -128,3 +140,11 @@ class UpdateProfileResponse(BaseModel):
     """Schema for profile update response."""
     message: str = Field(..., description="Profile update success message")
     user: AuthUser = Field(..., description="Updated user information")
+
+
+# Built eagerly at import (see package docstring)
+AuthUser.model_rebuild()
+
+# Names used by the API and service layers
+UserLogin = LoginRequest
+UserRegister = RegisterRequest
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CategoryBase(BaseModel):
@@ -37,8 +37,7 @@ class CategoryRead(CategoryBase):
     created_at: datetime = Field(..., description="When the category was created")
     updated_at: Optional[datetime] = Field(None, description="When the category was last updated")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoryWithChildren(CategoryRead):
@@ -57,10 +56,10 @@ class CategorySummary(BaseModel):
     name: str = Field(..., description="Category name")
     path: str = Field(..., description="Full path from root to this category")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Update forward references
+CategoryRead.model_rebuild()
 CategoryWithChildren.model_rebuild()
 CategoryTree.model_rebuild()
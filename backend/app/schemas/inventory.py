@@ -1,6 +1,6 @@
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, conint, condecimal
+from pydantic import BaseModel, condecimal, ConfigDict, conint
 from decimal import Decimal
 
 class InventoryBase(BaseModel):
@@ -24,8 +24,7 @@ class InventoryResponse(InventoryBase):
     last_restock_date: Optional[datetime] = None
     last_count_date: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class InventoryAdjustmentBase(BaseModel):
     inventory_id: int
@@ -45,8 +44,7 @@ class InventoryAdjustmentResponse(InventoryAdjustmentBase):
     previous_quantity: int
     new_quantity: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class InventoryCount(BaseModel):
     inventory_id: int
@@ -60,5 +58,9 @@ class InventoryCountResponse(InventoryCount):
     system_quantity: int
     difference: int
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
+
+# Built eagerly at import (see package docstring)
+InventoryResponse.model_rebuild()
+InventoryAdjustmentResponse.model_rebuild()
+InventoryCountResponse.model_rebuild()
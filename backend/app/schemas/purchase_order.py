@@ -1,6 +1,6 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, conint, condecimal
+from pydantic import BaseModel, condecimal, ConfigDict, conint
 from decimal import Decimal
 
 class PurchaseOrderItemBase(BaseModel):
@@ -22,8 +22,7 @@ class PurchaseOrderItemResponse(PurchaseOrderItemBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class PurchaseOrderBase(BaseModel):
     supplier_id: int
@@ -37,19 +36,25 @@ class PurchaseOrderCreate(PurchaseOrderBase):
 class PurchaseOrderUpdate(PurchaseOrderBase):
     pass
 
-class PurchaseOrderResponse(PurchaseOrderBase):
+class PurchaseOrderRow(PurchaseOrderBase):
+    """Scalar columns of a purchase order, without the collections.
+
+    What the NDJSON streaming list path emits: its query deliberately
+    eager-loads nothing, so items/status_history are not available there.
+    """
     id: int
     order_number: str
     total_amount: Decimal
     created_by: int
     created_at: datetime
     updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class PurchaseOrderResponse(PurchaseOrderRow):
     items: List[PurchaseOrderItemResponse]
     status_history: List[dict]
 
-    class Config:
-        from_attributes = True
-
 class PurchaseOrderApproval(BaseModel):
     purchase_order_id: int
     status: str
@@ -60,5 +65,10 @@ class PurchaseOrderApprovalResponse(PurchaseOrderApproval):
     approved_by: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
+
+# Built eagerly at import (see package docstring)
+PurchaseOrderItemResponse.model_rebuild()
+PurchaseOrderRow.model_rebuild()
+PurchaseOrderResponse.model_rebuild()
+PurchaseOrderApprovalResponse.model_rebuild()
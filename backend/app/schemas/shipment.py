@@ -1,6 +1,6 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, conint, constr
+from pydantic import BaseModel, ConfigDict, conint, constr
 
 class ShipmentItemBase(BaseModel):
     purchase_order_item_id: int
@@ -19,8 +19,7 @@ class ShipmentItemResponse(ShipmentItemBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ShipmentDocumentBase(BaseModel):
     document_type: str  # invoice, packing_slip, customs_document, etc.
@@ -41,8 +40,7 @@ class ShipmentDocumentResponse(ShipmentDocumentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ShipmentBase(BaseModel):
     purchase_order_id: int
@@ -61,21 +59,34 @@ class ShipmentCreate(ShipmentBase):
 class ShipmentUpdate(ShipmentBase):
     pass
 
-class ShipmentResponse(ShipmentBase):
+class ShipmentRow(ShipmentBase):
+    """Scalar columns of a shipment, without the collections.
+
+    What the NDJSON streaming list path emits: its query deliberately
+    eager-loads nothing, so items/documents/status_history are not
+    available there.
+    """
     id: int
     shipment_number: str
     created_by: int
     created_at: datetime
     updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ShipmentResponse(ShipmentRow):
     items: List[ShipmentItemResponse]
     documents: List[ShipmentDocumentResponse]
     status_history: List[dict]
 
-    class Config:
-        from_attributes = True
-
 class ShipmentStatusUpdate(BaseModel):
     status: str
     notes: Optional[str] = None
     location: Optional[str] = None
-    timestamp: Optional[datetime] = None 
\ No newline at end of file
+    timestamp: Optional[datetime] = None 
+
+# Built eagerly at import (see package docstring)
+ShipmentItemResponse.model_rebuild()
+ShipmentDocumentResponse.model_rebuild()
+ShipmentRow.model_rebuild()
+ShipmentResponse.model_rebuild()
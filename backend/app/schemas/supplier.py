@@ -1,6 +1,7 @@
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, constr
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, constr, EmailStr
 
 class SupplierContactBase(BaseModel):
     name: str
@@ -21,8 +22,7 @@ class SupplierContactResponse(SupplierContactBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class SupplierAddressBase(BaseModel):
     address_line1: str
@@ -46,8 +46,7 @@ class SupplierAddressResponse(SupplierAddressBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class SupplierBase(BaseModel):
     name: str
@@ -64,16 +63,22 @@ class SupplierCreate(SupplierBase):
 class SupplierUpdate(SupplierBase):
     pass
 
-class SupplierResponse(SupplierBase):
+class SupplierRow(SupplierBase):
+    """Scalar columns of a supplier, without the collections.
+
+    What the NDJSON streaming list path emits: its query deliberately
+    eager-loads nothing, so contacts/addresses are not available there.
+    """
     id: int
     created_at: datetime
     updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class SupplierResponse(SupplierRow):
     contacts: List[SupplierContactResponse]
     addresses: List[SupplierAddressResponse]
 
-    class Config:
-        from_attributes = True
-
 class SupplierProductBase(BaseModel):
     supplier_id: int
     product_id: int
@@ -94,5 +99,26 @@ class SupplierProductResponse(SupplierProductBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class SupplierPerformance(BaseModel):
+    """Per-supplier metrics served from supplier_performance_mv."""
+
+    supplier_id: UUID
+    total_orders: int
+    total_spend: float
+    total_shipments: int
+    on_time_shipments: int
+    on_time_delivery_rate: float
+    avg_lead_time_days: Optional[float] = None
+    refreshed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Built eagerly at import (see package docstring)
+SupplierContactResponse.model_rebuild()
+SupplierAddressResponse.model_rebuild()
+SupplierRow.model_rebuild()
+SupplierResponse.model_rebuild()
+SupplierProductResponse.model_rebuild()
+SupplierPerformance.model_rebuild()
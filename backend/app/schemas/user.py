@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 class UserBase(BaseModel):
@@ -12,6 +12,12 @@ class UserBase(BaseModel):
     full_name: Optional[str] = Field(None, description="User's full name")
     is_active: bool = Field(True, description="Whether the user account is active")
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Lowercase email so lookups hit the lower(email) index."""
+        return v.lower()
+
 
 class UserCreate(UserBase):
     """Schema for creating a new user."""
@@ -35,8 +41,7 @@ class UserRead(UserBase):
     created_at: datetime = Field(..., description="When the user account was created")
     updated_at: Optional[datetime] = Field(None, description="When the user account was last updated")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserInDB(UserRead):
@@ -55,3 +60,11 @@ class UserPasswordUpdate(BaseModel):
         if self.new_password != self.confirm_password:
             raise ValueError('Passwords do not match')
         return self
+
+
+# Names used by the API layer
+# Built eagerly at import (see package docstring)
+UserRead.model_rebuild()
+
+UserResponse = UserRead
+PasswordUpdate = UserPasswordUpdate
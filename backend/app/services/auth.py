@@ -1,39 +1,44 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional
-from jose import jwt
-from passlib.context import CryptContext
+import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 
 from app.core.config import settings
+from app.core.password import (
+    DUMMY_HASH,
+    aget_password_hash,
+    averify_password,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 from app.models.user import User
 from app.schemas.auth import UserLogin, UserRegister
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 class AuthService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+        return verify_password(plain_password, hashed_password)
 
     def get_password_hash(self, password: str) -> str:
         """Generate a password hash."""
-        return pwd_context.hash(password)
+        return get_password_hash(password)
 
     def create_access_token(self, subject: int, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token."""
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            ttl = expires_delta.total_seconds()
         else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
-        
+            ttl = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
         to_encode = {
-            "exp": expire,
+            "exp": int(time.time() + ttl),
             "sub": str(subject),
             "type": "access"
         }
@@ -45,44 +50,57 @@ class AuthService:
 
     async def authenticate_user(self, login_data: UserLogin) -> Optional[User]:
         """Authenticate a user with email and password."""
+        # Compare on lower(email) so the planner can use the expression
+        # index ix_user_email_lower regardless of input casing
         result = await self.db.execute(
-            select(User).where(User.email == login_data.email)
+            select(User).where(func.lower(User.email) == login_data.email.lower())
         )
         user = result.scalar_one_or_none()
         
         if not user:
+            # Dummy verify keeps the unknown-email branch as slow as a real
+            # one, closing the user-enumeration timing channel
+            await averify_password(login_data.password, DUMMY_HASH)
             return None
-        if not self.verify_password(login_data.password, user.hashed_password):
+        # Hash verification runs on the hashing thread pool so concurrent
+        # logins do not serialize on the event loop
+        if not await averify_password(login_data.password, user.hashed_password):
             return None
-        
+
+        # Transparently upgrade legacy bcrypt hashes to argon2id now that
+        # we hold the plaintext; committed with the surrounding request
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = await aget_password_hash(login_data.password)
+
         return user
 
     async def register_user(self, user_data: UserRegister) -> User:
         """Register a new user."""
-        # Check if user already exists
-        result = await self.db.execute(
-            select(User).where(User.email == user_data.email)
+        # Single INSERT ... ON CONFLICT round-trip: no separate existence
+        # SELECT, and no race window under concurrent registration
+        stmt = (
+            insert(User)
+            .values(
+                email=user_data.email,
+                hashed_password=await aget_password_hash(user_data.password),
+                full_name=user_data.full_name,
+                role=user_data.role,
+                is_active=True,
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User)
         )
-        if result.scalar_one_or_none():
+        result = await self.db.execute(stmt)
+        user = result.scalars().first()
+        if user is None:
             raise ValueError("Email already registered")
-
-        # Create new user
-        user = User(
-            email=user_data.email,
-            hashed_password=self.get_password_hash(user_data.password),
-            full_name=user_data.full_name,
-            role=user_data.role,
-            is_active=True
-        )
-        self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get a user by email."""
+        """Get a user by email (case-insensitive)."""
         result = await self.db.execute(
-            select(User).where(User.email == email)
+            select(User).where(func.lower(User.email) == email.lower())
         )
         return result.scalar_one_or_none()
 
@@ -104,10 +122,10 @@ class AuthService:
         if not user:
             return False
         
-        if not self.verify_password(current_password, user.hashed_password):
+        if not await averify_password(current_password, user.hashed_password):
             return False
-        
-        user.hashed_password = self.get_password_hash(new_password)
+
+        user.hashed_password = await aget_password_hash(new_password)
         await self.db.commit()
         return True
 
@@ -1,18 +1,59 @@
 """Category service for business logic operations."""
 
+import asyncio
+import time
 from typing import List, Optional
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, load_only, selectinload
 
 from app.core.logging import get_logger
 from app.models.category import Category
-from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.models.product import Product
+from app.schemas.category import CategoryCreate, CategoryRead, CategoryUpdate
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Lazily populated category_id -> parent_id map shared across service
+# instances. Cycle checks walk parent chains through this dict instead of
+# issuing one SELECT per ancestor; mutations evict the affected node.
+# Bounded the same way as the auth caches.
+_PARENT_CACHE: dict = {}
+_PARENT_CACHE_MAX = 10000
+
+# category_id -> (expires, Category) lookup cache. Every update/delete
+# validates its category first, so hot categories are re-fetched constantly;
+# a short TTL keeps staleness bounded while mutations evict eagerly. Same
+# bounded-eviction policy as the auth caches.
+_CATEGORY_CACHE: dict = {}
+_CATEGORY_CACHE_MAX = 4096
+_CATEGORY_CACHE_TTL = 60.0
+
+
+def _category_cache_put(category_id: str, category: Category) -> None:
+    if len(_CATEGORY_CACHE) >= _CATEGORY_CACHE_MAX:
+        now = time.time()
+        expired = [k for k, (until, _) in _CATEGORY_CACHE.items() if until <= now]
+        for k in expired:
+            del _CATEGORY_CACHE[k]
+        if len(_CATEGORY_CACHE) >= _CATEGORY_CACHE_MAX:
+            _CATEGORY_CACHE.clear()
+    _CATEGORY_CACHE[category_id] = (time.time() + _CATEGORY_CACHE_TTL, category)
+
+
+# Response-schema columns for list queries, resolved at import time
+_LIST_COLS = tuple(
+    getattr(Category, name)
+    for name in CategoryRead.model_fields
+    if name in Category.__table__.columns
+)
+
+# Base list statement built once at import; per-request filters chain onto
+# this instead of rebuilding the select/options graph every call
+_LIST_BASE = select(Category).options(load_only(*_LIST_COLS))
+
 
 class CategoryService:
     """Service class for category-related business logic."""
@@ -45,10 +86,11 @@ class CategoryService:
         Returns:
             List of category objects
         """
-        logger.debug(f"Fetching categories with skip={skip}, limit={limit}, parent_id={parent_id}")
-        
-        query = select(Category)
+        logger.debug("Fetching categories with skip=%s, limit=%s, parent_id=%s", skip, limit, parent_id)
         
+        # Fetch only the columns the response schema serializes
+        query = _LIST_BASE
+
         # Apply filters
         filters = []
         if active_only:
@@ -65,7 +107,7 @@ class CategoryService:
         result = await self.db.execute(query)
         categories = result.scalars().all()
         
-        logger.info(f"Retrieved {len(categories)} categories")
+        logger.info("Retrieved %s categories", len(categories))
         return list(categories)
 
     async def get_category_by_id(self, category_id: str) -> Optional[Category]:
@@ -78,18 +120,26 @@ class CategoryService:
         Returns:
             Category object if found, None otherwise
         """
-        logger.debug(f"Fetching category by ID: {category_id}")
-        
+        logger.debug("Fetching category by ID: %s", category_id)
+
+        entry = _CATEGORY_CACHE.get(category_id)
+        if entry is not None:
+            expires, cached = entry
+            if time.time() < expires:
+                return cached
+            _CATEGORY_CACHE.pop(category_id, None)
+
         result = await self.db.execute(
             select(Category).where(Category.id == category_id)
         )
         category = result.scalar_one_or_none()
-        
+
         if category:
-            logger.debug(f"Found category {category_id}")
+            logger.debug("Found category %s", category_id)
+            _category_cache_put(category_id, category)
         else:
-            logger.debug(f"Category {category_id} not found")
-            
+            logger.debug("Category %s not found", category_id)
+
         return category
 
     async def get_category_by_name(self, name: str, parent_id: Optional[str] = None) -> Optional[Category]:
@@ -103,7 +153,7 @@ class CategoryService:
         Returns:
             Category object if found, None otherwise
         """
-        logger.debug(f"Fetching category by name: {name}, parent_id: {parent_id}")
+        logger.debug("Fetching category by name: %s, parent_id: %s", name, parent_id)
         
         query = select(Category).where(Category.name == name)
         if parent_id is not None:
@@ -115,12 +165,64 @@ class CategoryService:
         category = result.scalar_one_or_none()
         
         if category:
-            logger.debug(f"Found category with name {name}")
+            logger.debug("Found category with name %s", name)
         else:
-            logger.debug(f"Category with name {name} not found")
+            logger.debug("Category with name %s not found", name)
             
         return category
 
+    async def get_update_prechecks(
+        self,
+        category_id: str,
+        name: Optional[str],
+        name_parent_id: Optional[str],
+        new_parent_id: Optional[str],
+    ) -> tuple:
+        """
+        Run the independent update pre-checks concurrently.
+
+        Name-collision, parent-existence, and cycle checks are independent
+        reads, so their wall-clock cost is max-of-latencies rather than the
+        sum. One AsyncSession cannot execute overlapping statements, so
+        each active check borrows its own short-lived session from the
+        shared pool; skipped checks resolve immediately without touching it.
+
+        Args:
+            category_id: Category being updated
+            name: New name to collision-check, or None to skip
+            name_parent_id: Parent scope for the name check
+            new_parent_id: Proposed new parent to validate, or None to skip
+
+        Returns:
+            Tuple of (conflicting category or None, parent category or None,
+            would_create_circular_reference flag)
+        """
+        from app.core.database import AsyncSessionLocal
+
+        async def _name_conflict():
+            if not name:
+                return None
+            async with AsyncSessionLocal() as session:
+                return await CategoryService(session).get_category_by_name(
+                    name, parent_id=name_parent_id
+                )
+
+        async def _parent():
+            if not new_parent_id:
+                return None
+            async with AsyncSessionLocal() as session:
+                return await CategoryService(session).get_category_by_id(new_parent_id)
+
+        async def _circular():
+            if not new_parent_id:
+                return False
+            async with AsyncSessionLocal() as session:
+                return await CategoryService(session).would_create_circular_reference(
+                    category_id, new_parent_id
+                )
+
+        return tuple(await asyncio.gather(_name_conflict(), _parent(), _circular()))
+
     async def create_category(self, category_data: CategoryCreate) -> Category:
         """
         Create a new category.
@@ -134,7 +236,7 @@ class CategoryService:
         Raises:
             Exception: If category creation fails
         """
-        logger.info(f"Creating new category: {category_data.name}")
+        logger.info("Creating new category: %s", category_data.name)
         
         try:
             # Calculate level and path
@@ -161,12 +263,14 @@ class CategoryService:
             self.db.add(db_category)
             await self.db.commit()
             await self.db.refresh(db_category)
-            
-            logger.info(f"Successfully created category {db_category.id}")
+
+            _PARENT_CACHE[db_category.id] = db_category.parent_id
+
+            logger.info("Successfully created category %s", db_category.id)
             return db_category
             
         except Exception as e:
-            logger.error(f"Failed to create category: {e}")
+            logger.error("Failed to create category: %s", e)
             await self.db.rollback()
             raise
 
@@ -184,15 +288,9 @@ class CategoryService:
         Raises:
             Exception: If category update fails
         """
-        logger.info(f"Updating category {category_id}")
-        
+        logger.info("Updating category %s", category_id)
+
         try:
-            # Get category
-            category = await self.get_category_by_id(category_id)
-            if not category:
-                logger.warning(f"Category {category_id} not found for update")
-                return None
-            
             # Build update data
             update_data = {}
             if category_data.name is not None:
@@ -203,43 +301,56 @@ class CategoryService:
                 update_data['is_active'] = category_data.is_active
             if category_data.parent_id is not None:
                 update_data['parent_id'] = category_data.parent_id
-            
-            # Update path and level if parent or name changed
+
+            # Update path and level if parent or name changed; only this
+            # branch needs the current row loaded
             if category_data.parent_id is not None or category_data.name is not None:
+                category = await self.get_category_by_id(category_id)
+                if not category:
+                    logger.warning("Category %s not found for update", category_id)
+                    return None
+
                 new_name = category_data.name or category.name
                 level = 0
                 path = new_name
-                
+
                 if category_data.parent_id:
                     parent = await self.get_category_by_id(category_data.parent_id)
                     if parent:
                         level = parent.level + 1
                         path = f"{parent.path} / {new_name}"
-                
+
                 update_data['level'] = level
                 update_data['path'] = path
-            
+
             if not update_data:
-                logger.debug(f"No updates provided for category {category_id}")
-                return category
-            
-            # Update category
-            await self.db.execute(
+                logger.debug("No updates provided for category %s", category_id)
+                return await self.get_category_by_id(category_id)
+
+            # Single UPDATE ... RETURNING round-trip: no pre-SELECT for the
+            # common case and no refresh SELECT afterwards
+            result = await self.db.execute(
                 update(Category)
                 .where(Category.id == category_id)
                 .values(**update_data)
+                .returning(Category)
             )
-            
+            category = result.scalars().first()
+            if category is None:
+                logger.warning("Category %s not found for update", category_id)
+                return None
+
             await self.db.commit()
-            
-            # Refresh and return updated category
-            await self.db.refresh(category)
-            
-            logger.info(f"Successfully updated category {category_id}")
+
+            # Reparenting invalidates this node's cached parent pointer
+            _PARENT_CACHE.pop(category_id, None)
+            _CATEGORY_CACHE.pop(category_id, None)
+
+            logger.info("Successfully updated category %s", category_id)
             return category
             
         except Exception as e:
-            logger.error(f"Failed to update category {category_id}: {e}")
+            logger.error("Failed to update category %s: %s", category_id, e)
             await self.db.rollback()
             raise
 
@@ -257,33 +368,36 @@ class CategoryService:
         Raises:
             Exception: If category deletion fails
         """
-        logger.info(f"Deleting category {category_id}, force={force}")
-        
+        logger.info("Deleting category %s, force=%s", category_id, force)
+
         try:
-            # Check if category exists
-            category = await self.get_category_by_id(category_id)
-            if not category:
-                logger.warning(f"Category {category_id} not found for deletion")
-                return False
-            
             if force:
                 # Force delete: deactivate all children and associated products
                 await self._deactivate_category_tree(category_id)
-            
-            # Soft delete by marking as inactive
-            await self.db.execute(
+
+            # Soft delete by marking as inactive; RETURNING doubles as the
+            # existence check, so no pre-SELECT
+            result = await self.db.execute(
                 update(Category)
                 .where(Category.id == category_id)
                 .values(is_active=False)
+                .returning(Category.id)
             )
-            
+            if result.scalar() is None:
+                logger.warning("Category %s not found for deletion", category_id)
+                await self.db.rollback()
+                return False
+
             await self.db.commit()
-            
-            logger.info(f"Successfully deleted category {category_id}")
+
+            _PARENT_CACHE.pop(category_id, None)
+            _CATEGORY_CACHE.pop(category_id, None)
+
+            logger.info("Successfully deleted category %s", category_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to delete category {category_id}: {e}")
+            logger.error("Failed to delete category %s: %s", category_id, e)
             await self.db.rollback()
             raise
 
@@ -298,7 +412,7 @@ class CategoryService:
         Returns:
             List of child categories
         """
-        logger.debug(f"Fetching child categories for parent {parent_id}")
+        logger.debug("Fetching child categories for parent %s", parent_id)
         
         query = select(Category).where(Category.parent_id == parent_id)
         
@@ -310,9 +424,49 @@ class CategoryService:
         result = await self.db.execute(query)
         children = result.scalars().all()
         
-        logger.debug(f"Found {len(children)} child categories")
+        logger.debug("Found %s child categories", len(children))
         return list(children)
 
+    async def get_children_with_parent_probe(
+        self,
+        parent_id: str,
+        active_only: bool = True
+    ) -> tuple[bool, List[Category]]:
+        """
+        Fetch a parent's children and its existence in one round-trip.
+
+        LEFT JOINs the children onto the parent row, so a missing parent
+        yields zero rows, a childless parent yields one row with a NULL
+        child, and callers never need a separate existence SELECT.
+
+        Args:
+            parent_id: Parent category ID
+            active_only: Whether to include only active children
+
+        Returns:
+            Tuple of (parent_exists, list of child categories)
+        """
+        logger.debug("Fetching children with parent probe for %s", parent_id)
+
+        parent = aliased(Category)
+        child = aliased(Category)
+        join_cond = child.parent_id == parent.id
+        if active_only:
+            join_cond = and_(join_cond, child.is_active == True)
+        query = (
+            select(child)
+            .select_from(parent)
+            .outerjoin(child, join_cond)
+            .where(parent.id == parent_id)
+            .order_by(child.name)
+        )
+
+        rows = (await self.db.execute(query)).scalars().all()
+        if not rows:
+            return False, []
+        children = [c for c in rows if c is not None]
+        return True, children
+
     async def get_category_tree(
         self, 
         category_id: str, 
@@ -330,17 +484,41 @@ class CategoryService:
         Returns:
             Category with nested children
         """
-        logger.debug(f"Building category tree for {category_id}, max_depth={max_depth}")
-        
-        # Get root category
-        category = await self.get_category_by_id(category_id)
-        if not category:
+        logger.debug("Building category tree for %s, max_depth=%s", category_id, max_depth)
+
+        # Single recursive CTE instead of one SELECT per node: the database
+        # walks the subtree in one round-trip and Python just links children
+        subtree = (
+            select(Category, literal(0).label("depth"))
+            .where(Category.id == category_id)
+            .cte("subtree", recursive=True)
+        )
+        child = aliased(Category)
+        descend = (
+            select(child, subtree.c.depth + 1)
+            .join(subtree, child.parent_id == subtree.c.id)
+            .where(subtree.c.depth < max_depth)
+        )
+        if active_only:
+            descend = descend.where(child.is_active == True)
+        subtree = subtree.union_all(descend)
+
+        node = aliased(Category, subtree)
+        result = await self.db.execute(select(node).order_by(subtree.c.depth))
+        rows = result.scalars().all()
+
+        nodes = {c.id: c for c in rows}
+        root = nodes.get(category_id)
+        if root is None:
             return None
-        
-        # Build tree recursively
-        await self._build_category_tree(category, max_depth, active_only)
-        
-        return category
+
+        for c in rows:
+            c.children = []
+        for c in rows:
+            if c.id != category_id and c.parent_id in nodes:
+                nodes[c.parent_id].children.append(c)
+
+        return root
 
     async def get_root_categories(self, active_only: bool = True) -> List[Category]:
         """
@@ -364,7 +542,7 @@ class CategoryService:
         result = await self.db.execute(query)
         categories = result.scalars().all()
         
-        logger.debug(f"Found {len(categories)} root categories")
+        logger.debug("Found %s root categories", len(categories))
         return list(categories)
 
     async def has_child_categories(self, category_id: str) -> bool:
@@ -393,9 +571,34 @@ class CategoryService:
         Returns:
             True if category has products, False otherwise
         """
-        # TODO: Implement when Product model is available
-        # For now, return False
-        return False
+        result = await self.db.execute(
+            select(select(Product.id).where(Product.category_id == category_id).exists())
+        )
+        return bool(result.scalar())
+
+    async def get_dependency_flags(self, category_id: str) -> tuple[bool, bool]:
+        """
+        Check for child categories and associated products in one query.
+
+        Both checks compile to EXISTS subqueries in a single SELECT, so the
+        delete path pays one round-trip instead of two and Postgres stops
+        scanning at the first matching row.
+
+        Args:
+            category_id: Category ID to check
+
+        Returns:
+            Tuple of (has_children, has_products)
+        """
+        children_exists = (
+            select(Category.id).where(Category.parent_id == category_id).exists()
+        )
+        products_exists = (
+            select(Product.id).where(Product.category_id == category_id).exists()
+        )
+        result = await self.db.execute(select(children_exists, products_exists))
+        has_children, has_products = result.one()
+        return bool(has_children), bool(has_products)
 
     async def would_create_circular_reference(self, category_id: str, new_parent_id: str) -> bool:
         """
@@ -408,54 +611,35 @@ class CategoryService:
         Returns:
             True if it would create a circular reference, False otherwise
         """
-        logger.debug(f"Checking circular reference: category={category_id}, new_parent={new_parent_id}")
+        logger.debug("Checking circular reference: category=%s, new_parent=%s", category_id, new_parent_id)
         
-        # Traverse up the parent chain from new_parent_id
+        # Traverse up the parent chain from new_parent_id. Each hop is an
+        # in-memory dict lookup when cached, one SELECT on first sight.
         current_id = new_parent_id
         visited = set()
-        
+
         while current_id and current_id not in visited:
             if current_id == category_id:
-                logger.warning(f"Circular reference detected: {category_id} -> {new_parent_id}")
+                logger.warning("Circular reference detected: %s -> %s", category_id, new_parent_id)
                 return True
-            
+
             visited.add(current_id)
-            
+
             # Get parent of current category
-            result = await self.db.execute(
-                select(Category.parent_id).where(Category.id == current_id)
-            )
-            parent_id = result.scalar()
+            if current_id in _PARENT_CACHE:
+                parent_id = _PARENT_CACHE[current_id]
+            else:
+                result = await self.db.execute(
+                    select(Category.parent_id).where(Category.id == current_id)
+                )
+                parent_id = result.scalar()
+                if len(_PARENT_CACHE) >= _PARENT_CACHE_MAX:
+                    _PARENT_CACHE.clear()
+                _PARENT_CACHE[current_id] = parent_id
             current_id = parent_id
         
         return False
 
-    async def _build_category_tree(
-        self, 
-        category: Category, 
-        max_depth: int, 
-        active_only: bool,
-        current_depth: int = 0
-    ) -> None:
-        """
-        Recursively build category tree with children.
-        
-        Args:
-            category: Category to build tree for
-            max_depth: Maximum depth to traverse
-            active_only: Whether to include only active categories
-            current_depth: Current recursion depth
-        """
-        if current_depth >= max_depth:
-            return
-        
-        children = await self.get_child_categories(category.id, active_only)
-        category.children = children
-        
-        # Recursively build subtrees
-        for child in children:
-            await self._build_category_tree(child, max_depth, active_only, current_depth + 1)
-
     async def _deactivate_category_tree(self, category_id: str) -> None:
         """
         Recursively deactivate a category and all its descendants.
@@ -463,7 +647,7 @@ class CategoryService:
         Args:
             category_id: Root category ID to deactivate
         """
-        logger.debug(f"Deactivating category tree starting from {category_id}")
+        logger.debug("Deactivating category tree starting from %s", category_id)
         
         # Get all children
         children = await self.get_child_categories(category_id, active_only=False)
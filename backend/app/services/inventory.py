@@ -1,21 +1,64 @@
 from typing import List, Optional
 from datetime import datetime
+from sqlalchemy import Select, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from app.models.inventory import Inventory, InventoryAdjustment, InventoryCount
 from app.schemas.inventory import (
     InventoryCreate,
+    InventoryResponse,
     InventoryUpdate,
     InventoryAdjustmentCreate,
     InventoryCount as InventoryCountSchema
 )
 
+# Response-schema columns for list queries, resolved at import time
+_LIST_COLS = tuple(
+    getattr(Inventory, name)
+    for name in InventoryResponse.model_fields
+    if name in Inventory.__table__.columns
+)
+
+# Base list statement built once at import; per-request filters chain onto
+# this instead of rebuilding the select/options graph every call
+_LIST_BASE = select(Inventory).options(
+    load_only(*_LIST_COLS),
+    selectinload(Inventory.product),
+    selectinload(Inventory.location)
+)
+
 class InventoryService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def list_query(
+        skip: int = 0,
+        limit: int = 100,
+        product_id: Optional[int] = None,
+        location_id: Optional[int] = None,
+        low_stock: bool = False,
+    ) -> Select:
+        """Build the inventory list query without executing it.
+
+        Used by the streaming list path; mirrors get_inventory_list minus
+        the relationship eager-loads, which are incompatible with
+        row-at-a-time streaming.
+        """
+        query = select(Inventory)
+        if product_id:
+            query = query.where(Inventory.product_id == product_id)
+        if location_id:
+            query = query.where(Inventory.location_id == location_id)
+        if low_stock:
+            # Low stock: available quantity at or below the reorder point
+            query = query.where(
+                Inventory.quantity_on_hand - Inventory.quantity_reserved
+                <= Inventory.reorder_point
+            )
+        return query.offset(skip).limit(limit)
+
     async def create_inventory(
         self,
         inventory_data: InventoryCreate
@@ -65,10 +108,8 @@ class InventoryService:
         location_id: Optional[int] = None
     ) -> List[Inventory]:
         """Get a list of inventory records with optional filtering."""
-        query = select(Inventory).options(
-            selectinload(Inventory.product),
-            selectinload(Inventory.location)
-        )
+        # Fetch only the columns the response schema serializes
+        query = _LIST_BASE
         
         if product_id:
             query = query.where(Inventory.product_id == product_id)
@@ -1,15 +1,77 @@
+import time
 from typing import List, Optional
+from sqlalchemy import Select, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from app.models.product import Product
-from app.schemas.product import ProductCreate, ProductUpdate
+from app.schemas.product import ProductCreate, ProductResponse, ProductUpdate
+
+# Columns the list response actually serializes, derived from the schema at
+# import time so a schema/model drift surfaces immediately rather than as a
+# silently widening SELECT
+_LIST_COLS = tuple(
+    getattr(Product, name)
+    for name in ProductResponse.model_fields
+    if name in Product.__table__.columns
+)
+
+# Base list statement built once at import; per-request filters chain onto
+# this instead of rebuilding the select/options graph every call. SQL string
+# compilation is already reused via SQLAlchemy's compiled-statement cache,
+# keyed on statement structure rather than bound values.
+_LIST_BASE = select(Product).options(
+    load_only(*_LIST_COLS),
+    selectinload(Product.category),
+)
+
+# sku -> (expires, Product) lookup cache: SKU lookups are hot and products
+# rarely change. Short TTL bounds staleness; mutations evict eagerly. Same
+# bounded-eviction policy as the auth caches.
+_SKU_CACHE: dict = {}
+_SKU_CACHE_MAX = 4096
+_SKU_CACHE_TTL = 60.0
+
+
+def _sku_cache_put(sku: str, product: Product) -> None:
+    if len(_SKU_CACHE) >= _SKU_CACHE_MAX:
+        now = time.time()
+        expired = [k for k, (until, _) in _SKU_CACHE.items() if until <= now]
+        for k in expired:
+            del _SKU_CACHE[k]
+        if len(_SKU_CACHE) >= _SKU_CACHE_MAX:
+            _SKU_CACHE.clear()
+    _SKU_CACHE[sku] = (time.time() + _SKU_CACHE_TTL, product)
+
 
 class ProductService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def list_query(
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Select:
+        """Build the product list query without executing it.
+
+        Used by the streaming list path, which hands the statement to
+        stream_scalars instead of materializing the page. No relationship
+        eager-loads here: streaming yields rows one at a time and selectin
+        loading would force full buffering.
+        """
+        query = select(Product)
+        if category_id:
+            query = query.where(Product.category_id == category_id)
+        if search:
+            query = query.where(Product.name.ilike(f"%{search}%"))
+        if status:
+            query = query.where(Product.status == status)
+        return query.offset(skip).limit(limit)
+
     async def create_product(self, product_data: ProductCreate) -> Product:
         """Create a new product."""
         product = Product(**product_data.model_dump())
@@ -18,6 +80,25 @@ class ProductService:
         await self.db.refresh(product)
         return product
 
+    async def bulk_create_products(
+        self,
+        products_in: List[ProductCreate]
+    ) -> List[Product]:
+        """Create many products in a single INSERT ... RETURNING statement.
+
+        Executemany with RETURNING rides SQLAlchemy's insertmanyvalues
+        path: one round-trip per page (see insertmanyvalues_page_size in
+        the engine config) instead of one INSERT plus identity-map
+        bookkeeping per product.
+        """
+        if not products_in:
+            return []
+        rows = [p.model_dump() for p in products_in]
+        result = await self.db.execute(insert(Product).returning(Product), rows)
+        products = list(result.scalars().all())
+        await self.db.commit()
+        return products
+
     async def get_product(self, product_id: int) -> Optional[Product]:
         """Get a product by ID."""
         result = await self.db.execute(
@@ -35,7 +116,9 @@ class ProductService:
         search: Optional[str] = None
     ) -> List[Product]:
         """Get a list of products with optional filtering."""
-        query = select(Product).options(selectinload(Product.category))
+        # load_only trims the SELECT to response-schema columns: fewer bytes
+        # off the wire and smaller per-row __dict__s to hydrate
+        query = _LIST_BASE
         
         if category_id:
             query = query.where(Product.category_id == category_id)
@@ -52,30 +135,56 @@ class ProductService:
         product_data: ProductUpdate
     ) -> Optional[Product]:
         """Update a product."""
-        await self.db.execute(
+        values = product_data.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_product(product_id)
+        # Single UPDATE ... RETURNING round-trip instead of UPDATE followed
+        # by a re-SELECT of the row we just wrote
+        result = await self.db.execute(
             update(Product)
             .where(Product.id == product_id)
-            .values(**product_data.model_dump(exclude_unset=True))
+            .values(**values)
+            .returning(Product)
         )
+        product = result.scalars().first()
+        if product is None:
+            return None
         await self.db.commit()
-        return await self.get_product(product_id)
+        _SKU_CACHE.pop(product.sku, None)
+        return product
 
     async def delete_product(self, product_id: int) -> bool:
         """Delete a product."""
+        # RETURNING the sku lets us evict the lookup cache without a
+        # separate SELECT
         result = await self.db.execute(
-            delete(Product).where(Product.id == product_id)
+            delete(Product).where(Product.id == product_id).returning(Product.sku)
         )
+        sku = result.scalar()
         await self.db.commit()
-        return result.rowcount > 0
+        if sku is None:
+            return False
+        _SKU_CACHE.pop(sku, None)
+        return True
 
     async def get_product_by_sku(self, sku: str) -> Optional[Product]:
         """Get a product by SKU."""
+        entry = _SKU_CACHE.get(sku)
+        if entry is not None:
+            expires, cached = entry
+            if time.time() < expires:
+                return cached
+            _SKU_CACHE.pop(sku, None)
+
         result = await self.db.execute(
             select(Product)
             .options(selectinload(Product.category))
             .where(Product.sku == sku)
         )
-        return result.scalar_one_or_none()
+        product = result.scalar_one_or_none()
+        if product is not None:
+            _sku_cache_put(sku, product)
+        return product
 
     async def get_products_by_category(
         self,
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import Select, lambda_stmt, select, update, delete
 from sqlalchemy.orm import selectinload
 
 from app.models.purchase_order import PurchaseOrder, PurchaseOrderItem, PurchaseOrderApproval
@@ -11,10 +11,45 @@ from app.schemas.purchase_order import (
     PurchaseOrderApproval as PurchaseOrderApprovalSchema
 )
 
+# Base list statement built once at import; the selectin eager-loads keep
+# per-row serialization of items/approvals from becoming N+1 lazy SELECTs
+_LIST_BASE = select(PurchaseOrder).options(
+    selectinload(PurchaseOrder.items),
+    selectinload(PurchaseOrder.approvals)
+)
+
 class PurchaseOrderService:
+    # Mutations write through the request session but never commit: the
+    # session dependency sees the writes (flushed ORM state or ORM-enabled
+    # DML, both flagged in app.core.database) and commits once on clean
+    # request exit (rolling back on exception), so a multi-statement
+    # mutation pays a single WAL fsync.
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def list_query(
+        limit: int = 100,
+        status: Optional[str] = None,
+        supplier_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Select:
+        """Build the purchase order list query without executing it.
+
+        Used by the streaming list path, which hands the statement to
+        stream_scalars instead of materializing the page. No relationship
+        eager-loads here: streaming yields rows one at a time and selectin
+        loading would force full buffering.
+        """
+        query = select(PurchaseOrder)
+        if status:
+            query = query.where(PurchaseOrder.status == status)
+        if supplier_id:
+            query = query.where(PurchaseOrder.supplier_id == supplier_id)
+        if after_id is not None:
+            query = query.where(PurchaseOrder.id > after_id)
+        return query.order_by(PurchaseOrder.id).limit(limit)
+
     async def create_purchase_order(
         self,
         purchase_order_data: PurchaseOrderCreate,
@@ -35,7 +70,7 @@ class PurchaseOrderService:
             )
             self.db.add(item)
 
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(purchase_order)
         return purchase_order
 
@@ -59,21 +94,31 @@ class PurchaseOrderService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
-        supplier_id: Optional[int] = None
+        supplier_id: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> List[PurchaseOrder]:
-        """Get a list of purchase orders with optional filtering."""
-        query = select(PurchaseOrder).options(
-            selectinload(PurchaseOrder.items),
-            selectinload(PurchaseOrder.approvals)
-        )
-        
+        """Get a list of purchase orders with optional filtering.
+
+        Built as a lambda statement: each filter combination is constructed
+        and compiled once per process, and repeat calls only swap in new
+        bound-parameter values instead of re-running the Core expression
+        machinery.
+        """
+        stmt = lambda_stmt(lambda: _LIST_BASE)
+
         if status:
-            query = query.where(PurchaseOrder.status == status)
+            stmt += lambda s: s.where(PurchaseOrder.status == status)
         if supplier_id:
-            query = query.where(PurchaseOrder.supplier_id == supplier_id)
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.db.execute(query)
+            stmt += lambda s: s.where(PurchaseOrder.supplier_id == supplier_id)
+
+        if after_id is not None:
+            # Keyset pagination: O(limit) at any page depth, unlike OFFSET
+            # which makes the database scan and discard every skipped row
+            stmt += lambda s: s.where(PurchaseOrder.id > after_id)
+        else:
+            stmt += lambda s: s.offset(skip)
+        stmt += lambda s: s.order_by(PurchaseOrder.id).limit(limit)
+        result = await self.db.execute(stmt)
         return result.scalars().all()
 
     async def update_purchase_order(
@@ -87,7 +132,58 @@ class PurchaseOrderService:
             .where(PurchaseOrder.id == purchase_order_id)
             .values(**purchase_order_data.model_dump(exclude_unset=True))
         )
-        await self.db.commit()
+        return await self.get_purchase_order(purchase_order_id)
+
+    async def update_if_status(
+        self,
+        purchase_order_id: int,
+        purchase_order_data: PurchaseOrderUpdate,
+        allowed_statuses: tuple = ("draft", "pending")
+    ) -> tuple:
+        """Update a purchase order only while its status allows edits.
+
+        The status guard lives in the UPDATE's WHERE clause, so the check
+        and the write are a single round-trip with no read-modify-write
+        race against a concurrent approval. Returns (purchase_order,
+        exists): purchase_order is None when nothing was written, and
+        exists tells the caller whether that was a missing row (404) or a
+        status that forbids the edit (400). The existence probe only runs
+        on the miss path.
+        """
+        values = purchase_order_data.model_dump(exclude_unset=True)
+        if not values:
+            purchase_order = await self.get_purchase_order(purchase_order_id)
+            return purchase_order, purchase_order is not None
+        result = await self.db.execute(
+            update(PurchaseOrder)
+            .where(
+                PurchaseOrder.id == purchase_order_id,
+                PurchaseOrder.status.in_(allowed_statuses)
+            )
+            .values(**values)
+            .returning(PurchaseOrder.id)
+        )
+        if result.scalar_one_or_none() is None:
+            exists = await self.db.scalar(
+                select(PurchaseOrder.id)
+                .where(PurchaseOrder.id == purchase_order_id)
+            )
+            return None, exists is not None
+        return await self.get_purchase_order(purchase_order_id), True
+
+    async def cancel_purchase_order(
+        self,
+        purchase_order_id: int
+    ) -> Optional[PurchaseOrder]:
+        """Cancel a purchase order in a single guarded UPDATE."""
+        result = await self.db.execute(
+            update(PurchaseOrder)
+            .where(PurchaseOrder.id == purchase_order_id)
+            .values(status="cancelled")
+            .returning(PurchaseOrder.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
         return await self.get_purchase_order(purchase_order_id)
 
     async def delete_purchase_order(self, purchase_order_id: int) -> bool:
@@ -95,7 +191,6 @@ class PurchaseOrderService:
         result = await self.db.execute(
             delete(PurchaseOrder).where(PurchaseOrder.id == purchase_order_id)
         )
-        await self.db.commit()
         return result.rowcount > 0
 
     async def approve_purchase_order(
@@ -105,6 +200,17 @@ class PurchaseOrderService:
         approved_by: int
     ) -> Optional[PurchaseOrderApproval]:
         """Approve or reject a purchase order."""
+        # Update the status first; RETURNING doubles as the existence
+        # check, so callers do not need a SELECT before calling this
+        result = await self.db.execute(
+            update(PurchaseOrder)
+            .where(PurchaseOrder.id == purchase_order_id)
+            .values(status=approval_data.status)
+            .returning(PurchaseOrder.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+
         # Create approval record
         approval = PurchaseOrderApproval(
             purchase_order_id=purchase_order_id,
@@ -114,14 +220,7 @@ class PurchaseOrderService:
         )
         self.db.add(approval)
 
-        # Update purchase order status
-        await self.db.execute(
-            update(PurchaseOrder)
-            .where(PurchaseOrder.id == purchase_order_id)
-            .values(status=approval_data.status)
-        )
-
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(approval)
         return approval
 
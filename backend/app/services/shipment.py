@@ -1,7 +1,7 @@
 from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import Select, lambda_stmt, select, update, delete
 from sqlalchemy.orm import selectinload
 
 from app.models.shipment import (
@@ -15,10 +15,44 @@ from app.schemas.shipment import (
     ShipmentStatusUpdate
 )
 
+# Base list statement built once at import; the selectin eager-loads keep
+# per-row serialization of items/documents from becoming N+1 lazy SELECTs
+_LIST_BASE = select(Shipment).options(
+    selectinload(Shipment.items),
+    selectinload(Shipment.documents)
+)
+
 class ShipmentService:
+    # Mutations write through the request session but never commit: the
+    # session dependency sees the writes (flushed ORM state or ORM-enabled
+    # DML, both flagged in app.core.database) and commits once on clean
+    # request exit (rolling back on exception), so a multi-statement
+    # mutation pays a single WAL fsync.
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def list_query(
+        limit: int = 100,
+        status: Optional[str] = None,
+        purchase_order_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Select:
+        """Build the shipment list query without executing it.
+
+        Used by the streaming list path; mirrors get_shipments minus the
+        relationship eager-loads, which are incompatible with
+        row-at-a-time streaming.
+        """
+        query = select(Shipment)
+        if status:
+            query = query.where(Shipment.status == status)
+        if purchase_order_id:
+            query = query.where(Shipment.purchase_order_id == purchase_order_id)
+        if after_id is not None:
+            query = query.where(Shipment.id > after_id)
+        return query.order_by(Shipment.id).limit(limit)
+
     async def create_shipment(
         self,
         shipment_data: ShipmentCreate,
@@ -49,7 +83,7 @@ class ShipmentService:
                 )
                 self.db.add(document)
 
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(shipment)
         return shipment
 
@@ -73,21 +107,31 @@ class ShipmentService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
-        purchase_order_id: Optional[int] = None
+        purchase_order_id: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> List[Shipment]:
-        """Get a list of shipments with optional filtering."""
-        query = select(Shipment).options(
-            selectinload(Shipment.items),
-            selectinload(Shipment.documents)
-        )
-        
+        """Get a list of shipments with optional filtering.
+
+        Built as a lambda statement: each filter combination is constructed
+        and compiled once per process, and repeat calls only swap in new
+        bound-parameter values instead of re-running the Core expression
+        machinery.
+        """
+        stmt = lambda_stmt(lambda: _LIST_BASE)
+
         if status:
-            query = query.where(Shipment.status == status)
+            stmt += lambda s: s.where(Shipment.status == status)
         if purchase_order_id:
-            query = query.where(Shipment.purchase_order_id == purchase_order_id)
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.db.execute(query)
+            stmt += lambda s: s.where(Shipment.purchase_order_id == purchase_order_id)
+
+        if after_id is not None:
+            # Keyset pagination: O(limit) at any page depth, unlike OFFSET
+            # which makes the database scan and discard every skipped row
+            stmt += lambda s: s.where(Shipment.id > after_id)
+        else:
+            stmt += lambda s: s.offset(skip)
+        stmt += lambda s: s.order_by(Shipment.id).limit(limit)
+        result = await self.db.execute(stmt)
         return result.scalars().all()
 
     async def update_shipment(
@@ -96,12 +140,19 @@ class ShipmentService:
         shipment_data: ShipmentUpdate
     ) -> Optional[Shipment]:
         """Update a shipment."""
-        await self.db.execute(
+        values = shipment_data.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_shipment(shipment_id)
+        # RETURNING doubles as the existence check, so callers do not need
+        # a SELECT before calling this; a miss means the row is gone
+        result = await self.db.execute(
             update(Shipment)
             .where(Shipment.id == shipment_id)
-            .values(**shipment_data.model_dump(exclude_unset=True))
+            .values(**values)
+            .returning(Shipment.id)
         )
-        await self.db.commit()
+        if result.scalar_one_or_none() is None:
+            return None
         return await self.get_shipment(shipment_id)
 
     async def update_shipment_status(
@@ -136,7 +187,6 @@ class ShipmentService:
                 .values(status_history=status_history)
             )
 
-        await self.db.commit()
         return await self.get_shipment(shipment_id)
 
     async def add_shipment_document(
@@ -152,7 +202,7 @@ class ShipmentService:
             uploaded_by=uploaded_by
         )
         self.db.add(document)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(document)
         return document
 
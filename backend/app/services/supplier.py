@@ -1,6 +1,6 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import Select, lambda_stmt, select, text, update, delete
 from sqlalchemy.orm import selectinload
 
 from app.models.supplier import (
@@ -17,10 +17,50 @@ from app.schemas.supplier import (
     SupplierProductCreate
 )
 
+# Base list statement built once at import; the selectin eager-loads keep
+# per-row serialization of contacts/addresses from becoming N+1 lazy SELECTs
+_LIST_BASE = select(Supplier).options(
+    selectinload(Supplier.contacts),
+    selectinload(Supplier.addresses)
+)
+
+# Redis namespace for pre-aggregated performance rows. The refresh task
+# writes under this prefix after each materialized view refresh and the
+# performance endpoint reads from it before falling back to the view.
+SUPPLIER_PERF_CACHE_PREFIX = "supplier_perf:"
+SUPPLIER_PERF_CACHE_TTL = 600
+
 class SupplierService:
+    # Mutations write through the request session but never commit: the
+    # session dependency sees the writes (flushed ORM state or ORM-enabled
+    # DML, both flagged in app.core.database) and commits once on clean
+    # request exit (rolling back on exception), so a multi-statement
+    # mutation pays a single WAL fsync.
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def list_query(
+        limit: int = 100,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        after_id: Optional[int] = None,
+    ) -> Select:
+        """Build the supplier list query without executing it.
+
+        Used by the streaming list path; mirrors get_suppliers minus the
+        relationship eager-loads, which are incompatible with
+        row-at-a-time streaming.
+        """
+        query = select(Supplier)
+        if status:
+            query = query.where(Supplier.status == status)
+        if search:
+            query = query.where(Supplier.name.ilike(f"%{search}%"))
+        if after_id is not None:
+            query = query.where(Supplier.id > after_id)
+        return query.order_by(Supplier.id).limit(limit)
+
     async def create_supplier(
         self,
         supplier_data: SupplierCreate
@@ -48,7 +88,7 @@ class SupplierService:
             )
             self.db.add(address)
 
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(supplier)
         return supplier
 
@@ -73,21 +113,35 @@ class SupplierService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after_id: Optional[int] = None
     ) -> List[Supplier]:
-        """Get a list of suppliers with optional filtering."""
-        query = select(Supplier).options(
-            selectinload(Supplier.contacts),
-            selectinload(Supplier.addresses)
-        )
-        
+        """Get a list of suppliers with optional filtering.
+
+        Built as a lambda statement: each filter combination is constructed
+        and compiled once per process, and repeat calls only swap in new
+        bound-parameter values instead of re-running the Core expression
+        machinery.
+        """
+        stmt = lambda_stmt(lambda: _LIST_BASE)
+
         if status:
-            query = query.where(Supplier.status == status)
+            stmt += lambda s: s.where(Supplier.status == status)
         if search:
-            query = query.where(Supplier.name.ilike(f"%{search}%"))
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.db.execute(query)
+            # Computed outside the lambda: on cache hits the lambda body is
+            # not re-run, only closure values are rebound, so any transform
+            # has to happen before the closure captures it
+            pattern = f"%{search}%"
+            stmt += lambda s: s.where(Supplier.name.ilike(pattern))
+
+        if after_id is not None:
+            # Keyset pagination: O(limit) at any page depth, unlike OFFSET
+            # which makes the database scan and discard every skipped row
+            stmt += lambda s: s.where(Supplier.id > after_id)
+        else:
+            stmt += lambda s: s.offset(skip)
+        stmt += lambda s: s.order_by(Supplier.id).limit(limit)
+        result = await self.db.execute(stmt)
         return result.scalars().all()
 
     async def update_supplier(
@@ -96,12 +150,19 @@ class SupplierService:
         supplier_data: SupplierUpdate
     ) -> Optional[Supplier]:
         """Update a supplier."""
-        await self.db.execute(
+        values = supplier_data.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_supplier(supplier_id)
+        # RETURNING doubles as the existence check, so callers do not need
+        # a SELECT before calling this; a miss means the row is gone
+        result = await self.db.execute(
             update(Supplier)
             .where(Supplier.id == supplier_id)
-            .values(**supplier_data.model_dump(exclude_unset=True))
+            .values(**values)
+            .returning(Supplier.id)
         )
-        await self.db.commit()
+        if result.scalar_one_or_none() is None:
+            return None
         return await self.get_supplier(supplier_id)
 
     async def delete_supplier(self, supplier_id: int) -> bool:
@@ -109,7 +170,6 @@ class SupplierService:
         result = await self.db.execute(
             delete(Supplier).where(Supplier.id == supplier_id)
         )
-        await self.db.commit()
         return result.rowcount > 0
 
     async def add_supplier_contact(
@@ -123,7 +183,7 @@ class SupplierService:
             supplier_id=supplier_id
         )
         self.db.add(contact)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(contact)
         return contact
 
@@ -138,7 +198,7 @@ class SupplierService:
             supplier_id=supplier_id
         )
         self.db.add(address)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(address)
         return address
 
@@ -153,7 +213,7 @@ class SupplierService:
             supplier_id=supplier_id
         )
         self.db.add(product)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(product)
         return product
 
@@ -172,6 +232,23 @@ class SupplierService:
         )
         return result.scalars().all()
 
+    async def get_supplier_performance(self, supplier_id) -> Optional[dict]:
+        """Read a supplier's row from the pre-aggregated materialized view.
+
+        The heavy aggregation over purchase orders and shipments happens in
+        supplier_performance_mv, refreshed periodically by the Celery task
+        in app.tasks.reports; this is a single keyed fetch.
+        """
+        result = await self.db.execute(
+            text(
+                "SELECT * FROM supplier_performance_mv "
+                "WHERE supplier_id = :supplier_id"
+            ),
+            {"supplier_id": supplier_id},
+        )
+        row = result.mappings().first()
+        return dict(row) if row else None
+
     async def get_supplier_by_code(self, code: str) -> Optional[Supplier]:
         """Get a supplier by code."""
         result = await self.db.execute(
@@ -6,7 +6,7 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
-from app.core.password import get_password_hash, verify_password
+from app.core.password import aget_password_hash, averify_password
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -15,7 +15,14 @@ logger = get_logger(__name__)
 
 
 class UserService:
-    """Service class for user-related business logic."""
+    """Service class for user-related business logic.
+
+    Mutations write through the request session but never commit: the
+    session dependency sees the writes (flushed ORM state or ORM-enabled
+    DML, both flagged in app.core.database) and commits once on clean
+    request exit (rolling back on exception), so a multi-statement
+    mutation pays a single WAL fsync.
+    """
 
     def __init__(self, db: AsyncSession):
         """
@@ -26,28 +33,36 @@ class UserService:
         """
         self.db = db
 
-    async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[str] = None,
+    ) -> List[User]:
         """
         Get a list of users with pagination.
-        
+
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
-            
+            after_id: Keyset cursor; return users with id greater than this
+
         Returns:
             List of user objects
         """
-        logger.debug(f"Fetching users with skip={skip}, limit={limit}")
-        
-        result = await self.db.execute(
-            select(User)
-            .where(User.is_active == True)
-            .offset(skip)
-            .limit(limit)
-            .order_by(User.created_at.desc())
-        )
+        logger.debug(f"Fetching users with skip={skip}, limit={limit}, after_id={after_id}")
+
+        query = select(User).where(User.is_active == True)
+        if after_id is not None:
+            # Keyset pagination orders by the cursor column and stays
+            # O(limit) at any page depth, unlike OFFSET which makes the
+            # database scan and discard every skipped row
+            query = query.where(User.id > after_id).order_by(User.id)
+        else:
+            query = query.offset(skip).order_by(User.created_at.desc())
+        result = await self.db.execute(query.limit(limit))
         users = result.scalars().all()
-        
+
         logger.info(f"Retrieved {len(users)} users")
         return list(users)
 
@@ -115,8 +130,9 @@ class UserService:
         logger.info(f"Creating new user with email: {user_data.email}")
         
         try:
-            # Hash the password
-            hashed_password = get_password_hash(user_data.password)
+            # Hash the password off the event loop; argon2/bcrypt cost
+            # multiple milliseconds of pure CPU per call
+            hashed_password = await aget_password_hash(user_data.password)
             
             # Create user object
             db_user = User(
@@ -129,7 +145,7 @@ class UserService:
             
             # Add to database
             self.db.add(db_user)
-            await self.db.commit()
+            await self.db.flush()
             await self.db.refresh(db_user)
             
             logger.info(f"Successfully created user {db_user.id}")
@@ -155,14 +171,8 @@ class UserService:
             Exception: If user update fails
         """
         logger.info(f"Updating user {user_id}")
-        
+
         try:
-            # Get user
-            user = await self.get_user_by_id(user_id)
-            if not user:
-                logger.warning(f"User {user_id} not found for update")
-                return None
-            
             # Build update data
             update_data = {}
             if user_data.email is not None:
@@ -173,26 +183,28 @@ class UserService:
                 update_data['is_active'] = user_data.is_active
             if user_data.role is not None:
                 update_data['role'] = user_data.role
-            
+
             if not update_data:
                 logger.debug(f"No updates provided for user {user_id}")
-                return user
-            
-            # Update user
-            await self.db.execute(
+                return await self.get_user_by_id(user_id)
+
+            # Single UPDATE ... RETURNING round-trip; the returned row
+            # doubles as the existence check, so no SELECT before or
+            # refresh after the write
+            result = await self.db.execute(
                 update(User)
                 .where(User.id == user_id)
                 .values(**update_data)
+                .returning(User)
             )
-            
-            await self.db.commit()
-            
-            # Refresh and return updated user
-            await self.db.refresh(user)
-            
+            user = result.scalars().first()
+            if user is None:
+                logger.warning(f"User {user_id} not found for update")
+                return None
+
             logger.info(f"Successfully updated user {user_id}")
             return user
-            
+
         except Exception as e:
             logger.error(f"Failed to update user {user_id}: {e}")
             await self.db.rollback()
@@ -226,9 +238,7 @@ class UserService:
                 .where(User.id == user_id)
                 .values(is_active=False)
             )
-            
-            await self.db.commit()
-            
+
             logger.info(f"Successfully soft deleted user {user_id}")
             return True
             
@@ -259,7 +269,7 @@ class UserService:
             logger.debug(f"User {user.id} is inactive")
             return None
         
-        if not verify_password(password, user.hashed_password):
+        if not await averify_password(password, user.hashed_password):
             logger.debug(f"Invalid password for user {user.id}")
             return None
         
@@ -290,13 +300,13 @@ class UserService:
                 logger.warning(f"User {user_id} not found for password update")
                 return False
             
-            # Verify current password
-            if not verify_password(current_password, user.hashed_password):
+            # Verify current password off the event loop
+            if not await averify_password(current_password, user.hashed_password):
                 logger.warning(f"Invalid current password for user {user_id}")
                 return False
-            
-            # Hash new password
-            new_hashed_password = get_password_hash(new_password)
+
+            # Hash new password off the event loop
+            new_hashed_password = await aget_password_hash(new_password)
             
             # Update password
             await self.db.execute(
@@ -304,9 +314,7 @@ class UserService:
                 .where(User.id == user_id)
                 .values(hashed_password=new_hashed_password)
             )
-            
-            await self.db.commit()
-            
+
             logger.info(f"Successfully updated password for user {user_id}")
             return True
             
@@ -1,6 +1,11 @@
 """Report generation background tasks."""
 
+import asyncio
+
+import orjson
 from celery import shared_task
+from sqlalchemy import text
+
 from app.core.logging import get_logger
 from datetime import datetime
 
@@ -21,3 +26,63 @@ def generate_inventory_report(warehouse_id: str = None) -> bool:
     logger.info(f"Generating inventory report for warehouse: {warehouse_id or 'all'}")
     # TODO: Implement report generation logic
     return True
+
+
+async def _refresh_supplier_performance() -> int:
+    """Refresh the materialized view and warm Redis with its rows."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.core.cache import cache_set
+    from app.core.config import settings
+    from app.services.supplier import (
+        SUPPLIER_PERF_CACHE_PREFIX,
+        SUPPLIER_PERF_CACHE_TTL,
+    )
+
+    # Task-local engine: each beat invocation runs under a fresh event loop
+    # (asyncio.run), and pooled asyncpg connections stay bound to the loop
+    # that created them - the process-wide engine would hand back
+    # connections from the previous, closed loop on the second run in the
+    # same worker. NullPool opens one connection for this task and the
+    # dispose in the finally closes it before the loop is torn down.
+    engine = create_async_engine(
+        settings.get_database_url(), future=True, poolclass=NullPool
+    )
+    try:
+        # CONCURRENTLY keeps the view readable during the refresh, but
+        # Postgres forbids it inside a transaction block, so it runs on an
+        # autocommit connection (the same reason the index migrations use
+        # an autocommit_block). The follow-up read is an ordinary
+        # transaction on a fresh connection.
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(
+                "REFRESH MATERIALIZED VIEW CONCURRENTLY supplier_performance_mv"
+            ))
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT * FROM supplier_performance_mv"))
+            rows = result.mappings().all()
+
+        for row in rows:
+            await cache_set(
+                f"{SUPPLIER_PERF_CACHE_PREFIX}{row['supplier_id']}",
+                orjson.dumps(dict(row), default=str),
+                SUPPLIER_PERF_CACHE_TTL,
+            )
+        return len(rows)
+    finally:
+        await engine.dispose()
+
+
+@shared_task
+def refresh_supplier_performance() -> bool:
+    """Refresh supplier_performance_mv and push the rows into Redis.
+
+    Runs on the beat schedule so GET /suppliers/{id}/performance is a
+    keyed Redis fetch (with the view as fallback) instead of a multi-join
+    aggregation per request.
+    """
+    count = asyncio.run(_refresh_supplier_performance())
+    logger.info("Refreshed supplier performance for %s suppliers", count)
+    return True